@@ -1,5 +1,6 @@
 from bcn_rainfall_core.rainfall import Rainfall
+from bcn_rainfall_core.rainfall_collection import RainfallCollection
 
 __version__ = "1.0.7"
 
-__all__ = ["Rainfall"]
+__all__ = ["Rainfall", "RainfallCollection"]
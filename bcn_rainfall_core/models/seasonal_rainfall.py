@@ -2,11 +2,23 @@
 Provides a rich class to manipulate Seasonal rainfall data.
 """
 
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
 import pandas as pd
-import plotly.graph_objs as go
 
 from bcn_rainfall_core.models.yearly_rainfall import YearlyRainfall
-from bcn_rainfall_core.utils import Season
+from bcn_rainfall_core.utils import (
+    FigureFormat,
+    KMeansEngine,
+    LRUCache,
+    RainfallStore,
+    Season,
+)
+from bcn_rainfall_core.utils import rolling_statistics as rolling_stats
+
+if TYPE_CHECKING:
+    from bcn_rainfall_core.utils.plotly_figures import FigureOutput
 
 
 class SeasonalRainfall(YearlyRainfall):
@@ -16,30 +28,29 @@ class SeasonalRainfall(YearlyRainfall):
 
     def __init__(
         self,
-        raw_data: pd.DataFrame,
+        raw_data: pd.DataFrame | RainfallStore,
         season: Season,
         *,
         start_year: int,
         round_precision: int,
+        result_cache: LRUCache | None = None,
     ):
         self.season = season
         super().__init__(
-            raw_data, start_year=start_year, round_precision=round_precision
+            raw_data,
+            start_year=start_year,
+            round_precision=round_precision,
+            result_cache=result_cache,
         )
 
-    def load_yearly_rainfall(self) -> pd.DataFrame:
+    def get_series_index(self) -> int:
         """
-        Load Yearly Rainfall for instance season variable into pandas DataFrame.
+        Retrieve index of rainfall series for instance season variable within store.
 
-        :return: A pandas DataFrame displaying rainfall data (in mm)
-        for instance season according to year.
+        :return: Row index of series within store series matrix.
         """
-        months = self.season.get_months()
 
-        return self.load_rainfall(
-            months[0],
-            months[-1],
-        )
+        return self.store.get_series_index(season=self.season)
 
     def get_bar_figure_of_rainfall_according_to_year(
         self,
@@ -51,7 +62,10 @@ class SeasonalRainfall(YearlyRainfall):
         plot_average=False,
         plot_linear_regression=False,
         kmeans_cluster_count: int | None = None,
-    ) -> go.Figure | None:
+        kmeans_engine=KMeansEngine.SKLEARN,
+        figure_format=FigureFormat.FIGURE,
+        binary_arrays=False,
+    ) -> "FigureOutput | None":
         """
         Overrides parent method by customizing figure and trace labels.
         """
@@ -64,4 +78,32 @@ class SeasonalRainfall(YearlyRainfall):
             plot_average=plot_average,
             plot_linear_regression=plot_linear_regression,
             kmeans_cluster_count=kmeans_cluster_count,
+            kmeans_engine=kmeans_engine,
+            figure_format=figure_format,
+            binary_arrays=binary_arrays,
+        )
+
+    def get_figure_of_rolling_statistics(
+        self,
+        begin_year: int,
+        end_year: int,
+        *,
+        window=rolling_stats.DEFAULT_WINDOW,
+        statistics: Sequence[str] = (rolling_stats.AVERAGE,),
+        figure_label: str | None = None,
+        figure_format=FigureFormat.FIGURE,
+        binary_arrays=False,
+    ) -> "FigureOutput | None":
+        """
+        Overrides parent method by customizing figure label.
+        """
+        return super().get_figure_of_rolling_statistics(
+            begin_year,
+            end_year,
+            window=window,
+            statistics=statistics,
+            figure_label=figure_label
+            or f"{window} years rolling statistics for {self.season.value} between {begin_year} and {end_year}",
+            figure_format=figure_format,
+            binary_arrays=binary_arrays,
         )
@@ -2,43 +2,110 @@
 Provides a rich class to manipulate Yearly rainfall data.
 """
 
-import operator as opr
+from collections.abc import Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
-import plotly.graph_objs as go
 from pydantic import PositiveFloat
-from sklearn.cluster import KMeans
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import r2_score
 
-import bcn_rainfall_core.utils.dataframe_operations as df_ops
 import bcn_rainfall_core.utils.plotly_figures as plotly_fig
-import bcn_rainfall_core.utils.rainfall_metrics as rain
-from bcn_rainfall_core.utils import DataFormatError, Label, Month
+from bcn_rainfall_core.utils import (
+    BootstrapStatistic,
+    CacheStats,
+    ConfidenceInterval,
+    FigureFormat,
+    KMeansEngine,
+    Label,
+    LRUCache,
+    Month,
+    RainfallStore,
+    VersionedCache,
+    bootstrap,
+    kmeans,
+)
+from bcn_rainfall_core.utils import rolling_statistics as rolling_stats
+from bcn_rainfall_core.utils.caching import DEFAULT_RESULT_CACHE_CAPACITY
+from bcn_rainfall_core.utils.linear_regression import fit_linear_regressions
+
+if TYPE_CHECKING:
+    from bcn_rainfall_core.utils.plotly_figures import FigureOutput
 
 
 class YearlyRainfall:
     """
     Provides numerous functions to load, manipulate and export Yearly rainfall data.
+    Rainfall data is a view over a RainfallStore that can be shared with other instances.
+    Clustering and regression results are memoized in an LRUCache, that can be shared as well.
     """
 
     def __init__(
         self,
-        raw_data: pd.DataFrame,
+        raw_data: pd.DataFrame | RainfallStore,
         *,
         start_year: int,
         round_precision: int,
+        result_cache: LRUCache | None = None,
     ):
-        self.raw_data = raw_data
-        self.starting_year = start_year
-        self.round_precision = round_precision
-        self.data = self.load_yearly_rainfall()
+        if isinstance(raw_data, RainfallStore):
+            self.store = raw_data
+        else:
+            self.store = RainfallStore.from_dataframe(
+                raw_data, start_year=start_year, round_precision=round_precision
+            )
+
+        self.starting_year = self.store.starting_year
+        self.round_precision = self.store.round_precision
+        self.series_index = self.get_series_index()
+        self._normal_cache: VersionedCache[tuple[int, int], float] = VersionedCache()
+        self.result_cache: LRUCache = (
+            LRUCache(DEFAULT_RESULT_CACHE_CAPACITY)
+            if result_cache is None
+            else result_cache
+        )
 
     def __str__(self):
         return self.data.to_string()
 
+    @property
+    def raw_data(self) -> pd.DataFrame:
+        """
+        Raw data shaped as rainfall values for each month according to year.
+        """
+        return self.store.raw_data
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """
+        A pandas DataFrame displaying rainfall data (in mm) according to year.
+        It is built on demand from the store.
+        """
+        return self.load_yearly_rainfall()
+
+    @property
+    def years(self) -> np.ndarray:
+        """
+        Years of rainfall data as a NumPy array view.
+        """
+        return self.store.years
+
+    @property
+    def rainfall(self) -> np.ndarray:
+        """
+        Rainfall values (in mm) according to year as a NumPy array view.
+        """
+        return self.store.series[self.series_index]
+
+    def get_series_index(self) -> int:
+        """
+        Retrieve index of instance rainfall series within store.
+
+        :return: Row index of series within store series matrix.
+        """
+
+        return self.store.get_series_index()
+
     def load_yearly_rainfall(self) -> pd.DataFrame:
         """
         Load Yearly Rainfall into pandas DataFrame.
@@ -46,13 +113,13 @@ class YearlyRainfall:
         :return: A pandas DataFrame displaying rainfall data (in mm) according to year.
         """
 
-        return self.load_rainfall(Month.JANUARY, Month.DECEMBER)
+        return self._to_dataframe(slice(None), self.rainfall)
 
     def load_rainfall(
         self, start_month: Month, end_month: Month | None = None
     ) -> pd.DataFrame:
         """
-        Generic function to load Yearly rainfall data from raw data stored in pandas DataFrame.
+        Generic function to load Yearly rainfall data from raw data stored in store.
         Raw data has to be shaped as rainfall values for each month according to year.
 
         :param start_month: A Month Enum representing the month
@@ -61,22 +128,10 @@ class YearlyRainfall:
         to end getting our rainfall values (optional).
         If not given, we load rainfall data only for given start_month.
         :return: A pandas DataFrame displaying rainfall data (in mm) according to year.
-        :raise DataFormatError: If raw_data attribute of instance doesn't have exactly 13 columns.
-        1 for the year; 12 for every monthly rainfall.
-        """
-        if not isinstance(self.raw_data, pd.DataFrame) or len(
-            self.raw_data.columns
-        ) != 1 + len(Month):
-            raise DataFormatError(
-                "[Year, Jan_rain, Feb_rain, ..., Dec_rain] (pandas DataFrame)"
-            )
+        """
 
-        return df_ops.retrieve_rainfall_data_with_constraints(
-            self.raw_data,
-            starting_year=self.starting_year,
-            round_precision=self.round_precision,
-            start_month=start_month.get_rank(),
-            end_month=end_month.get_rank() if end_month else None,
+        return self._to_dataframe(
+            slice(None), self.store.compute_rainfall(start_month, end_month)
         )
 
     def get_yearly_rainfall(self, begin_year: int, end_year: int) -> pd.DataFrame:
@@ -91,9 +146,9 @@ class YearlyRainfall:
         for instance month according to year.
         """
 
-        return df_ops.get_rainfall_within_year_interval(
-            self.data, begin_year=begin_year, end_year=end_year
-        )
+        year_slice = self.store.get_year_slice(begin_year, end_year)
+
+        return self._to_dataframe(year_slice, self.rainfall[year_slice])
 
     def export_as_csv(
         self,
@@ -129,9 +184,13 @@ class YearlyRainfall:
         :return: A float representing the average Rainfall.
         """
 
-        return rain.get_average_rainfall(
-            self.get_yearly_rainfall(begin_year, end_year),
-            round_precision=self.round_precision,
+        return float(
+            self.store.get_average(
+                self.series_index,
+                begin_year,
+                end_year,
+                round_precision=self.round_precision,
+            )
         )
 
     def get_normal(self, begin_year: int) -> float:
@@ -143,9 +202,17 @@ class YearlyRainfall:
         :return: A float storing the normal.
         """
 
-        return rain.get_normal(
-            self.data, begin_year, round_precision=self.round_precision
-        )
+        return self._get_normal(begin_year, round_precision=self.round_precision)
+
+    def get_normal_cache_stats(self) -> CacheStats:
+        """
+        Retrieves counters of the cache of normals.
+        Normals are cached by normal year and precision until rainfall data is updated.
+
+        :return: A CacheStats instance with hit and miss counts and count of cached normals.
+        """
+
+        return self._normal_cache.get_stats()
 
     def get_years_below_percentage_of_normal(
         self,
@@ -171,10 +238,12 @@ class YearlyRainfall:
         :return: The count of years that are below the percentage of the rainfall normal.
         """
 
-        return rain.get_years_compared_to_given_rainfall_value(
-            self.get_yearly_rainfall(begin_year, end_year),
-            rain.get_normal(self.data, normal_year) * percentage / 100,
-            comparator=opr.lt,
+        normal = self._get_normal(normal_year, round_precision=1)
+
+        return int(
+            np.count_nonzero(
+                self._get_rainfall(begin_year, end_year) < normal * percentage / 100
+            )
         )
 
     def get_years_between_two_percentages_of_normal(
@@ -201,16 +270,52 @@ class YearlyRainfall:
         :return: The count of years whose rainfall is in-between both given percentages of rainfall normal.
         """
 
-        sorted_percentages = sorted(percentages)
-
-        years_above_first_percentage = self.get_years_above_percentage_of_normal(
-            normal_year, begin_year, end_year, percentage=sorted_percentages[0]
+        (years_between_percentages,), _ = self.classify_years_by_percentages_of_normal(
+            normal_year, begin_year, end_year, percentages=percentages
         )
-        years_above_second_percentage = self.get_years_above_percentage_of_normal(
-            normal_year, begin_year, end_year, percentage=sorted_percentages[1]
+
+        return years_between_percentages
+
+    def classify_years_by_percentages_of_normal(
+        self,
+        normal_year: int,
+        begin_year: int,
+        end_year: int,
+        *,
+        percentages: Sequence[PositiveFloat],
+    ) -> tuple[list[int], list[int]]:
+        """
+        Classifies years within a specific year range into bins bounded by consecutive percentages
+        of a rainfall normal computed from a given normal year, in a single pass over the range.
+        A year whose rainfall is above a percentage and below or equal to the next one falls in their bin,
+        like with get_years_between_two_percentages_of_normal.
+
+        :param normal_year: An integer representing the year
+        to start computing the 30 years normal of the rainfall.
+        :param begin_year: An integer representing the year
+        to start getting our rainfall values.
+        :param end_year: An integer representing the year
+        to end getting our rainfall values.
+        :param percentages: Rainfall normal percentages bounding bins, at least two of them.
+        They are always sorted by the function.
+
+        :return: A tuple (counts, bins) where counts is the count of years of each bin
+        and bins is the bin index of each year within the range; -1 for a year outside every bin.
+        """
+
+        normal = self._get_normal(normal_year, round_precision=1)
+        thresholds = normal * np.sort(np.asarray(percentages, dtype=np.float64)) / 100
+
+        # Index i means thresholds[i - 1] < rainfall <= thresholds[i]: year falls in bin i - 1.
+        indexes = np.searchsorted(
+            thresholds, self._get_rainfall(begin_year, end_year), side="left"
         )
+        bin_count = len(thresholds) - 1
+
+        counts = np.bincount(indexes, minlength=bin_count + 2)[1 : bin_count + 1]
+        bins = np.where((indexes > 0) & (indexes <= bin_count), indexes - 1, -1)
 
-        return years_above_first_percentage - years_above_second_percentage
+        return counts.tolist(), bins.tolist()
 
     def get_years_below_normal(
         self, normal_year: int, begin_year: int, end_year: int
@@ -255,10 +360,12 @@ class YearlyRainfall:
         :return: The count of years that are above the percentage of the rainfall normal.
         """
 
-        return rain.get_years_compared_to_given_rainfall_value(
-            self.get_yearly_rainfall(begin_year, end_year),
-            rain.get_normal(self.data, normal_year) * percentage / 100,
-            comparator=opr.gt,
+        normal = self._get_normal(normal_year, round_precision=1)
+
+        return int(
+            np.count_nonzero(
+                self._get_rainfall(begin_year, end_year) > normal * percentage / 100
+            )
         )
 
     def get_years_above_normal(
@@ -282,12 +389,12 @@ class YearlyRainfall:
 
     def get_last_year(self) -> int:
         """
-        Retrieves the last element of the 'Year' column from the pandas DataFrame.
+        Retrieves the last year of rainfall data.
 
-        :return: The ultimate year of DataFrame.
+        :return: The ultimate year of data.
         """
 
-        return int(self.data[Label.YEAR].iloc[-1])
+        return int(self.years[-1])
 
     def get_relative_distance_to_normal(
         self, normal_year: int, begin_year: int, end_year: int
@@ -336,11 +443,13 @@ class YearlyRainfall:
         Nothing if the specified column does not exist.
         """
 
-        data = self.get_yearly_rainfall(begin_year, end_year)[Label.RAINFALL]
-
-        standard_deviation = data.std()
+        standard_deviation = np.sqrt(
+            self.store.get_variance(self.series_index, begin_year, end_year)
+        )
         if weigh_by_average:
-            standard_deviation /= data.mean()
+            standard_deviation /= self.store.get_average(
+                self.series_index, begin_year, end_year
+            )
 
         return round(
             standard_deviation,
@@ -360,25 +469,78 @@ class YearlyRainfall:
         :return: A tuple containing a tuple of floats (r2 score, slope)
         and a list of rainfall values computed by the linear regression.
         """
-        data = self.get_yearly_rainfall(begin_year, end_year)
+        scores, predicted_rainfall = self.result_cache.get(
+            ("linear_regression", self.series_index, begin_year, end_year),
+            lambda: self._compute_linear_regression(begin_year, end_year),
+            version=self.store.version,
+        )
 
-        years = data[Label.YEAR.value].values.reshape(-1, 1)  # type: ignore
-        rainfalls = data[Label.RAINFALL.value].values
+        return scores, list(predicted_rainfall)
 
-        lin_reg = LinearRegression()
-        lin_reg.fit(years, rainfalls)
-        predicted_rainfalls: list[float] = [
-            round(rainfall_value, self.round_precision)
-            for rainfall_value in lin_reg.predict(years).tolist()
-        ]
+    def get_confidence_interval(
+        self,
+        statistic: BootstrapStatistic,
+        begin_year: int,
+        end_year: int | None = None,
+        *,
+        resample_count=bootstrap.DEFAULT_RESAMPLE_COUNT,
+        confidence_level=bootstrap.DEFAULT_CONFIDENCE_LEVEL,
+        seed=0,
+        time_budget: float | None = None,
+        max_workers: int | None = None,
+    ) -> ConfidenceInterval:
+        """
+        Estimate confidence interval of rainfall average, normal or linear regression slope by bootstrap,
+        resampling years with replacement.
 
-        return (
-            r2_score(rainfalls, predicted_rainfalls),
-            round(lin_reg.coef_[0], self.round_precision),
-        ), predicted_rainfalls
+        :param statistic: A BootstrapStatistic Enum: ['average', 'normal', 'linear_regression_slope'].
+        :param begin_year: An integer representing the year
+        to start getting our rainfall values; for normal, the year to start computing it from.
+        :param end_year: An integer representing the year
+        to end getting our rainfall values (optional). Defaults to last year; ignored for normal.
+        :param resample_count: Count of resamples. Defaults to 10 000.
+        :param confidence_level: Probability for statistic to be within interval. Defaults to 0.95.
+        :param seed: Seed of random generator, so that intervals are reproducible. Defaults to 0.
+        :param time_budget: Maximal duration in seconds (optional).
+        Fewer resamples are computed if it is spent; all of them are computed if not set.
+        :param max_workers: Count of processes to compute resamples with (optional).
+        Resamples are computed in current process if not set.
+        :return: A ConfidenceInterval instance holding point estimate, bounds and count of computed resamples.
+        :raise ValueError: If resample count is not positive or confidence level is not between 0 and 1.
+        """
+        if statistic == BootstrapStatistic.NORMAL:
+            end_year = begin_year + 29
+            estimate = self.get_normal(begin_year)
+        elif end_year is None:
+            end_year = self.get_last_year()
+
+        if statistic == BootstrapStatistic.AVERAGE:
+            estimate = self.get_average_yearly_rainfall(begin_year, end_year)
+        elif statistic == BootstrapStatistic.LINEAR_REGRESSION_SLOPE:
+            (_, estimate), _ = self.get_linear_regression(begin_year, end_year)
+
+        year_slice = self.store.get_year_slice(begin_year, end_year)
+
+        return bootstrap.compute_confidence_interval(
+            self.years[year_slice],
+            self.rainfall[year_slice],
+            statistic,
+            estimate=estimate,
+            round_precision=self.round_precision,
+            resample_count=resample_count,
+            confidence_level=confidence_level,
+            seed=seed,
+            time_budget=time_budget,
+            max_workers=max_workers,
+        )
 
     def get_kmeans(
-        self, begin_year: int, end_year: int, *, kmeans_cluster_count=4
+        self,
+        begin_year: int,
+        end_year: int,
+        *,
+        kmeans_cluster_count=4,
+        kmeans_engine=KMeansEngine.SKLEARN,
     ) -> tuple[int, list[int]]:
         """
         Compute and return K-Mean clustering of rainfall according to year for a given time interval.
@@ -388,21 +550,88 @@ class YearlyRainfall:
         :param end_year: An integer representing the year
         to end getting our rainfall values.
         :param kmeans_cluster_count: The number of clusters to compute. Defaults to 4.
+        :param kmeans_engine: A KMeansEngine Enum: ['sklearn', 'optimal_1d'].
+        'sklearn' clusters (year, rainfall) points with scikit-learn KMeans, seeded to be reproducible.
+        'optimal_1d' clusters rainfall alone with an exact dynamic programming k-means,
+        whose clusters are labelled by increasing rainfall. Defaults to 'sklearn'.
         :return: A tuple (kmeans_clusters, clustered_data) where:
           - kmeans_clusters is the number of computed clusters as an integer
           - clustered_data is the list of clusters designed by labels between 0 and kmeans_clusters - 1.
         """
-        fit_data: np.ndarray = self.get_yearly_rainfall(begin_year, end_year)[
-            [Label.YEAR.value, Label.RAINFALL.value]
-        ].values
+        cluster_count, clustered_data = self.result_cache.get(
+            (
+                "kmeans",
+                self.series_index,
+                begin_year,
+                end_year,
+                kmeans_cluster_count,
+                kmeans_engine,
+            ),
+            lambda: self._compute_kmeans(
+                begin_year,
+                end_year,
+                kmeans_cluster_count=kmeans_cluster_count,
+                kmeans_engine=kmeans_engine,
+            ),
+            version=self.store.version,
+        )
+
+        return cluster_count, list(clustered_data)
+
+    def get_result_cache_stats(self) -> CacheStats:
+        """
+        Retrieve counters of cache memoizing clustering and regression results.
 
-        kmeans = KMeans(n_init=10, n_clusters=kmeans_cluster_count)
-        kmeans.fit(fit_data)
-        clustered_data = [
-            int(cluster_label) for cluster_label in kmeans.predict(fit_data)
-        ]
+        :return: A CacheStats instance.
+        """
 
-        return kmeans.n_clusters, clustered_data
+        return self.result_cache.get_stats()
+
+    def _compute_kmeans(
+        self,
+        begin_year: int,
+        end_year: int,
+        *,
+        kmeans_cluster_count: int,
+        kmeans_engine: KMeansEngine,
+    ) -> tuple[int, tuple[int, ...]]:
+        year_slice = self.store.get_year_slice(begin_year, end_year)
+        if kmeans_engine == KMeansEngine.OPTIMAL_1D:
+            cluster_labels = kmeans.compute_optimal_kmeans_1d(
+                self.rainfall[year_slice], kmeans_cluster_count
+            )
+
+            return min(kmeans_cluster_count, len(cluster_labels)), tuple(
+                cluster_labels.tolist()
+            )
+
+        from sklearn.cluster import KMeans
+
+        fit_data = np.column_stack(
+            (self.years[year_slice], self.rainfall[year_slice])
+        ).astype(np.float64)
+
+        sklearn_kmeans = KMeans(
+            n_init=10, n_clusters=kmeans_cluster_count, random_state=0
+        )
+        sklearn_kmeans.fit(fit_data)
+        clustered_data = tuple(
+            int(cluster_label) for cluster_label in sklearn_kmeans.predict(fit_data)
+        )
+
+        return sklearn_kmeans.n_clusters, clustered_data
+
+    def _compute_linear_regression(
+        self, begin_year: int, end_year: int
+    ) -> tuple[tuple[float, float], tuple[float, ...]]:
+        r2_scores, slopes, _, predicted_rainfall = fit_linear_regressions(
+            self.store, self.series_index, begin_year, end_year
+        )
+
+        return (
+            float(r2_scores[0]),
+            float(np.round(slopes[0], self.round_precision)),
+        ), tuple(predicted_rainfall[0].tolist())
 
     def get_bar_figure_of_rainfall_according_to_year(
         self,
@@ -414,7 +643,10 @@ class YearlyRainfall:
         plot_average=False,
         plot_linear_regression=False,
         kmeans_cluster_count: int | None = None,
-    ) -> go.Figure | None:
+        kmeans_engine=KMeansEngine.SKLEARN,
+        figure_format=FigureFormat.FIGURE,
+        binary_arrays=False,
+    ) -> "FigureOutput | None":
         """
         Return a bar figure of rainfall data according to year.
 
@@ -432,91 +664,178 @@ class YearlyRainfall:
         Defaults to False.
         :param kmeans_cluster_count: If set, computes K-Mean clustering and displays clusters by color.
         Defaults to None.
+        :param kmeans_engine: A KMeansEngine Enum: ['sklearn', 'optimal_1d'], used if kmeans_cluster_count is set.
+        Defaults to 'sklearn'.
 
-        :return: A plotly Figure object if data has been successfully plotted, None otherwise.
+        :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+        :param binary_arrays: Whether to encode trace values as base64 typed arrays, with floats at rainfall precision,
+        or not. Defaults to False.
+        :return: A figure in requested format if data has been successfully plotted, None otherwise.
         """
-        yearly_rainfall = self.get_yearly_rainfall(begin_year, end_year)
+        year_slice = self.store.get_year_slice(begin_year, end_year)
+        years = self.years[year_slice]
+        rainfall = self.rainfall[year_slice]
 
+        traces: list[dict] = []
         if kmeans_cluster_count is not None:
-            figure = go.Figure()
-
             kmeans_cluster_count, clustered_data = self.get_kmeans(
-                begin_year, end_year, kmeans_cluster_count=kmeans_cluster_count
+                begin_year,
+                end_year,
+                kmeans_cluster_count=kmeans_cluster_count,
+                kmeans_engine=kmeans_engine,
             )
+            cluster_labels = np.asarray(clustered_data)
 
-            yearly_rainfall_labeled_by_cluster = list(
-                zip(
-                    yearly_rainfall[Label.YEAR.value],
-                    yearly_rainfall[Label.RAINFALL.value],
-                    clustered_data,
+            for cluster_label in range(kmeans_cluster_count):
+                is_in_cluster = cluster_labels == cluster_label
+                traces.append(
+                    {
+                        "type": "bar",
+                        "x": years[is_in_cluster],
+                        "y": rainfall[is_in_cluster],
+                        "name": f"Cluster {cluster_label + 1}",
+                    }
                 )
+        else:
+            traces.append(
+                {
+                    "type": "bar",
+                    "x": years,
+                    "y": rainfall,
+                    "name": trace_label or Label.RAINFALL.value,
+                }
             )
 
-            for cluster_label in range(kmeans_cluster_count):
-                year_list, rainfall_list = zip(
-                    *[
-                        (year, rainfall)
-                        for year, rainfall, cluster_label_ in yearly_rainfall_labeled_by_cluster
-                        if cluster_label_ == cluster_label
-                    ]
-                )
+        if plot_average:
+            average_rainfall = self.get_average_yearly_rainfall(begin_year, end_year)
 
-                figure.add_trace(
-                    go.Bar(
-                        x=year_list,
-                        y=rainfall_list,
-                        name=f"Cluster {cluster_label + 1}",
-                    )
-                )
+            traces.append(
+                {
+                    "type": "scatter",
+                    "x": years,
+                    "y": np.full(len(years), average_rainfall),
+                    "name": "Average rainfall",
+                }
+            )
 
-                plotly_fig.update_plotly_figure_layout(
-                    figure,
-                    title=figure_label
-                    or f"Rainfall (mm) between {begin_year} and {end_year}",
-                    xaxis_title=Label.YEAR.value,
-                    yaxis_title=Label.RAINFALL.value,
-                    display_xaxis_range_slider=True,
-                )
-        else:
-            figure = plotly_fig.get_figure_of_column_according_to_year(
-                yearly_rainfall,
-                label=Label.RAINFALL,
-                figure_type="bar",
-                figure_label=figure_label
-                or f"Rainfall (mm) between {begin_year} and {end_year}",
-                trace_label=trace_label,
+        if plot_linear_regression:
+            (
+                (r2, slope),
+                linear_regression_values,
+            ) = self.get_linear_regression(begin_year, end_year)
+
+            traces.append(
+                {
+                    "type": "scatter",
+                    "x": years,
+                    "y": np.asarray(linear_regression_values),
+                    "name": "Linear regression"
+                    f"<br><i>R2 score:</i> <b>{round(r2, 2)}</b>"
+                    f"<br><i>slope:</i> {slope} mm/year",
+                }
             )
 
-        if figure:
-            if plot_average:
-                average_rainfall = self.get_average_yearly_rainfall(
-                    begin_year, end_year
-                )
+        return plotly_fig.build_figure(
+            traces,
+            title=figure_label or f"Rainfall (mm) between {begin_year} and {end_year}",
+            xaxis_title=Label.YEAR.value,
+            yaxis_title=f"{Label.RAINFALL.value} (mm)",
+            display_xaxis_range_slider=kmeans_cluster_count is not None,
+            figure_format=figure_format,
+            binary_precision=self.round_precision if binary_arrays else None,
+        )
 
-                figure.add_trace(
-                    go.Scatter(
-                        x=yearly_rainfall[Label.YEAR.value],
-                        y=[average_rainfall] * len(yearly_rainfall),
-                        name="Average rainfall",
-                    )
-                )
+    def get_rolling_statistics(
+        self, begin_year: int, end_year: int, *, window=rolling_stats.DEFAULT_WINDOW
+    ) -> pd.DataFrame:
+        """
+        Computes average, variance, standard deviation and linear regression slope of rainfall
+        over every window of consecutive years within a year range, e.g. every 30 years normal.
+        Each window costs a few lookups in cumulative sums whatever its size.
+
+        :param begin_year: An integer representing the year
+        to start getting our rainfall values.
+        :param end_year: An integer representing the year
+        to end getting our rainfall values.
+        :param window: Count of years of each window. Defaults to 30.
+        :return: A pandas DataFrame with the first year of each window and one column per statistic.
+        :raise ValueError: If window is not a positive integer.
+        """
+        window_years, statistics = rolling_stats.compute_rolling_statistics(
+            self.store,
+            [self.series_index],
+            window=window,
+            begin_year=begin_year,
+            end_year=end_year,
+        )
+
+        return pd.DataFrame(
+            {
+                Label.YEAR.value: window_years,
+                **{name: values[0] for name, values in statistics.items()},
+            }
+        )
 
-            if plot_linear_regression:
-                (
-                    (r2, slope),
-                    linear_regression_values,
-                ) = self.get_linear_regression(begin_year, end_year)
-
-                figure.add_trace(
-                    go.Scatter(
-                        x=yearly_rainfall[Label.YEAR.value],
-                        y=linear_regression_values,
-                        name="Linear regression"
-                        f"<br><i>R2 score:</i> <b>{round(r2, 2)}</b>"
-                        f"<br><i>slope:</i> {slope} mm/year",
-                    )
+    def get_figure_of_rolling_statistics(
+        self,
+        begin_year: int,
+        end_year: int,
+        *,
+        window=rolling_stats.DEFAULT_WINDOW,
+        statistics: Sequence[str] = (rolling_stats.AVERAGE,),
+        figure_label: str | None = None,
+        figure_format=FigureFormat.FIGURE,
+        binary_arrays=False,
+    ) -> "FigureOutput | None":
+        """
+        Return a figure of rolling statistics of rainfall according to the first year of each window.
+
+        :param begin_year: An integer representing the year
+        to start getting our rainfall values.
+        :param end_year: An integer representing the year
+        to end getting our rainfall values.
+        :param window: Count of years of each window. Defaults to 30.
+        :param statistics: Names of statistics to plot, among
+        ['average', 'variance', 'standard_deviation', 'linear_regression_slope']. Defaults to average only.
+        :param figure_label: A string to label graphic data (optional).
+        :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+        :param binary_arrays: Whether to encode trace values as base64 typed arrays, with floats at rainfall precision,
+        or not. Defaults to False.
+        :return: A figure in requested format if data has been successfully plotted, None otherwise.
+        """
+
+        return plotly_fig.get_figure_of_rolling_statistics(
+            self.get_rolling_statistics(begin_year, end_year, window=window),
+            window=window,
+            statistics=statistics,
+            figure_label=figure_label
+            or f"{window} years rolling statistics between {begin_year} and {end_year}",
+            figure_format=figure_format,
+            binary_precision=self.round_precision if binary_arrays else None,
+        )
+
+    def _get_rainfall(self, begin_year: int, end_year: int | None = None) -> np.ndarray:
+        return self.store.get_rainfall(self.series_index, begin_year, end_year)
+
+    def _get_normal(self, begin_year: int, *, round_precision: int) -> float:
+        return self._normal_cache.get(
+            (begin_year, round_precision),
+            lambda: float(
+                self.store.get_average(
+                    self.series_index,
+                    begin_year,
+                    begin_year + 29,
+                    round_precision=round_precision,
                 )
+            ),
+            version=self.store.version,
+        )
 
-            figure.update_yaxes(title_text=f"{Label.RAINFALL.value} (mm)")
+    def _to_dataframe(self, year_slice: slice, rainfall: np.ndarray) -> pd.DataFrame:
+        years = self.years[year_slice]
+        start = self.store.start_index + (year_slice.start or 0)
 
-        return figure
+        return pd.DataFrame(
+            {Label.YEAR.value: years, Label.RAINFALL.value: rainfall},
+            index=pd.RangeIndex(start, start + len(years)),
+        )
@@ -3,15 +3,54 @@ Provides an all-in-one class to manipulate rainfall data for every timeframe.
 At a yearly, monthly and seasonal level.
 """
 
+from collections.abc import Callable, Mapping, Sequence
+from functools import cache
 from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, cast
+from urllib.parse import urlsplit
 
+import numpy as np
 import pandas as pd
-import plotly.graph_objs as go
 from pydantic import PositiveFloat
 
 import bcn_rainfall_core.models as models
-from bcn_rainfall_core.utils import DataSettings, Month, Season, TimeMode
+from bcn_rainfall_core.utils import (
+    BootstrapStatistic,
+    BytesLRUCache,
+    CacheStats,
+    ConfidenceInterval,
+    DashboardFigure,
+    DataSettings,
+    FigureFormat,
+    KMeansEngine,
+    Label,
+    LazyMapping,
+    LRUCache,
+    Month,
+    RainfallStore,
+    Season,
+    StatisticQuery,
+    TimeMode,
+    VersionedCache,
+    batch_statistics,
+    bootstrap,
+    dashboard_artifacts,
+    dataset_snapshot,
+    http_mirror,
+    rolling_statistics,
+    spi,
+    statistics_table,
+)
 from bcn_rainfall_core.utils import plotly_figures as plotly_fig
+from bcn_rainfall_core.utils.caching import (
+    DEFAULT_FIGURE_CACHE_MAX_BYTES,
+    DEFAULT_RESULT_CACHE_CAPACITY,
+)
+from bcn_rainfall_core.utils.http_mirror import DatasetMirror
+
+if TYPE_CHECKING:
+    from bcn_rainfall_core.utils.plotly_figures import FigureOutput
 
 
 class Rainfall:
@@ -20,6 +59,11 @@ class Rainfall:
     - YearlyRainfall data
     - MonthlyRainfall data for all months within a dictionary
     - SeasonalRainfall data for all seasons within a dictionary
+    All of them are views over a single RainfallStore owned by the instance.
+    Monthly and seasonal instances are built on first access; use `warm_up` to build them all.
+    Their clustering and regression results are memoized in a single LRUCache of bounded capacity.
+    Figures serialized to JSON are memoized as bytes in a BytesLRUCache bounded by their total size;
+    both caches are invalidated whenever data is updated or reloaded.
     """
 
     def __init__(
@@ -28,32 +72,168 @@ class Rainfall:
         *,
         start_year: int,
         round_precision: int,
+        snapshot_dir: str | None = None,
+        mirror: DatasetMirror | None = None,
+        result_cache_capacity=DEFAULT_RESULT_CACHE_CAPACITY,
+        result_cache_ttl: float | None = None,
+        figure_cache_max_bytes=DEFAULT_FIGURE_CACHE_MAX_BYTES,
     ):
         self.dataset_url_or_path = dataset_url_or_path
         self.starting_year = start_year
         self.round_precision = round_precision
-        self.raw_data: pd.DataFrame = pd.read_csv(dataset_url_or_path)
-        self.yearly_rainfall = models.YearlyRainfall(
-            self.raw_data, start_year=start_year, round_precision=round_precision
+        self.store = self.load_store(snapshot_dir=snapshot_dir, mirror=mirror)
+        self.result_cache: LRUCache = LRUCache(
+            result_cache_capacity, ttl=result_cache_ttl
         )
-        self.monthly_rainfalls = {
-            month.value: models.MonthlyRainfall(
-                self.raw_data,
-                month,
-                start_year=start_year,
-                round_precision=round_precision,
-            )
-            for month in Month
+        self.figure_cache: BytesLRUCache = BytesLRUCache(figure_cache_max_bytes)
+        self._build_rainfall_instances()
+        self._spi_fit_cache: VersionedCache[
+            tuple[int, tuple[int, ...]], spi.GammaFits
+        ] = VersionedCache()
+
+    def __getstate__(self) -> dict:
+        return {
+            "dataset_url_or_path": self.dataset_url_or_path,
+            "starting_year": self.starting_year,
+            "round_precision": self.round_precision,
+            "store": self.store,
+            "result_cache_capacity": self.result_cache.capacity,
+            "result_cache_ttl": self.result_cache.ttl,
+            "figure_cache_max_bytes": self.figure_cache.capacity,
         }
-        self.seasonal_rainfalls = {
-            season.value: models.SeasonalRainfall(
-                self.raw_data,
-                season,
-                start_year=start_year,
-                round_precision=round_precision,
+
+    def __setstate__(self, state: dict):
+        self.dataset_url_or_path = state["dataset_url_or_path"]
+        self.starting_year = state["starting_year"]
+        self.round_precision = state["round_precision"]
+        self.store = state["store"]
+        self.result_cache = LRUCache(
+            state["result_cache_capacity"], ttl=state["result_cache_ttl"]
+        )
+        self.figure_cache = BytesLRUCache(state["figure_cache_max_bytes"])
+        self._build_rainfall_instances()
+        self._spi_fit_cache = VersionedCache()
+
+    @property
+    def raw_data(self) -> pd.DataFrame:
+        """
+        Raw data shaped as rainfall values for each month according to year.
+        """
+        return self.store.raw_data
+
+    def load_store(
+        self,
+        *,
+        snapshot_dir: str | None = None,
+        mirror: DatasetMirror | None = None,
+    ) -> RainfallStore:
+        """
+        Load rainfall data from instance dataset into a RainfallStore.
+        If a mirror is given and dataset is a remote URL, data is read from the local copy kept by mirror.
+        If a snapshot folder is given and dataset is a local file, data is loaded from an up-to-date binary snapshot
+        when there is one; otherwise it is parsed from CSV and snapshotted for next loads.
+
+        :param snapshot_dir: Path to folder containing dataset snapshots (optional).
+        :param mirror: A DatasetMirror instance keeping local copies of remote datasets (optional).
+        :return: A RainfallStore instance.
+        :raise DatasetDownloadError: If remote dataset has no local copy yet and cannot be downloaded.
+        """
+        dataset_url_or_path = self.dataset_url_or_path
+        if mirror is not None and urlsplit(dataset_url_or_path).scheme in {
+            "http",
+            "https",
+        }:
+            dataset_url_or_path = str(mirror.fetch(dataset_url_or_path))
+
+        if snapshot_dir is not None and Path(dataset_url_or_path).is_file():
+            return dataset_snapshot.load_or_build_store(
+                dataset_url_or_path,
+                start_year=self.starting_year,
+                round_precision=self.round_precision,
+                snapshot_dir=snapshot_dir,
             )
-            for season in Season
-        }
+
+        return RainfallStore.from_dataframe(
+            pd.read_csv(dataset_url_or_path),
+            start_year=self.starting_year,
+            round_precision=self.round_precision,
+        )
+
+    def reload(
+        self,
+        *,
+        snapshot_dir: str | None = None,
+        mirror: DatasetMirror | None = None,
+    ) -> "Rainfall":
+        """
+        Load rainfall data from instance dataset again and rebuild every yearly, monthly and seasonal instance over it.
+        Data version keeps increasing across reloads, so that every cached result and figure is invalidated.
+
+        :param snapshot_dir: Path to folder containing dataset snapshots (optional).
+        :param mirror: A DatasetMirror instance keeping local copies of remote datasets (optional).
+        :return: The instance itself.
+        :raise DatasetDownloadError: If remote dataset has no local copy yet and cannot be downloaded.
+        """
+        store = self.load_store(snapshot_dir=snapshot_dir, mirror=mirror)
+        store.version = self.store.version + 1
+        self.store = store
+        self._build_rainfall_instances()
+
+        return self
+
+    def warm_up(self) -> "Rainfall":
+        """
+        Eagerly build every MonthlyRainfall and SeasonalRainfall instance not built yet.
+
+        :return: The instance itself.
+        """
+        self.monthly_rainfalls.warm_up()
+        self.seasonal_rainfalls.warm_up()
+
+        return self
+
+    def upsert(self, year: int, month: Month, value: float | None) -> bool:
+        """
+        Insert or replace rainfall value of a single month for given year, e.g. the latest published month.
+        Raw data, every yearly, monthly and seasonal series and their indexes are updated in place.
+
+        :param year: An integer representing the year to upsert.
+        :param month: A Month Enum representing the month to upsert.
+        :param value: Rainfall value (in mm); None if missing.
+        :return: True if year has been inserted, False if it has been updated.
+        """
+
+        return self.store.upsert_month(year, month, value)
+
+    def upsert_year(self, year: int, monthly_rainfall: Sequence[float | None]) -> bool:
+        """
+        Insert or replace rainfall values of every month for given year.
+        Raw data, every yearly, monthly and seasonal series and their indexes are updated in place.
+
+        :param year: An integer representing the year to upsert.
+        :param monthly_rainfall: 12 rainfall values (in mm) from January to December; None if missing.
+        :return: True if year has been inserted, False if it has been updated.
+        :raise DataFormatError: If there are not exactly 12 rainfall values.
+        """
+
+        return self.store.upsert_year(year, monthly_rainfall)
+
+    def append(self, year: int, monthly_rainfall: Sequence[float | None]):
+        """
+        Append rainfall values of every month for a year following every year of dataset.
+        It costs amortized constant time.
+
+        :param year: An integer representing the year to append.
+        :param monthly_rainfall: 12 rainfall values (in mm) from January to December; None if missing.
+        :raise ValueError: If year is not after the last year of dataset.
+        :raise DataFormatError: If there are not exactly 12 rainfall values.
+        """
+        if len(self.store.raw_years) and year <= self.store.raw_years[-1]:
+            raise ValueError(
+                f"Cannot append year {year}: it should be after {self.store.raw_years[-1]}."
+            )
+
+        self.store.upsert_year(year, monthly_rainfall)
 
     @classmethod
     def from_config(
@@ -89,6 +269,17 @@ class Rainfall:
             dataset_url_or_path,
             start_year=cfg.start_year,
             round_precision=cfg.rainfall_precision,
+            snapshot_dir=cfg.snapshot_dir,
+            mirror=http_mirror.get_dataset_mirror(
+                cfg.mirror_dir,
+                max_age=cfg.mirror_max_age,
+                timeout=cfg.download_timeout,
+            )
+            if cfg.mirror_dir is not None
+            else None,
+            result_cache_capacity=cfg.result_cache_capacity,
+            result_cache_ttl=cfg.result_cache_ttl,
+            figure_cache_max_bytes=cfg.figure_cache_max_bytes,
         )
 
     def export_all_data_to_csv(
@@ -138,6 +329,45 @@ class Rainfall:
 
         return folder_path
 
+    def export_dashboard_artifacts(
+        self,
+        *,
+        normal_year: int,
+        folder_path="dashboard_artifacts",
+        preset_ranges: Sequence[
+            dashboard_artifacts.PresetRange
+        ] = dashboard_artifacts.PRESET_RANGES,
+        binary_arrays=False,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """
+        Render figures and statistics of whole years, every month and every season, and comparisons of months
+        and of seasons, for every preset range of years, as static JSON files into specified folder path,
+        along with a manifest listing hashes of their inputs and contents.
+        Only files whose inputs changed since previous export into the same folder are rendered again.
+
+        :param normal_year: An integer representing the year
+        to start computing the 30 years normal of the rainfall.
+        :param folder_path: A string representing the folder path where to render files.
+        Defaults to 'dashboard_artifacts'.
+        :param preset_ranges: PresetRange instances with distinct names. Defaults to
+        the last 30 years, 1971-2000 and the full record.
+        :param binary_arrays: Whether to encode trace values as base64 typed arrays, with floats at rainfall precision,
+        or not. Defaults to False.
+        :param max_workers: Count of processes to render files with (optional).
+        Files are rendered in current process if not set or lower than 2.
+        :return: Paths of files rendered by this export, relative to folder path.
+        """
+
+        return dashboard_artifacts.generate_artifacts(
+            self,
+            folder_path,
+            normal_year=normal_year,
+            preset_ranges=preset_ranges,
+            binary_arrays=binary_arrays,
+            max_workers=max_workers,
+        )
+
     def export_as_csv(
         self,
         time_mode: TimeMode,
@@ -368,6 +598,218 @@ class Rainfall:
 
         return None
 
+    def get_statistics(
+        self, queries: Sequence[StatisticQuery]
+    ) -> list[float | int | None]:
+        """
+        Computes many rainfall statistics at once, e.g. every figure of a dashboard.
+        Sub-computations shared by queries, such as normals, are computed once
+        and every kind of them is evaluated in a single vectorized call.
+        Each result is the same as with the single-statistic method matching its query.
+
+        :param queries: A sequence of StatisticQuery instances, each one with its statistic, time mode,
+        month or season, year range and normal year.
+        :return: A list of results in the order of queries. None for a query missing its month or season,
+        end year or normal year, or whose year range is empty for a relative distance to normal.
+        """
+
+        return batch_statistics.compute_statistics(self.store, queries)
+
+    def get_statistics_table(
+        self,
+        time_mode: TimeMode,
+        *,
+        begin_year: int,
+        end_year: int,
+        normal_year: int | None = None,
+    ) -> pd.DataFrame | None:
+        """
+        Computes average, standard deviations and linear regression of every month or every season at once;
+        along with normal and relative distance to normal if normal year is given.
+        Values are the ones displayed by comparison bar figures.
+
+        :param time_mode: A TimeMode Enum: ['monthly', 'seasonal'].
+        :param begin_year: An integer representing the year
+        to start getting our rainfall values.
+        :param end_year: An integer representing the year
+        to end getting our rainfall values.
+        :param normal_year: An integer representing the year
+        to start computing the 30 years normal of the rainfall (optional).
+        :return: A pandas DataFrame with one row per month or season and one column per statistic.
+        None if time_mode is not within {'monthly', 'seasonal'}.
+        """
+        if time_mode == TimeMode.MONTHLY:
+            series_indexes = [
+                self.store.get_series_index(month=month) for month in Month
+            ]
+            labels = [month.value for month in Month]
+        elif time_mode == TimeMode.SEASONAL:
+            series_indexes = [
+                self.store.get_series_index(season=season) for season in Season
+            ]
+            labels = [season.value for season in Season]
+        else:
+            return None
+
+        return statistics_table.compute_statistics_table(
+            self.store,
+            series_indexes,
+            labels,
+            begin_year=begin_year,
+            end_year=end_year,
+            normal_year=normal_year,
+        )
+
+    def get_rolling_statistics(
+        self,
+        time_mode: TimeMode,
+        *,
+        begin_year: int,
+        end_year: int,
+        window=rolling_statistics.DEFAULT_WINDOW,
+        month: Month | None = None,
+        season: Season | None = None,
+    ) -> pd.DataFrame | None:
+        """
+        Computes average, variance, standard deviation and linear regression slope of rainfall
+        over every window of consecutive years within a year range, e.g. every 30 years normal.
+
+        :param time_mode: A TimeMode Enum: ['yearly', 'monthly', 'seasonal'].
+        :param begin_year: An integer representing the year
+        to start getting our rainfall values.
+        :param end_year: An integer representing the year
+        to end getting our rainfall values.
+        :param window: Count of years of each window. Defaults to 30.
+        :param month: A Month Enum: ['January', 'February', ..., 'December']
+        Set if time_mode is 'monthly' (optional).
+        :param season: A Season Enum: ['winter', 'spring', 'summer', 'fall'].
+        Set if time_mode is 'seasonal' (optional).
+        :return: A pandas DataFrame with the first year of each window and one column per statistic.
+        """
+        if entity := self.get_entity_for_time_mode(
+            time_mode, month=month, season=season
+        ):
+            return entity.get_rolling_statistics(begin_year, end_year, window=window)
+
+        return None
+
+    def get_confidence_interval(
+        self,
+        time_mode: TimeMode,
+        statistic: BootstrapStatistic,
+        *,
+        begin_year: int,
+        end_year: int | None = None,
+        month: Month | None = None,
+        season: Season | None = None,
+        resample_count=bootstrap.DEFAULT_RESAMPLE_COUNT,
+        confidence_level=bootstrap.DEFAULT_CONFIDENCE_LEVEL,
+        seed=0,
+        time_budget: float | None = None,
+        max_workers: int | None = None,
+    ) -> ConfidenceInterval | None:
+        """
+        Estimates confidence interval of rainfall average, normal or linear regression slope by bootstrap,
+        for a specific time mode.
+
+        :param time_mode: A TimeMode Enum: ['yearly', 'monthly', 'seasonal'].
+        :param statistic: A BootstrapStatistic Enum: ['average', 'normal', 'linear_regression_slope'].
+        :param begin_year: An integer representing the year
+        to start getting our rainfall values; for normal, the year to start computing it from.
+        :param end_year: An integer representing the year
+        to end getting our rainfall values (optional). Defaults to last year; ignored for normal.
+        :param month: A Month Enum: ['January', 'February', ..., 'December']
+        Set if time_mode is 'monthly' (optional).
+        :param season: A Season Enum: ['winter', 'spring', 'summer', 'fall'].
+        Set if time_mode is 'seasonal' (optional).
+        :param resample_count: Count of resamples. Defaults to 10 000.
+        :param confidence_level: Probability for statistic to be within interval. Defaults to 0.95.
+        :param seed: Seed of random generator, so that intervals are reproducible. Defaults to 0.
+        :param time_budget: Maximal duration in seconds (optional).
+        Fewer resamples are computed if it is spent; all of them are computed if not set.
+        :param max_workers: Count of processes to compute resamples with (optional).
+        Resamples are computed in current process if not set.
+        :return: A ConfidenceInterval instance holding point estimate, bounds and count of computed resamples.
+        :raise ValueError: If resample count is not positive or confidence level is not between 0 and 1.
+        """
+        if entity := self.get_entity_for_time_mode(
+            time_mode, month=month, season=season
+        ):
+            return entity.get_confidence_interval(
+                statistic,
+                begin_year,
+                end_year,
+                resample_count=resample_count,
+                confidence_level=confidence_level,
+                seed=seed,
+                time_budget=time_budget,
+                max_workers=max_workers,
+            )
+
+        return None
+
+    def get_spi(
+        self,
+        *,
+        normal_year: int,
+        begin_year: int | None = None,
+        end_year: int | None = None,
+        scales: Sequence[int] = spi.SPI_SCALES,
+    ) -> pd.DataFrame:
+        """
+        Computes Standardized Precipitation Index (SPI) of every month at many time scales,
+        from rainfall accumulated over the last months of each month.
+        Distributions of accumulated rainfall are fitted over a 30 years reference period,
+        and fits are cached until data changes.
+        SPI below -1, -1.5 and -2 respectively mean moderate, severe and extreme drought.
+
+        :param normal_year: An integer representing the first year of the 30 years reference period.
+        :param begin_year: An integer representing the year
+        to start getting our SPI values (optional). Defaults to first year of data.
+        :param end_year: An integer representing the year
+        to end getting our SPI values (optional). Defaults to last year of data.
+        :param scales: Counts of months rainfall is accumulated over. Defaults to (1, 3, 6, 12).
+        :return: A pandas DataFrame with year, month and one SPI column per scale, e.g. 'spi_3'.
+        SPI is NaN where rainfall is missing or could not be fitted.
+        :raise ValueError: If any scale is not a positive count of months.
+        """
+        scales = tuple(int(scale) for scale in scales)
+        if any(scale < 1 for scale in scales):
+            raise ValueError(
+                f"Scales should be positive counts of months, got {scales}."
+            )
+
+        years = spi.get_timeline_years(self.store)
+        accumulated_rainfall = spi.compute_accumulated_rainfall(self.store, scales)
+        fits = self._spi_fit_cache.get(
+            (normal_year, scales),
+            lambda: spi.fit_gamma_distributions(
+                accumulated_rainfall, years, normal_year
+            ),
+            version=self.store.version,
+        )
+        spi_values = np.round(
+            spi.compute_spi(accumulated_rainfall, fits), self.round_precision
+        )
+
+        year_slice = slice(
+            None if begin_year is None else np.searchsorted(years, begin_year),
+            None
+            if end_year is None
+            else np.searchsorted(years, end_year, side="right"),
+        )
+
+        return pd.DataFrame(
+            {
+                Label.YEAR.value: np.repeat(years[year_slice], len(Month)),
+                Label.MONTH.value: np.tile(Month.values(), len(years[year_slice])),
+                **{
+                    spi.get_spi_column(scale): spi_values[index, year_slice].ravel()
+                    for index, scale in enumerate(scales)
+                },
+            }
+        )
+
     def get_last_year(self) -> int:
         """
         Retrieves the last element of the 'Year' column from the pandas DataFrames.
@@ -378,6 +820,25 @@ class Rainfall:
 
         return self.yearly_rainfall.get_last_year()
 
+    def get_result_cache_stats(self) -> CacheStats:
+        """
+        Retrieve counters of cache memoizing clustering and regression results of every timeframe.
+
+        :return: A CacheStats instance with hit, miss, eviction and expiration counts and count of cached values.
+        """
+
+        return self.result_cache.get_stats()
+
+    def get_figure_cache_stats(self) -> CacheStats:
+        """
+        Retrieve counters of cache memoizing figures serialized to JSON.
+
+        :return: A CacheStats instance with hit, miss, eviction and expiration counts,
+        count of cached figures and their total size in bytes.
+        """
+
+        return self.figure_cache.get_stats()
+
     def get_bar_figure_of_rainfall_according_to_year(
         self,
         time_mode: TimeMode,
@@ -389,7 +850,10 @@ class Rainfall:
         plot_average=False,
         plot_linear_regression=False,
         kmeans_cluster_count: int | None = None,
-    ) -> go.Figure | None:
+        kmeans_engine=KMeansEngine.SKLEARN,
+        figure_format=FigureFormat.FIGURE,
+        binary_arrays=False,
+    ) -> "FigureOutput | None":
         """
         Return a bar graphic displaying rainfall by year computed upon whole years, specific months or seasons.
 
@@ -408,20 +872,41 @@ class Rainfall:
         Defaults to False.
         :param kmeans_cluster_count: If set, computes K-Mean clustering and displays clusters by color.
         Defaults to None.
-        :return: A plotly Figure object if data has been successfully plotted, None otherwise.
+        :param kmeans_engine: A KMeansEngine Enum: ['sklearn', 'optimal_1d'], used if kmeans_cluster_count is set.
+        Defaults to 'sklearn'.
+        :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+        :param binary_arrays: Whether to encode trace values as base64 typed arrays, with floats at rainfall precision,
+        or not. Defaults to False.
+        :return: A figure in requested format if data has been successfully plotted, None otherwise.
         """
-        if entity := self.get_entity_for_time_mode(
-            time_mode, month=month, season=season
-        ):
-            return entity.get_bar_figure_of_rainfall_according_to_year(
+        entity = self.get_entity_for_time_mode(time_mode, month=month, season=season)
+        if entity is None:
+            return None
+
+        return self._get_cached_figure(
+            (
+                "get_bar_figure_of_rainfall_according_to_year",
+                entity.series_index,
+                begin_year,
+                end_year,
+                plot_average,
+                plot_linear_regression,
+                kmeans_cluster_count,
+                None if kmeans_cluster_count is None else kmeans_engine,
+                binary_arrays,
+            ),
+            lambda figure_format: entity.get_bar_figure_of_rainfall_according_to_year(
                 begin_year,
                 end_year,
                 plot_average=plot_average,
                 plot_linear_regression=plot_linear_regression,
                 kmeans_cluster_count=kmeans_cluster_count,
-            )
-
-        return None
+                kmeans_engine=kmeans_engine,
+                figure_format=figure_format,
+                binary_arrays=binary_arrays,
+            ),
+            figure_format=figure_format,
+        )
 
     def get_bar_figure_of_rainfall_averages(
         self,
@@ -429,7 +914,9 @@ class Rainfall:
         *,
         begin_year: int,
         end_year: int,
-    ) -> go.Figure | None:
+        figure_format=FigureFormat.FIGURE,
+        binary_arrays=False,
+    ) -> "FigureOutput | None":
         """
         Return a bar graphic displaying average rainfall for each month or each season.
 
@@ -438,25 +925,40 @@ class Rainfall:
         to start getting our rainfall values.
         :param end_year: An integer representing the year
         to end getting our rainfall values.
-        :return: A plotly Figure object of the rainfall averages for each month or season.
+        :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+        :param binary_arrays: Whether to encode trace values as base64 typed arrays, with floats at rainfall precision,
+        or not. Defaults to False.
+        :return: A figure in requested format of the rainfall averages for each month or season.
         None if time_mode is not within {'monthly', 'seasonal'}.
         """
         if time_mode == TimeMode.YEARLY:
             return None
 
         rainfall_instance_by_label: (
-            dict[str, models.MonthlyRainfall] | dict[str, models.SeasonalRainfall]
+            Mapping[str, models.MonthlyRainfall] | Mapping[str, models.SeasonalRainfall]
         ) = {}
         if time_mode == TimeMode.MONTHLY:
             rainfall_instance_by_label = self.monthly_rainfalls
         elif time_mode == TimeMode.SEASONAL:
             rainfall_instance_by_label = self.seasonal_rainfalls
 
-        return plotly_fig.get_bar_figure_of_rainfall_averages(
-            rainfall_instance_by_label,
-            time_mode=time_mode,
-            begin_year=begin_year,
-            end_year=end_year,
+        return self._get_cached_figure(
+            (
+                "get_bar_figure_of_rainfall_averages",
+                time_mode,
+                begin_year,
+                end_year,
+                binary_arrays,
+            ),
+            lambda figure_format: plotly_fig.get_bar_figure_of_rainfall_averages(
+                rainfall_instance_by_label,
+                time_mode=time_mode,
+                begin_year=begin_year,
+                end_year=end_year,
+                figure_format=figure_format,
+                binary_precision=self.round_precision if binary_arrays else None,
+            ),
+            figure_format=figure_format,
         )
 
     def get_bar_figure_of_rainfall_linreg_slopes(
@@ -465,7 +967,9 @@ class Rainfall:
         *,
         begin_year: int,
         end_year: int,
-    ) -> go.Figure | None:
+        figure_format=FigureFormat.FIGURE,
+        binary_arrays=False,
+    ) -> "FigureOutput | None":
         """
         Return a bar graphic displaying linear regression slope for each month or each season.
 
@@ -474,25 +978,40 @@ class Rainfall:
         to start getting our rainfall values.
         :param end_year: An integer representing the year
         to end getting our rainfall values.
-        :return: A Plotly figure of the rainfall LinReg slopes for each month or season.
+        :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+        :param binary_arrays: Whether to encode trace values as base64 typed arrays, with floats at rainfall precision,
+        or not. Defaults to False.
+        :return: A figure in requested format of the rainfall LinReg slopes for each month or season.
         None if time_mode is not within {'monthly', 'seasonal'}.
         """
         if time_mode == TimeMode.YEARLY:
             return None
 
         rainfall_instance_by_label: (
-            dict[str, models.MonthlyRainfall] | dict[str, models.SeasonalRainfall]
+            Mapping[str, models.MonthlyRainfall] | Mapping[str, models.SeasonalRainfall]
         ) = {}
         if time_mode == TimeMode.MONTHLY:
             rainfall_instance_by_label = self.monthly_rainfalls
         elif time_mode == TimeMode.SEASONAL:
             rainfall_instance_by_label = self.seasonal_rainfalls
 
-        return plotly_fig.get_bar_figure_of_rainfall_linreg_slopes(
-            rainfall_instance_by_label,
-            time_mode=time_mode,
-            begin_year=begin_year,
-            end_year=end_year,
+        return self._get_cached_figure(
+            (
+                "get_bar_figure_of_rainfall_linreg_slopes",
+                time_mode,
+                begin_year,
+                end_year,
+                binary_arrays,
+            ),
+            lambda figure_format: plotly_fig.get_bar_figure_of_rainfall_linreg_slopes(
+                rainfall_instance_by_label,
+                time_mode=time_mode,
+                begin_year=begin_year,
+                end_year=end_year,
+                figure_format=figure_format,
+                binary_precision=self.round_precision if binary_arrays else None,
+            ),
+            figure_format=figure_format,
         )
 
     def get_bar_figure_of_relative_distance_to_normal(
@@ -502,7 +1021,9 @@ class Rainfall:
         normal_year: int,
         begin_year: int,
         end_year: int,
-    ) -> go.Figure | None:
+        figure_format=FigureFormat.FIGURE,
+        binary_arrays=False,
+    ) -> "FigureOutput | None":
         """
         Return a bar graphic displaying relative distances to normal for each month or each season.
 
@@ -513,26 +1034,44 @@ class Rainfall:
         to start getting our rainfall values.
         :param end_year: An integer representing the year
         to end getting our rainfall values.
-        :return: A Plotly figure of the rainfall relative distances to normal (%) for each month or season.
+        :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+        :param binary_arrays: Whether to encode trace values as base64 typed arrays, with floats at rainfall precision,
+        or not. Defaults to False.
+        :return: A figure in requested format of the rainfall relative distances to normal (%) for each month or season.
         None if time_mode is not within {'monthly', 'seasonal'}.
         """
         if time_mode == TimeMode.YEARLY:
             return None
 
         rainfall_instance_by_label: (
-            dict[str, models.MonthlyRainfall] | dict[str, models.SeasonalRainfall]
+            Mapping[str, models.MonthlyRainfall] | Mapping[str, models.SeasonalRainfall]
         ) = {}
         if time_mode == TimeMode.MONTHLY:
             rainfall_instance_by_label = self.monthly_rainfalls
         elif time_mode == TimeMode.SEASONAL:
             rainfall_instance_by_label = self.seasonal_rainfalls
 
-        return plotly_fig.get_bar_figure_of_relative_distances_to_normal(
-            rainfall_instance_by_label,
-            time_mode=time_mode,
-            normal_year=normal_year,
-            begin_year=begin_year,
-            end_year=end_year,
+        return self._get_cached_figure(
+            (
+                "get_bar_figure_of_relative_distance_to_normal",
+                time_mode,
+                normal_year,
+                begin_year,
+                end_year,
+                binary_arrays,
+            ),
+            lambda figure_format: (
+                plotly_fig.get_bar_figure_of_relative_distances_to_normal(
+                    rainfall_instance_by_label,
+                    time_mode=time_mode,
+                    normal_year=normal_year,
+                    begin_year=begin_year,
+                    end_year=end_year,
+                    figure_format=figure_format,
+                    binary_precision=self.round_precision if binary_arrays else None,
+                )
+            ),
+            figure_format=figure_format,
         )
 
     def get_bar_figure_of_standard_deviations(
@@ -542,7 +1081,9 @@ class Rainfall:
         begin_year: int,
         end_year: int,
         weigh_by_average=False,
-    ) -> go.Figure | None:
+        figure_format=FigureFormat.FIGURE,
+        binary_arrays=False,
+    ) -> "FigureOutput | None":
         """
         Return a bar graphic displaying standard deviations for each month or each season.
 
@@ -553,26 +1094,42 @@ class Rainfall:
         to end getting our rainfall values.
         :param bool weigh_by_average: Whether to divide standard deviation by average or not (optional).
         Defaults to False.
-        :return: A Plotly figure of the rainfall standard deviations (mm) for each month or season.
+        :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+        :param binary_arrays: Whether to encode trace values as base64 typed arrays, with floats at rainfall precision,
+        or not. Defaults to False.
+        :return: A figure in requested format of the rainfall standard deviations (mm) for each month or season.
         None if time_mode is not within {'monthly', 'seasonal'}.
         """
         if time_mode == TimeMode.YEARLY:
             return None
 
         rainfall_instance_by_label: (
-            dict[str, models.MonthlyRainfall] | dict[str, models.SeasonalRainfall]
+            Mapping[str, models.MonthlyRainfall] | Mapping[str, models.SeasonalRainfall]
         ) = {}
         if time_mode == TimeMode.MONTHLY:
             rainfall_instance_by_label = self.monthly_rainfalls
         elif time_mode == TimeMode.SEASONAL:
             rainfall_instance_by_label = self.seasonal_rainfalls
 
-        return plotly_fig.get_bar_figure_of_standard_deviations(
-            rainfall_instance_by_label,
-            time_mode=time_mode,
-            begin_year=begin_year,
-            end_year=end_year,
-            weigh_by_average=weigh_by_average,
+        return self._get_cached_figure(
+            (
+                "get_bar_figure_of_standard_deviations",
+                time_mode,
+                begin_year,
+                end_year,
+                weigh_by_average,
+                binary_arrays,
+            ),
+            lambda figure_format: plotly_fig.get_bar_figure_of_standard_deviations(
+                rainfall_instance_by_label,
+                time_mode=time_mode,
+                begin_year=begin_year,
+                end_year=end_year,
+                weigh_by_average=weigh_by_average,
+                figure_format=figure_format,
+                binary_precision=self.round_precision if binary_arrays else None,
+            ),
+            figure_format=figure_format,
         )
 
     def get_pie_figure_of_years_above_and_below_normal(
@@ -590,7 +1147,8 @@ class Rainfall:
             120,
             float("inf"),
         ),
-    ) -> go.Figure | None:
+        figure_format=FigureFormat.FIGURE,
+    ) -> "FigureOutput | None":
         """
         Return plotly pie figure displaying the percentage of years above and below normal for the given time mode,
         between the given years, and for the normal computed from the given year.
@@ -613,7 +1171,8 @@ class Rainfall:
         3. Between 100 and 150 of normal rainfall.
         4. Above 150 % of normal rainfall.
         Defaults to (0, 80, 120, float("inf")).
-        :return: A plotly Figure object of the percentage of years above and below normal as a pie chart.
+        :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+        :return: A figure in requested format of the percentage of years above and below normal as a pie chart.
         None if time_mode is 'monthly' but 'month' is None or if time_mode is 'seasonal' but 'season' is None.
         """
         rainfall_instance: (
@@ -632,12 +1191,208 @@ class Rainfall:
         if rainfall_instance is None:
             return None
 
-        return plotly_fig.get_pie_figure_of_years_above_and_below_normal(
-            rainfall_instance,
-            normal_year=normal_year,
-            begin_year=begin_year,
-            end_year=end_year,
-            percentages_of_normal=percentages_of_normal,
+        return self._get_cached_figure(
+            (
+                "get_pie_figure_of_years_above_and_below_normal",
+                rainfall_instance.series_index,
+                normal_year,
+                begin_year,
+                end_year,
+                # Keyed on percentages as rendered in labels, e.g. 80 and 80.0 are labelled differently.
+                tuple(str(percentage) for percentage in sorted(percentages_of_normal)),
+            ),
+            lambda figure_format: (
+                plotly_fig.get_pie_figure_of_years_above_and_below_normal(
+                    rainfall_instance,
+                    normal_year=normal_year,
+                    begin_year=begin_year,
+                    end_year=end_year,
+                    percentages_of_normal=percentages_of_normal,
+                    figure_format=figure_format,
+                )
+            ),
+            figure_format=figure_format,
+        )
+
+    def get_dashboard_figures(
+        self,
+        *,
+        normal_year: int,
+        begin_year: int,
+        end_year: int,
+        time_mode=TimeMode.MONTHLY,
+        dashboard_figures: Sequence[DashboardFigure] = tuple(DashboardFigure),
+        figure_format=FigureFormat.FIGURE,
+        binary_arrays=False,
+        max_workers: int | None = None,
+    ) -> dict[DashboardFigure, "FigureOutput | None"]:
+        """
+        Return every figure of the dashboard at once for a single range of years and normal:
+        yearly rainfall with its average and linear regression, comparison bars of averages, linear regression slopes,
+        relative distances to normal and standard deviations of every month or season, and years of yearly rainfall
+        compared to normal as a pie chart.
+        Statistics of months or seasons are computed once, in a single table shared by comparison bars.
+        Figures serialized to JSON are memoized in figure cache, each one on its own.
+
+        :param normal_year: An integer representing the year
+        to start computing the 30 years normal of the rainfall.
+        :param begin_year: An integer representing the year
+        to start getting our rainfall values.
+        :param end_year: An integer representing the year
+        to end getting our rainfall values.
+        :param time_mode: A TimeMode Enum: ['monthly', 'seasonal'], to compare months or seasons.
+        Defaults to 'monthly'.
+        :param dashboard_figures: DashboardFigure Enums of figures to return. Defaults to every figure.
+        :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+        :param binary_arrays: Whether to encode trace values as base64 typed arrays, with floats at rainfall precision,
+        or not. Defaults to False.
+        :param max_workers: Count of threads to build and serialize figures to JSON with (optional).
+        Figures are built in current thread if not set, lower than 2 or if format is not 'json'.
+        :return: A dictionary of figures in requested format by DashboardFigure, in the order of dashboard_figures.
+        Comparison bars are None if time_mode is not within {'monthly', 'seasonal'}.
+        """
+        figure_getters: dict[DashboardFigure, Callable[[], FigureOutput | None]] = {
+            DashboardFigure.YEARLY_RAINFALL: lambda: (
+                self.get_bar_figure_of_rainfall_according_to_year(
+                    TimeMode.YEARLY,
+                    begin_year=begin_year,
+                    end_year=end_year,
+                    plot_average=True,
+                    plot_linear_regression=True,
+                    figure_format=figure_format,
+                    binary_arrays=binary_arrays,
+                )
+            ),
+            DashboardFigure.YEARS_ABOVE_AND_BELOW_NORMAL: lambda: (
+                self.get_pie_figure_of_years_above_and_below_normal(
+                    time_mode=TimeMode.YEARLY,
+                    normal_year=normal_year,
+                    begin_year=begin_year,
+                    end_year=end_year,
+                    figure_format=figure_format,
+                )
+            ),
+        }
+        if time_mode in {TimeMode.MONTHLY, TimeMode.SEASONAL}:
+            figure_getters.update(
+                self._get_comparison_figure_getters(
+                    time_mode,
+                    normal_year=normal_year,
+                    begin_year=begin_year,
+                    end_year=end_year,
+                    figure_format=figure_format,
+                    binary_arrays=binary_arrays,
+                )
+            )
+
+        def get_figure(dashboard_figure: DashboardFigure) -> "FigureOutput | None":
+            if figure_getter := figure_getters.get(dashboard_figure):
+                return figure_getter()
+
+            return None
+
+        if figure_format != FigureFormat.JSON or max_workers is None or max_workers < 2:
+            return {
+                dashboard_figure: get_figure(dashboard_figure)
+                for dashboard_figure in dashboard_figures
+            }
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(
+                zip(dashboard_figures, executor.map(get_figure, dashboard_figures))
+            )
+
+    def get_figure_of_rolling_statistics(
+        self,
+        time_mode: TimeMode,
+        *,
+        begin_year: int,
+        end_year: int,
+        window=rolling_statistics.DEFAULT_WINDOW,
+        statistics: Sequence[str] = (rolling_statistics.AVERAGE,),
+        month: Month | None = None,
+        season: Season | None = None,
+        figure_format=FigureFormat.FIGURE,
+        binary_arrays=False,
+    ) -> "FigureOutput | None":
+        """
+        Return a figure of rolling statistics of rainfall computed upon whole years, specific months or seasons,
+        according to the first year of each window.
+
+        :param time_mode: A TimeMode Enum: ['yearly', 'monthly', 'seasonal'].
+        :param begin_year: An integer representing the year
+        to start getting our rainfall values.
+        :param end_year: An integer representing the year
+        to end getting our rainfall values.
+        :param window: Count of years of each window. Defaults to 30.
+        :param statistics: Names of statistics to plot, among
+        ['average', 'variance', 'standard_deviation', 'linear_regression_slope']. Defaults to average only.
+        :param month: A Month Enum: ['January', 'February', ..., 'December']
+        Set if time_mode is 'monthly' (optional).
+        :param season: A Season Enum: ['winter', 'spring', 'summer', 'fall'].
+        Set if time_mode is 'seasonal' (optional).
+        :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+        :param binary_arrays: Whether to encode trace values as base64 typed arrays, with floats at rainfall precision,
+        or not. Defaults to False.
+        :return: A figure in requested format if data has been successfully plotted, None otherwise.
+        """
+        if entity := self.get_entity_for_time_mode(
+            time_mode, month=month, season=season
+        ):
+            return entity.get_figure_of_rolling_statistics(
+                begin_year,
+                end_year,
+                window=window,
+                statistics=statistics,
+                figure_format=figure_format,
+                binary_arrays=binary_arrays,
+            )
+
+        return None
+
+    def get_figure_of_spi(
+        self,
+        *,
+        normal_year: int,
+        begin_year: int | None = None,
+        end_year: int | None = None,
+        scales: Sequence[int] = spi.SPI_SCALES,
+        figure_label: str | None = None,
+        figure_format=FigureFormat.FIGURE,
+        binary_arrays=False,
+    ) -> "FigureOutput | None":
+        """
+        Return a figure of Standardized Precipitation Index (SPI) according to month, one line per time scale,
+        along with thresholds of moderate, severe and extreme drought.
+
+        :param normal_year: An integer representing the first year of the 30 years reference period.
+        :param begin_year: An integer representing the year
+        to start getting our SPI values (optional). Defaults to first year of data.
+        :param end_year: An integer representing the year
+        to end getting our SPI values (optional). Defaults to last year of data.
+        :param scales: Counts of months rainfall is accumulated over. Defaults to (1, 3, 6, 12).
+        :param figure_label: A string to label graphic data (optional).
+        :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+        :param binary_arrays: Whether to encode trace values as base64 typed arrays, with floats at rainfall precision,
+        or not. Defaults to False.
+        :return: A figure in requested format if data has been successfully plotted, None otherwise.
+        :raise ValueError: If any scale is not a positive count of months.
+        """
+
+        return plotly_fig.get_figure_of_spi(
+            self.get_spi(
+                normal_year=normal_year,
+                begin_year=begin_year,
+                end_year=end_year,
+                scales=scales,
+            ),
+            scales=scales,
+            figure_label=figure_label
+            or f"Standardized Precipitation Index (reference {normal_year}-{normal_year + 29})",
+            figure_format=figure_format,
+            binary_precision=self.round_precision if binary_arrays else None,
         )
 
     def get_entity_for_time_mode(
@@ -678,3 +1433,180 @@ class Rainfall:
             entity = self.seasonal_rainfalls[season.value]
 
         return entity
+
+    def _build_rainfall_instances(self):
+        self.yearly_rainfall = models.YearlyRainfall(
+            self.store,
+            start_year=self.starting_year,
+            round_precision=self.round_precision,
+            result_cache=self.result_cache,
+        )
+        self.monthly_rainfalls: LazyMapping[str, models.MonthlyRainfall] = LazyMapping(
+            Month.values(),
+            lambda month: models.MonthlyRainfall(
+                self.store,
+                Month(month),
+                start_year=self.starting_year,
+                round_precision=self.round_precision,
+                result_cache=self.result_cache,
+            ),
+        )
+        self.seasonal_rainfalls: LazyMapping[str, models.SeasonalRainfall] = (
+            LazyMapping(
+                Season.values(),
+                lambda season: models.SeasonalRainfall(
+                    self.store,
+                    Season(season),
+                    start_year=self.starting_year,
+                    round_precision=self.round_precision,
+                    result_cache=self.result_cache,
+                ),
+            )
+        )
+
+    def _get_comparison_figure_getters(
+        self,
+        time_mode: TimeMode,
+        *,
+        normal_year: int,
+        begin_year: int,
+        end_year: int,
+        figure_format: FigureFormat,
+        binary_arrays: bool,
+    ) -> dict[DashboardFigure, Callable[[], "FigureOutput | None"]]:
+        """
+        Prepare comparison bars of every month or season of the dashboard, built from a single statistics table
+        computed once on first need. Figures are cached under the same keys as in their own methods, so that they are shared.
+        """
+        rainfall_instance_by_label: (
+            Mapping[str, models.MonthlyRainfall] | Mapping[str, models.SeasonalRainfall]
+        ) = (
+            self.monthly_rainfalls
+            if time_mode == TimeMode.MONTHLY
+            else self.seasonal_rainfalls
+        )
+        binary_precision = self.round_precision if binary_arrays else None
+
+        table_lock = Lock()
+
+        @cache
+        def compute_table() -> pd.DataFrame | None:
+            return self.get_statistics_table(
+                time_mode,
+                begin_year=begin_year,
+                end_year=end_year,
+                normal_year=normal_year,
+            )
+
+        # Figures may be built in concurrent threads, which should wait for a single computation.
+        def get_table() -> pd.DataFrame | None:
+            with table_lock:
+                return compute_table()
+
+        return {
+            DashboardFigure.RAINFALL_AVERAGES: lambda: self._get_cached_figure(
+                (
+                    "get_bar_figure_of_rainfall_averages",
+                    time_mode,
+                    begin_year,
+                    end_year,
+                    binary_arrays,
+                ),
+                lambda figure_format: plotly_fig.get_bar_figure_of_rainfall_averages(
+                    rainfall_instance_by_label,
+                    time_mode=time_mode,
+                    begin_year=begin_year,
+                    end_year=end_year,
+                    figure_format=figure_format,
+                    binary_precision=binary_precision,
+                    table=get_table(),
+                ),
+                figure_format=figure_format,
+            ),
+            DashboardFigure.LINEAR_REGRESSION_SLOPES: lambda: self._get_cached_figure(
+                (
+                    "get_bar_figure_of_rainfall_linreg_slopes",
+                    time_mode,
+                    begin_year,
+                    end_year,
+                    binary_arrays,
+                ),
+                lambda figure_format: (
+                    plotly_fig.get_bar_figure_of_rainfall_linreg_slopes(
+                        rainfall_instance_by_label,
+                        time_mode=time_mode,
+                        begin_year=begin_year,
+                        end_year=end_year,
+                        figure_format=figure_format,
+                        binary_precision=binary_precision,
+                        table=get_table(),
+                    )
+                ),
+                figure_format=figure_format,
+            ),
+            DashboardFigure.RELATIVE_DISTANCES_TO_NORMAL: lambda: (
+                self._get_cached_figure(
+                    (
+                        "get_bar_figure_of_relative_distance_to_normal",
+                        time_mode,
+                        normal_year,
+                        begin_year,
+                        end_year,
+                        binary_arrays,
+                    ),
+                    lambda figure_format: (
+                        plotly_fig.get_bar_figure_of_relative_distances_to_normal(
+                            rainfall_instance_by_label,
+                            time_mode=time_mode,
+                            normal_year=normal_year,
+                            begin_year=begin_year,
+                            end_year=end_year,
+                            figure_format=figure_format,
+                            binary_precision=binary_precision,
+                            table=get_table(),
+                        )
+                    ),
+                    figure_format=figure_format,
+                )
+            ),
+            DashboardFigure.STANDARD_DEVIATIONS: lambda: self._get_cached_figure(
+                (
+                    "get_bar_figure_of_standard_deviations",
+                    time_mode,
+                    begin_year,
+                    end_year,
+                    False,
+                    binary_arrays,
+                ),
+                lambda figure_format: plotly_fig.get_bar_figure_of_standard_deviations(
+                    rainfall_instance_by_label,
+                    time_mode=time_mode,
+                    begin_year=begin_year,
+                    end_year=end_year,
+                    figure_format=figure_format,
+                    binary_precision=binary_precision,
+                    table=get_table(),
+                ),
+                figure_format=figure_format,
+            ),
+        }
+
+    def _get_cached_figure(
+        self,
+        key: tuple,
+        build_figure: Callable[[FigureFormat], "FigureOutput | None"],
+        *,
+        figure_format: FigureFormat,
+    ) -> "FigureOutput | None":
+        """
+        Build figure in requested format. Figures serialized to JSON are memoized in figure cache
+        by method name and normalized arguments, until data changes.
+        """
+        if figure_format != FigureFormat.JSON:
+            return build_figure(figure_format)
+
+        return self.figure_cache.get(
+            key,
+            lambda: cast(bytes | None, build_figure(FigureFormat.JSON)),
+            version=self.store.version,
+        )
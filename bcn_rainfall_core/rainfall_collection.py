@@ -0,0 +1,561 @@
+"""
+Provides a class to manipulate rainfall data of many stations at once.
+Every statistic is computed for all stations in a single vectorized call.
+"""
+
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from bcn_rainfall_core.utils import (
+    DataFormatError,
+    Month,
+    RainfallStore,
+    Season,
+    TimeMode,
+    dataset_snapshot,
+)
+from bcn_rainfall_core.utils.linear_regression import fit_padded_linear_regressions
+from bcn_rainfall_core.utils.rainfall_store import SERIES_COUNT
+
+
+class RainfallCollection:
+    """
+    Holds rainfall data of many stations as a single (stations x years x months) NumPy array
+    over the union of their years, starting from a common starting year.
+    Yearly, monthly and seasonal series of every station are derived once into a (series x stations x years) array;
+    years missing for a station are NaN and left out of every statistic.
+    Cumulative sums along years are indexed so that range statistics cost two lookups per station.
+    """
+
+    def __init__(
+        self,
+        raw_data_by_station: Mapping[str, pd.DataFrame | RainfallStore],
+        *,
+        start_year: int,
+        round_precision: int,
+    ):
+        self.stations = list(raw_data_by_station)
+        self.starting_year = start_year
+        self.round_precision = round_precision
+
+        arrays_by_station = [
+            self._get_raw_arrays(raw_data, start_year=start_year)
+            for raw_data in raw_data_by_station.values()
+        ]
+        self.years = np.unique(
+            np.concatenate(
+                [np.empty(0, dtype=np.int64)]
+                + [station_years for station_years, _ in arrays_by_station]
+            )
+        )
+
+        self.raw_rainfall = np.full(
+            (len(self.stations), len(self.years), len(Month)), np.nan
+        )
+        self.has_year = np.zeros((len(self.stations), len(self.years)), dtype=bool)
+        for station_index, (station_years, station_rainfall) in enumerate(
+            arrays_by_station
+        ):
+            year_indexes = np.searchsorted(self.years, station_years)
+            self.raw_rainfall[station_index, year_indexes] = station_rainfall
+            self.has_year[station_index, year_indexes] = True
+
+        self.series = RainfallStore.compute_series(
+            self.raw_rainfall.reshape(-1, len(Month)), round_precision=round_precision
+        ).reshape(SERIES_COUNT, len(self.stations), len(self.years))
+        self.series[:, ~self.has_year] = np.nan
+
+        self._index_series()
+
+    @classmethod
+    def from_paths(
+        cls,
+        dataset_path_by_station: Mapping[str, str | Path],
+        *,
+        start_year: int,
+        round_precision: int,
+        snapshot_dir: str | Path | None = None,
+    ) -> "RainfallCollection":
+        """
+        Load rainfall data of every station from CSV datasets.
+        If a snapshot folder is given, datasets are loaded from up-to-date binary snapshots when there are some.
+
+        :param dataset_path_by_station: A mapping of dataset URL or path by station name.
+        :param start_year: An integer representing the year we should start get value from.
+        :param round_precision: An integer representing decimal precision for rainfall data.
+        :param snapshot_dir: Path to folder containing dataset snapshots (optional).
+        :return: A RainfallCollection instance.
+        """
+        raw_data_by_station: dict[str, pd.DataFrame | RainfallStore] = {}
+        for station, dataset_path in dataset_path_by_station.items():
+            if snapshot_dir is not None and Path(dataset_path).is_file():
+                raw_data_by_station[station] = dataset_snapshot.load_or_build_store(
+                    dataset_path,
+                    start_year=start_year,
+                    round_precision=round_precision,
+                    snapshot_dir=snapshot_dir,
+                )
+            else:
+                raw_data_by_station[station] = pd.read_csv(dataset_path)
+
+        return cls(
+            raw_data_by_station, start_year=start_year, round_precision=round_precision
+        )
+
+    def get_series(
+        self,
+        time_mode: TimeMode,
+        *,
+        month: Month | None = None,
+        season: Season | None = None,
+    ) -> np.ndarray | None:
+        """
+        Retrieve rainfall series of every station for specified time mode.
+
+        :param time_mode: A TimeMode Enum: ['yearly', 'monthly', 'seasonal'].
+        :param month: A Month Enum: ['January', 'February', ..., 'December']
+        Set if time_mode is 'monthly' (optional).
+        :param season: A Season Enum: ['winter', 'spring', 'summer', 'fall'].
+        Set if time_mode is 'seasonal' (optional).
+        :return: A (stations x years) NumPy array view of rainfall values (in mm); NaN for missing years.
+        None if time mode is 'monthly' and month is None or time mode is 'seasonal' and season is None.
+        """
+        if (
+            series_index := self._get_series_index(
+                time_mode, month=month, season=season
+            )
+        ) is None:
+            return None
+
+        return self.series[series_index]
+
+    def get_rainfall_average(
+        self,
+        time_mode: TimeMode,
+        *,
+        begin_year: int,
+        end_year: int,
+        month: Month | None = None,
+        season: Season | None = None,
+    ) -> pd.Series | None:
+        """
+        Computes Rainfall average of every station for a specific year range and time mode.
+
+        :param time_mode: A TimeMode Enum: ['yearly', 'monthly', 'seasonal'].
+        :param begin_year: An integer representing the year
+        to start getting our rainfall values.
+        :param end_year: An integer representing the year
+        to end getting our rainfall values.
+        :param month: A Month Enum: ['January', 'February', ..., 'December']
+        Set if time_mode is 'monthly' (optional).
+        :param season: A Season Enum: ['winter', 'spring', 'summer', 'fall'].
+        Set if time_mode is 'seasonal' (optional).
+        :return: A pandas Series of average Rainfall by station; NaN for stations without data.
+        """
+        if (
+            series_index := self._get_series_index(
+                time_mode, month=month, season=season
+            )
+        ) is None:
+            return None
+
+        return self._to_series(
+            self._get_average(
+                series_index,
+                begin_year,
+                end_year,
+                round_precision=self.round_precision,
+            )
+        )
+
+    def get_normal(
+        self,
+        time_mode: TimeMode,
+        *,
+        begin_year: int,
+        month: Month | None = None,
+        season: Season | None = None,
+    ) -> pd.Series | None:
+        """
+        Computes Rainfall normal of every station from a specific year and time mode.
+
+        :param time_mode: A TimeMode Enum: ['yearly', 'monthly', 'seasonal'].
+        :param begin_year: An integer representing the year
+        to start computing rainfall normal.
+        :param month: A Month Enum: ['January', 'February', ..., 'December']
+        Set if time_mode is 'monthly' (optional).
+        :param season: A Season Enum: ['winter', 'spring', 'summer', 'fall'].
+        Set if time_mode is 'seasonal' (optional).
+        :return: A pandas Series of Rainfall normal by station.
+        """
+
+        return self.get_rainfall_average(
+            time_mode,
+            begin_year=begin_year,
+            end_year=begin_year + 29,
+            month=month,
+            season=season,
+        )
+
+    def get_relative_distance_to_normal(
+        self,
+        time_mode: TimeMode,
+        *,
+        normal_year: int,
+        begin_year: int,
+        end_year: int,
+        month: Month | None = None,
+        season: Season | None = None,
+    ) -> pd.Series | None:
+        """
+        Computes relative distance to Rainfall normal of every station for a specific year range and time mode.
+
+        :param time_mode: A TimeMode Enum: ['yearly', 'monthly', 'seasonal'].
+        :param normal_year: An integer representing the year
+        to start computing the 30 years normal of the rainfall.
+        :param begin_year: An integer representing the year
+        to start getting our rainfall values.
+        :param end_year: An integer representing the year
+        to end getting our rainfall values.
+        :param month: A Month Enum: ['January', 'February', ..., 'December']
+        Set if time_mode is 'monthly' (optional).
+        :param season: A Season Enum: ['winter', 'spring', 'summer', 'fall'].
+        Set if time_mode is 'seasonal' (optional).
+        :return: A pandas Series of relative distances to rainfall normal by station.
+        """
+        if (
+            series_index := self._get_series_index(
+                time_mode, month=month, season=season
+            )
+        ) is None:
+            return None
+
+        normals = self._get_average(
+            series_index,
+            normal_year,
+            normal_year + 29,
+            round_precision=self.round_precision,
+        )
+        averages = self._get_average(
+            series_index, begin_year, end_year, round_precision=self.round_precision
+        )
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self._to_series(
+                np.round((averages - normals) / normals * 100, self.round_precision)
+            )
+
+    def get_rainfall_standard_deviation(
+        self,
+        time_mode: TimeMode,
+        *,
+        begin_year: int,
+        end_year: int,
+        month: Month | None = None,
+        season: Season | None = None,
+        weigh_by_average=False,
+    ) -> pd.Series | None:
+        """
+        Computes rainfall standard deviation of every station for a specific year range and time mode.
+
+        :param time_mode: A TimeMode Enum: ['yearly', 'monthly', 'seasonal'].
+        :param begin_year: An integer representing the year
+        to start getting our rainfall values.
+        :param end_year: An integer representing the year
+        to end getting our rainfall values.
+        :param month: A Month Enum: ['January', 'February', ..., 'December']
+        Set if time_mode is 'monthly' (optional).
+        :param season: A Season Enum: ['winter', 'spring', 'summer', 'fall'].
+        Set if time_mode is 'seasonal' (optional).
+        :param bool weigh_by_average: whether to divide standard deviation by average or not (optional).
+        Default to False.
+        :return: A pandas Series of standard deviations by station.
+        """
+        if (
+            series_index := self._get_series_index(
+                time_mode, month=month, season=season
+            )
+        ) is None:
+            return None
+
+        start, stop = self._get_year_bounds(begin_year, end_year)
+        counts = self.cumulative_counts[:, stop] - self.cumulative_counts[:, start]
+        sums = (
+            self.cumulative_deviations[series_index, :, stop]
+            - self.cumulative_deviations[series_index, :, start]
+        )
+        squared_sums = (
+            self.cumulative_squared_deviations[series_index, :, stop]
+            - self.cumulative_squared_deviations[series_index, :, start]
+        )
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            standard_deviations = np.sqrt(
+                np.maximum(squared_sums - sums * sums / counts, 0.0) / (counts - 1)
+            )
+            standard_deviations[counts <= 1] = np.nan
+            if weigh_by_average:
+                standard_deviations /= self._get_average(
+                    series_index, begin_year, end_year
+                )
+
+        return self._to_series(np.round(standard_deviations, self.round_precision))
+
+    def get_years_below_normal(
+        self,
+        time_mode: TimeMode,
+        *,
+        normal_year: int,
+        begin_year: int,
+        end_year: int,
+        month: Month | None = None,
+        season: Season | None = None,
+    ) -> pd.Series | None:
+        """
+        Computes the number of years below rainfall normal of every station for a specific year range and time mode.
+
+        :param time_mode: A TimeMode Enum: ['yearly', 'monthly', 'seasonal'].
+        :param normal_year: An integer representing the year
+        to start computing the 30 years normal of the rainfall.
+        :param begin_year: An integer representing the year
+        to start getting our rainfall values.
+        :param end_year: An integer representing the year
+        to end getting our rainfall values.
+        :param month: A Month Enum: ['January', 'February', ..., 'December']
+        Set if time_mode is 'monthly' (optional).
+        :param season: A Season Enum: ['winter', 'spring', 'summer', 'fall'].
+        Set if time_mode is 'seasonal' (optional).
+        :return: A pandas Series of counts of years below normal by station.
+        """
+
+        return self._count_years_compared_to_normal(
+            time_mode,
+            normal_year=normal_year,
+            begin_year=begin_year,
+            end_year=end_year,
+            month=month,
+            season=season,
+            below=True,
+        )
+
+    def get_years_above_normal(
+        self,
+        time_mode: TimeMode,
+        *,
+        normal_year: int,
+        begin_year: int,
+        end_year: int,
+        month: Month | None = None,
+        season: Season | None = None,
+    ) -> pd.Series | None:
+        """
+        Computes the number of years above rainfall normal of every station for a specific year range and time mode.
+
+        :param time_mode: A TimeMode Enum: ['yearly', 'monthly', 'seasonal'].
+        :param normal_year: An integer representing the year
+        to start computing the 30 years normal of the rainfall.
+        :param begin_year: An integer representing the year
+        to start getting our rainfall values.
+        :param end_year: An integer representing the year
+        to end getting our rainfall values.
+        :param month: A Month Enum: ['January', 'February', ..., 'December']
+        Set if time_mode is 'monthly' (optional).
+        :param season: A Season Enum: ['winter', 'spring', 'summer', 'fall'].
+        Set if time_mode is 'seasonal' (optional).
+        :return: A pandas Series of counts of years above normal by station.
+        """
+
+        return self._count_years_compared_to_normal(
+            time_mode,
+            normal_year=normal_year,
+            begin_year=begin_year,
+            end_year=end_year,
+            month=month,
+            season=season,
+            below=False,
+        )
+
+    def get_linear_regression(
+        self,
+        time_mode: TimeMode,
+        *,
+        begin_year: int,
+        end_year: int,
+        month: Month | None = None,
+        season: Season | None = None,
+    ) -> pd.DataFrame | None:
+        """
+        Computes Linear Regression of rainfall according to year of every station for a given time interval,
+        with the closed-form least squares engine fitting stations at once.
+
+        :param time_mode: A TimeMode Enum: ['yearly', 'monthly', 'seasonal'].
+        :param begin_year: An integer representing the year
+        to start getting our rainfall values.
+        :param end_year: An integer representing the year
+        to end getting our rainfall values.
+        :param month: A Month Enum: ['January', 'February', ..., 'December']
+        Set if time_mode is 'monthly' (optional).
+        :param season: A Season Enum: ['winter', 'spring', 'summer', 'fall'].
+        Set if time_mode is 'seasonal' (optional).
+        :return: A pandas DataFrame of r2 score and slope by station.
+        """
+        if (
+            series_index := self._get_series_index(
+                time_mode, month=month, season=season
+            )
+        ) is None:
+            return None
+
+        start, stop = self._get_year_bounds(begin_year, end_year)
+        r2_scores, slopes, _, _ = fit_padded_linear_regressions(
+            np.where(self.has_year[:, start:stop], self.years[start:stop], np.nan),
+            self.series[series_index, :, start:stop],
+            self._get_average(series_index, begin_year, end_year),
+            round_precision=self.round_precision,
+        )
+
+        return pd.DataFrame(
+            {
+                "r2_score": r2_scores,
+                "slope": np.round(slopes, self.round_precision),
+            },
+            index=self.stations,
+        )
+
+    def _index_series(self):
+        """
+        Index cumulative counts of years and cumulative sums of every series along years,
+        the latter scaled by precision to be exact integers.
+        Also index cumulative sums and sums of squares of deviations to series averages,
+        which keep variances accurate.
+        """
+        self.rainfall_scale = 10.0**self.round_precision
+
+        self.cumulative_counts = np.zeros(
+            (len(self.stations), len(self.years) + 1), dtype=np.int64
+        )
+        np.cumsum(self.has_year, axis=1, out=self.cumulative_counts[:, 1:])
+
+        self.cumulative_sums = np.zeros(self.series.shape[:2] + (len(self.years) + 1,))
+        np.cumsum(
+            np.rint(np.nan_to_num(self.series) * self.rainfall_scale),
+            axis=2,
+            out=self.cumulative_sums[..., 1:],
+        )
+
+        self.series_references = self.cumulative_sums[..., -1] / np.maximum(
+            self.cumulative_counts[:, -1] * self.rainfall_scale, 1
+        )
+        deviations = np.nan_to_num(
+            self.series - self.series_references[..., np.newaxis]
+        )
+
+        self.cumulative_deviations = np.zeros_like(self.cumulative_sums)
+        np.cumsum(deviations, axis=2, out=self.cumulative_deviations[..., 1:])
+
+        self.cumulative_squared_deviations = np.zeros_like(self.cumulative_sums)
+        np.cumsum(
+            np.square(deviations, out=deviations),
+            axis=2,
+            out=self.cumulative_squared_deviations[..., 1:],
+        )
+
+    def _get_year_bounds(self, begin_year: int, end_year: int) -> tuple[int, int]:
+        start, stop = RainfallStore.search_year_bounds(self.years, begin_year, end_year)
+
+        return int(start), int(stop)
+
+    def _get_average(
+        self,
+        series_index: int,
+        begin_year: int,
+        end_year: int,
+        *,
+        round_precision: int | None = None,
+    ) -> np.ndarray:
+        start, stop = self._get_year_bounds(begin_year, end_year)
+        counts = self.cumulative_counts[:, stop] - self.cumulative_counts[:, start]
+        sums = (
+            self.cumulative_sums[series_index, :, stop]
+            - self.cumulative_sums[series_index, :, start]
+        )
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            averages = sums / counts
+
+        if round_precision is not None:
+            averages = np.round(averages, round_precision - self.round_precision)
+
+        return averages / self.rainfall_scale
+
+    def _count_years_compared_to_normal(
+        self,
+        time_mode: TimeMode,
+        *,
+        normal_year: int,
+        begin_year: int,
+        end_year: int,
+        month: Month | None,
+        season: Season | None,
+        below: bool,
+    ) -> pd.Series | None:
+        if (
+            series_index := self._get_series_index(
+                time_mode, month=month, season=season
+            )
+        ) is None:
+            return None
+
+        normals = self._get_average(
+            series_index, normal_year, normal_year + 29, round_precision=1
+        )[:, np.newaxis]
+        start, stop = self._get_year_bounds(begin_year, end_year)
+        rainfall = self.series[series_index, :, start:stop]
+
+        return self._to_series(
+            np.count_nonzero(
+                rainfall < normals if below else rainfall > normals, axis=1
+            )
+        )
+
+    def _to_series(self, values: np.ndarray) -> pd.Series:
+        return pd.Series(values, index=self.stations)
+
+    @staticmethod
+    def _get_series_index(
+        time_mode: TimeMode,
+        *,
+        month: Month | None = None,
+        season: Season | None = None,
+    ) -> int | None:
+        if time_mode == TimeMode.YEARLY:
+            return RainfallStore.get_series_index()
+        if time_mode == TimeMode.MONTHLY and month is not None:
+            return RainfallStore.get_series_index(month=month)
+        if time_mode == TimeMode.SEASONAL and season is not None:
+            return RainfallStore.get_series_index(season=season)
+
+        return None
+
+    @staticmethod
+    def _get_raw_arrays(
+        raw_data: pd.DataFrame | RainfallStore, *, start_year: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if isinstance(raw_data, RainfallStore):
+            years, rainfall = raw_data.raw_years, raw_data.raw_rainfall
+        elif isinstance(raw_data, pd.DataFrame) and len(raw_data.columns) == 1 + len(
+            Month
+        ):
+            years = raw_data.iloc[:, 0].to_numpy(dtype=np.int64)
+            rainfall = raw_data.iloc[:, 1:].to_numpy(dtype=np.float64)
+        else:
+            raise DataFormatError(
+                "[Year, Jan_rain, Feb_rain, ..., Dec_rain] (pandas DataFrame)"
+            )
+
+        is_kept = years >= start_year
+
+        return years[is_kept], rainfall[is_kept]
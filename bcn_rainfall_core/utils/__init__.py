@@ -1,15 +1,55 @@
 from bcn_rainfall_core.utils.base_config import BaseConfig
-from bcn_rainfall_core.utils.custom_exceptions import DataFormatError
-from bcn_rainfall_core.utils.enums import BaseEnum, Label, Month, Season, TimeMode
-from bcn_rainfall_core.utils.schemas import DataSettings
+from bcn_rainfall_core.utils.caching import (
+    BytesLRUCache,
+    CacheStats,
+    LRUCache,
+    VersionedCache,
+)
+from bcn_rainfall_core.utils.custom_exceptions import (
+    DataFormatError,
+    DatasetDownloadError,
+)
+from bcn_rainfall_core.utils.enums import (
+    BaseEnum,
+    BootstrapStatistic,
+    DashboardFigure,
+    FigureFormat,
+    KMeansEngine,
+    Label,
+    Month,
+    Season,
+    Statistic,
+    TimeMode,
+)
+from bcn_rainfall_core.utils.lazy_mapping import LazyMapping
+from bcn_rainfall_core.utils.rainfall_store import RainfallStore
+from bcn_rainfall_core.utils.schemas import (
+    ConfidenceInterval,
+    DataSettings,
+    StatisticQuery,
+)
 
 __all__ = [
     "BaseConfig",
     "BaseEnum",
     "DataSettings",
+    "StatisticQuery",
     "Label",
     "TimeMode",
+    "KMeansEngine",
     "Month",
     "Season",
+    "Statistic",
     "DataFormatError",
+    "DatasetDownloadError",
+    "LazyMapping",
+    "RainfallStore",
+    "CacheStats",
+    "VersionedCache",
+    "LRUCache",
+    "BootstrapStatistic",
+    "ConfidenceInterval",
+    "FigureFormat",
+    "BytesLRUCache",
+    "DashboardFigure",
 ]
@@ -0,0 +1,213 @@
+"""
+Provides a function to evaluate many rainfall statistic queries at once over a RainfallStore.
+Averages, normals and variances shared by several queries are computed once,
+and every kind of sub-computation is evaluated with a single vectorized call.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from bcn_rainfall_core.utils.enums import Statistic, TimeMode
+from bcn_rainfall_core.utils.rainfall_store import RainfallStore
+from bcn_rainfall_core.utils.schemas import StatisticQuery
+
+NORMAL_YEAR_COUNT = 30
+
+# Normals compared to yearly rainfall are rounded to 1 decimal, like in YearlyRainfall.
+COMPARED_NORMAL_PRECISION = 1
+
+STATISTICS_WITH_RANGE = {
+    Statistic.AVERAGE,
+    Statistic.RELATIVE_DISTANCE_TO_NORMAL,
+    Statistic.STANDARD_DEVIATION,
+    Statistic.YEARS_BELOW_NORMAL,
+    Statistic.YEARS_ABOVE_NORMAL,
+}
+STATISTICS_WITH_NORMAL = {
+    Statistic.RELATIVE_DISTANCE_TO_NORMAL,
+    Statistic.YEARS_BELOW_NORMAL,
+    Statistic.YEARS_ABOVE_NORMAL,
+}
+
+
+class _UniqueRanges:
+    """
+    Registers (series, begin year, end year) ranges, each one once, so that they are evaluated together.
+    """
+
+    def __init__(self):
+        self._positions: dict[tuple[int, int, int], int] = {}
+
+    def add(self, series_index: int, begin_year: int, end_year: int) -> int:
+        return self._positions.setdefault(
+            (series_index, begin_year, end_year), len(self._positions)
+        )
+
+    def get_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        ranges = np.array(list(self._positions), dtype=np.int64).reshape(-1, 3)
+
+        return ranges[:, 0], ranges[:, 1], ranges[:, 2]
+
+
+def get_series_index(store: RainfallStore, query: StatisticQuery) -> int | None:
+    """
+    Retrieve index of rainfall series targeted by query.
+
+    :param store: A RainfallStore instance.
+    :param query: A StatisticQuery instance.
+    :return: Row index of series within store series matrix.
+    None if time mode is 'monthly' and month is None or time mode is 'seasonal' and season is None.
+    """
+    if query.time_mode == TimeMode.YEARLY:
+        return store.get_series_index()
+    if query.time_mode == TimeMode.MONTHLY and query.month is not None:
+        return store.get_series_index(month=query.month)
+    if query.time_mode == TimeMode.SEASONAL and query.season is not None:
+        return store.get_series_index(season=query.season)
+
+    return None
+
+
+def compute_statistics(
+    store: RainfallStore, queries: Sequence[StatisticQuery]
+) -> list[float | int | None]:
+    """
+    Evaluate rainfall statistic queries in batch, with the same results as their single-query counterparts.
+
+    :param store: A RainfallStore instance.
+    :param queries: A sequence of StatisticQuery instances.
+    :return: A list of results in the order of queries; None for a query
+    missing its month, season, end year or normal year, or whose year range is empty
+    for a relative distance to normal.
+    """
+    averages = _UniqueRanges()
+    raw_averages = _UniqueRanges()
+    variances = _UniqueRanges()
+    compared_normals = _UniqueRanges()
+    compared_ranges = _UniqueRanges()
+    comparisons: list[tuple[int, int]] = []
+
+    plans: list[tuple[StatisticQuery, dict[str, int]] | None] = []
+    for query in queries:
+        series_index = get_series_index(store, query)
+        if (
+            series_index is None
+            or (query.statistic in STATISTICS_WITH_RANGE and query.end_year is None)
+            or (query.statistic in STATISTICS_WITH_NORMAL and query.normal_year is None)
+        ):
+            plans.append(None)
+            continue
+
+        begin_year, end_year = query.begin_year, query.end_year or query.begin_year
+        normal_year = query.normal_year or query.begin_year
+        normal_range = (series_index, normal_year, normal_year + NORMAL_YEAR_COUNT - 1)
+
+        plan: dict[str, int] = {}
+        match query.statistic:
+            case Statistic.AVERAGE:
+                plan["average"] = averages.add(series_index, begin_year, end_year)
+            case Statistic.NORMAL:
+                plan["average"] = averages.add(
+                    series_index, begin_year, begin_year + NORMAL_YEAR_COUNT - 1
+                )
+            case Statistic.RELATIVE_DISTANCE_TO_NORMAL:
+                plan["average"] = averages.add(series_index, begin_year, end_year)
+                plan["normal"] = averages.add(*normal_range)
+            case Statistic.STANDARD_DEVIATION:
+                plan["variance"] = variances.add(series_index, begin_year, end_year)
+                if query.weigh_by_average:
+                    plan["raw_average"] = raw_averages.add(
+                        series_index, begin_year, end_year
+                    )
+            case Statistic.YEARS_BELOW_NORMAL | Statistic.YEARS_ABOVE_NORMAL:
+                plan["comparison"] = len(comparisons)
+                comparisons.append(
+                    (
+                        compared_ranges.add(series_index, begin_year, end_year),
+                        compared_normals.add(*normal_range),
+                    )
+                )
+
+        plans.append((query, plan))
+
+    average_values = store.get_average(
+        *averages.get_arrays(), round_precision=store.round_precision
+    )
+    raw_average_values = store.get_average(*raw_averages.get_arrays())
+    standard_deviations = np.sqrt(store.get_variance(*variances.get_arrays()))
+    compared_normal_values = store.get_average(
+        *compared_normals.get_arrays(), round_precision=COMPARED_NORMAL_PRECISION
+    )
+    counts_below, counts_above = _count_years_around_normals(
+        store, compared_ranges, compared_normal_values, comparisons
+    )
+
+    results: list[float | int | None] = []
+    for plan_or_none in plans:
+        if plan_or_none is None:
+            results.append(None)
+            continue
+
+        query, plan = plan_or_none
+        match query.statistic:
+            case Statistic.AVERAGE | Statistic.NORMAL:
+                results.append(float(average_values[plan["average"]]))
+            case Statistic.RELATIVE_DISTANCE_TO_NORMAL:
+                if query.end_year is None or query.end_year < query.begin_year:
+                    results.append(None)
+                    continue
+
+                normal = float(average_values[plan["normal"]])
+                average = float(average_values[plan["average"]])
+                results.append(
+                    round((average - normal) / normal * 100, store.round_precision)
+                )
+            case Statistic.STANDARD_DEVIATION:
+                standard_deviation = standard_deviations[plan["variance"]]
+                if query.weigh_by_average:
+                    standard_deviation /= raw_average_values[plan["raw_average"]]
+
+                results.append(
+                    float(np.round(standard_deviation, store.round_precision))
+                )
+            case Statistic.YEARS_BELOW_NORMAL:
+                results.append(int(counts_below[plan["comparison"]]))
+            case Statistic.YEARS_ABOVE_NORMAL:
+                results.append(int(counts_above[plan["comparison"]]))
+
+    return results
+
+
+def _count_years_around_normals(
+    store: RainfallStore,
+    compared_ranges: _UniqueRanges,
+    compared_normal_values: np.ndarray,
+    comparisons: list[tuple[int, int]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Count years below and above normal for every comparison in one vectorized pass:
+    rainfall of every range is gathered into a padded (comparisons x years) matrix compared to normals at once.
+    """
+    if not comparisons:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    range_positions, normal_positions = np.array(comparisons, dtype=np.int64).T
+    series_indexes, begin_years, end_years = compared_ranges.get_arrays()
+    starts, stops = store.get_year_bounds(begin_years, end_years)
+
+    # Same threshold expression as YearlyRainfall with a percentage of 100.
+    thresholds = compared_normal_values[normal_positions] * 100 / 100
+
+    starts, lengths = starts[range_positions], (stops - starts)[range_positions]
+    offsets = np.arange(int(lengths.max()))
+    columns = np.minimum(
+        starts[:, np.newaxis] + offsets, max(store.series.shape[1] - 1, 0)
+    )
+    rainfall = store.series[series_indexes[range_positions, np.newaxis], columns]
+    in_range = offsets < lengths[:, np.newaxis]
+
+    return (
+        np.count_nonzero(in_range & (rainfall < thresholds[:, np.newaxis]), axis=1),
+        np.count_nonzero(in_range & (rainfall > thresholds[:, np.newaxis]), axis=1),
+    )
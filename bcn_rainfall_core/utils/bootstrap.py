@@ -0,0 +1,225 @@
+"""
+Provides functions to estimate confidence intervals of rainfall statistics by bootstrap:
+years are resampled with replacement and the statistic is computed over every resample at once,
+from matrices of resampled indexes.
+Resamples are drawn in chunks of bounded size, each one from its own seed spawned from a single seed,
+so that results only depend on seed and resample count, whether chunks run in a process pool or not.
+"""
+
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from bcn_rainfall_core.utils.enums import BootstrapStatistic
+from bcn_rainfall_core.utils.schemas import ConfidenceInterval
+
+DEFAULT_RESAMPLE_COUNT = 10_000
+DEFAULT_CONFIDENCE_LEVEL = 0.95
+
+# Maximal count of resampled values per chunk, i.e. about 8 MB of indexes.
+CHUNK_SIZE = 1_000_000
+
+
+def estimate_averages(
+    years: np.ndarray, rainfall: np.ndarray, resample_indexes: np.ndarray
+) -> np.ndarray:
+    """
+    Compute rainfall average of every resample.
+
+    :param years: A NumPy array of years.
+    :param rainfall: A NumPy array of rainfall values, one per year.
+    :param resample_indexes: A (resamples x years) NumPy matrix of indexes of resampled years.
+    :return: A NumPy array of averages, one per resample.
+    """
+
+    return rainfall[resample_indexes].mean(axis=1)
+
+
+def estimate_slopes(
+    years: np.ndarray, rainfall: np.ndarray, resample_indexes: np.ndarray
+) -> np.ndarray:
+    """
+    Compute least squares slope of rainfall according to year of every resample.
+
+    :param years: A NumPy array of years.
+    :param rainfall: A NumPy array of rainfall values, one per year.
+    :param resample_indexes: A (resamples x years) NumPy matrix of indexes of resampled years.
+    :return: A NumPy array of slopes, one per resample; NaN if a resample holds a single distinct year.
+    """
+    resampled_years = years[resample_indexes].astype(np.float64)
+    resampled_rainfall = rainfall[resample_indexes]
+
+    year_deviations = resampled_years - resampled_years.mean(axis=1, keepdims=True)
+    rainfall_deviations = resampled_rainfall - resampled_rainfall.mean(
+        axis=1, keepdims=True
+    )
+    year_squared_sums = np.einsum("ij,ij->i", year_deviations, year_deviations)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(
+            year_squared_sums != 0,
+            np.einsum("ij,ij->i", year_deviations, rainfall_deviations)
+            / year_squared_sums,
+            np.nan,
+        )
+
+
+ESTIMATOR_BY_STATISTIC: dict[
+    BootstrapStatistic, Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+] = {
+    BootstrapStatistic.AVERAGE: estimate_averages,
+    BootstrapStatistic.NORMAL: estimate_averages,
+    BootstrapStatistic.LINEAR_REGRESSION_SLOPE: estimate_slopes,
+}
+
+
+def compute_bootstrap_estimates(
+    years: np.ndarray,
+    rainfall: np.ndarray,
+    statistic: BootstrapStatistic,
+    *,
+    resample_count=DEFAULT_RESAMPLE_COUNT,
+    seed=0,
+    time_budget: float | None = None,
+    max_workers: int | None = None,
+) -> np.ndarray:
+    """
+    Compute statistic over resamples of years drawn with replacement.
+    If a time budget is set, no chunk of resamples is started once it is spent,
+    so that fewer resamples than requested may be returned; the first chunk is always computed.
+
+    :param years: A NumPy array of years.
+    :param rainfall: A non-empty NumPy array of rainfall values, one per year.
+    :param statistic: A BootstrapStatistic Enum: ['average', 'normal', 'linear_regression_slope'].
+    :param resample_count: Count of resamples. Defaults to 10 000.
+    :param seed: Seed of random generator. Defaults to 0.
+    :param time_budget: Maximal duration in seconds (optional). Resamples are all computed if not set.
+    :param max_workers: Count of processes to compute chunks of resamples with (optional).
+    Chunks are computed in current process if not set or lower than 2.
+    :return: A NumPy array of statistic values, one per computed resample, in the order of chunks.
+    """
+    chunk_resample_count = max(1, CHUNK_SIZE // len(rainfall))
+    chunk_sizes = [chunk_resample_count] * (resample_count // chunk_resample_count)
+    if remaining_count := resample_count % chunk_resample_count:
+        chunk_sizes.append(remaining_count)
+
+    chunk_seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+
+    estimates: list[np.ndarray] = []
+    if max_workers is None or max_workers < 2 or len(chunk_sizes) < 2:
+        for chunk_seed, chunk_size in zip(chunk_seeds, chunk_sizes):
+            if estimates and deadline is not None and time.monotonic() >= deadline:
+                break
+
+            estimates.append(
+                _estimate_chunk(years, rainfall, statistic, chunk_seed, chunk_size)
+            )
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [
+                executor.submit(
+                    _estimate_chunk, years, rainfall, statistic, chunk_seed, chunk_size
+                )
+                for chunk_seed, chunk_size in zip(chunk_seeds, chunk_sizes)
+            ]
+            # Chunks are kept in order up to the first one not done in time, so that results are reproducible.
+            for future in futures:
+                timeout = (
+                    None
+                    if deadline is None or not estimates
+                    else max(deadline - time.monotonic(), 0.0)
+                )
+                try:
+                    estimates.append(future.result(timeout=timeout))
+                except FutureTimeoutError:
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return np.concatenate(estimates)
+
+
+def compute_confidence_interval(
+    years: np.ndarray,
+    rainfall: np.ndarray,
+    statistic: BootstrapStatistic,
+    *,
+    estimate: float,
+    round_precision: int,
+    resample_count=DEFAULT_RESAMPLE_COUNT,
+    confidence_level=DEFAULT_CONFIDENCE_LEVEL,
+    seed=0,
+    time_budget: float | None = None,
+    max_workers: int | None = None,
+) -> ConfidenceInterval:
+    """
+    Estimate confidence interval of statistic by percentile bootstrap.
+
+    :param years: A NumPy array of years.
+    :param rainfall: A NumPy array of rainfall values, one per year.
+    :param statistic: A BootstrapStatistic Enum: ['average', 'normal', 'linear_regression_slope'].
+    :param estimate: Value of statistic over rainfall.
+    :param round_precision: Count of decimals to round bounds to.
+    :param resample_count: Count of resamples. Defaults to 10 000.
+    :param confidence_level: Probability for statistic to be within interval. Defaults to 0.95.
+    :param seed: Seed of random generator. Defaults to 0.
+    :param time_budget: Maximal duration in seconds (optional). Resamples are all computed if not set.
+    :param max_workers: Count of processes to compute chunks of resamples with (optional).
+    :return: A ConfidenceInterval instance, with count of resamples actually computed.
+    Bounds are NaN if there is no rainfall value.
+    :raise ValueError: If resample count is not positive or confidence level is not between 0 and 1.
+    """
+    if resample_count < 1:
+        raise ValueError(
+            f"Resample count should be a positive integer, got {resample_count}."
+        )
+    if not 0 < confidence_level < 1:
+        raise ValueError(
+            f"Confidence level should be between 0 and 1, got {confidence_level}."
+        )
+
+    lower_bound = upper_bound = np.nan
+    computed_resample_count = 0
+    if len(rainfall):
+        estimates = compute_bootstrap_estimates(
+            years,
+            rainfall,
+            statistic,
+            resample_count=resample_count,
+            seed=seed,
+            time_budget=time_budget,
+            max_workers=max_workers,
+        )
+        computed_resample_count = len(estimates)
+        if not np.isnan(estimates).all():
+            lower_bound, upper_bound = np.nanquantile(
+                estimates, [(1 - confidence_level) / 2, (1 + confidence_level) / 2]
+            )
+
+    return ConfidenceInterval(
+        statistic=statistic,
+        estimate=estimate,
+        lower_bound=round(float(lower_bound), round_precision),
+        upper_bound=round(float(upper_bound), round_precision),
+        confidence_level=confidence_level,
+        resample_count=computed_resample_count,
+    )
+
+
+def _estimate_chunk(
+    years: np.ndarray,
+    rainfall: np.ndarray,
+    statistic: BootstrapStatistic,
+    seed: np.random.SeedSequence,
+    resample_count: int,
+) -> np.ndarray:
+    resample_indexes = np.random.default_rng(seed).integers(
+        0, len(rainfall), size=(resample_count, len(rainfall))
+    )
+
+    return ESTIMATOR_BY_STATISTIC[statistic](years, rainfall, resample_indexes)
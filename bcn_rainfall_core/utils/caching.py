@@ -0,0 +1,250 @@
+"""
+Provides caches for values computed from rainfall data, invalidated when data changes.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from threading import Lock
+
+DEFAULT_RESULT_CACHE_CAPACITY = 128
+DEFAULT_FIGURE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Snapshot of cache counters.
+    """
+
+    hits: int
+    misses: int
+    size: int
+    evictions: int = 0
+    expirations: int = 0
+    nbytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+
+class VersionedCache[K: Hashable, V]:
+    """
+    Memoizes values by key for a given version of the data they are computed from.
+    Looking up a value with another version than the cached one clears every cached value first,
+    so that a version counter bumped on each update of data is enough to invalidate the cache.
+    """
+
+    def __init__(self):
+        self._values: dict[K, V] = {}
+        self._version: int | None = None
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: K, factory: Callable[[], V], *, version: int) -> V:
+        """
+        Retrieve value cached for key, computing it with factory if missing or if data version changed.
+
+        :param key: A hashable key identifying value.
+        :param factory: Callable without parameters computing value.
+        :param version: Version of data value is computed from.
+        :return: Cached or computed value.
+        """
+        with self._lock:
+            if version != self._version:
+                self._values.clear()
+                self._version = version
+            elif key in self._values:
+                self.hits += 1
+
+                return self._values[key]
+
+            self.misses += 1
+
+        value = factory()
+        with self._lock:
+            if version == self._version:
+                self._values[key] = value
+
+        return value
+
+    def clear(self):
+        """
+        Remove every cached value; counters are kept.
+        """
+        with self._lock:
+            self._values.clear()
+            self._version = None
+
+    def get_stats(self) -> CacheStats:
+        """
+        Retrieve cache counters.
+
+        :return: A CacheStats instance with hit and miss counts and count of cached values.
+        """
+
+        return CacheStats(hits=self.hits, misses=self.misses, size=len(self._values))
+
+
+class LRUCache[K: Hashable, V]:
+    """
+    Memoizes at most `capacity` values by key, evicting the least recently used one when full;
+    a capacity of 0 disables caching.
+    Values expire `ttl` seconds after being computed if set, and every value is dropped
+    when looked up with another data version than the cached one, like in VersionedCache.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.capacity = capacity
+        self.ttl = ttl
+        self._clock = clock
+        self._values: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._weight = 0
+        self._version: int | None = None
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: K, factory: Callable[[], V], *, version: int) -> V:
+        """
+        Retrieve value cached for key, computing it with factory if missing, expired or if data version changed.
+
+        :param key: A hashable key identifying value.
+        :param factory: Callable without parameters computing value.
+        :param version: Version of data value is computed from.
+        :return: Cached or computed value.
+        """
+        with self._lock:
+            if version != self._version:
+                self._values.clear()
+                self._weight = 0
+                self._version = version
+            elif (cached := self._values.get(key)) is not None:
+                value, computed_at = cached
+                if self.ttl is None or self._clock() - computed_at < self.ttl:
+                    self._values.move_to_end(key)
+                    self.hits += 1
+
+                    return value
+
+                self._pop(key)
+                self.expirations += 1
+
+            self.misses += 1
+
+        value = factory()
+        # Values weighing more than capacity would evict every other value, themselves included.
+        if self.capacity <= 0 or self.weigh(value) > self.capacity:
+            return value
+
+        with self._lock:
+            if version == self._version:
+                if key in self._values:
+                    self._pop(key)
+                self._values[key] = (value, self._clock())
+                self._weight += self.weigh(value)
+                while self._weight > self.capacity:
+                    self._pop(next(iter(self._values)))
+                    self.evictions += 1
+
+        return value
+
+    def weigh(self, value: V) -> int:
+        """
+        Measure how much of cache capacity a value takes.
+
+        :param value: A cached value.
+        :return: 1, so that capacity is a count of values.
+        """
+
+        return 1
+
+    def clear(self):
+        """
+        Remove every cached value; counters are kept.
+        """
+        with self._lock:
+            self._values.clear()
+            self._weight = 0
+            self._version = None
+
+    def get_stats(self) -> CacheStats:
+        """
+        Retrieve cache counters.
+
+        :return: A CacheStats instance with hit, miss, eviction and expiration counts and count of cached values.
+        """
+
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._values),
+            evictions=self.evictions,
+            expirations=self.expirations,
+        )
+
+    def _pop(self, key: K):
+        value, _ = self._values.pop(key)
+        self._weight -= self.weigh(value)
+
+
+class BytesLRUCache[K: Hashable](LRUCache[K, bytes | None]):
+    """
+    LRUCache of serialized values, whose capacity `max_bytes` bounds the total size of cached values
+    rather than their count; None values are cached as well and weigh nothing.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        *,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(max_bytes, ttl=ttl, clock=clock)
+
+    def weigh(self, value: bytes | None) -> int:
+        """
+        Measure how much of cache capacity a value takes.
+
+        :param value: A cached value.
+        :return: Size of value in bytes; 0 if None.
+        """
+
+        return 0 if value is None else len(value)
+
+    def get_stats(self) -> CacheStats:
+        """
+        Retrieve cache counters.
+
+        :return: A CacheStats instance with hit, miss, eviction and expiration counts,
+        count of cached values and their total size in bytes.
+        """
+
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._values),
+            evictions=self.evictions,
+            expirations=self.expirations,
+            nbytes=self._weight,
+        )
@@ -16,3 +16,16 @@ class DataFormatError(Exception):
         )
 
         super().__init__(self.message)
+
+
+class DatasetDownloadError(Exception):
+    """
+    Customizable Exception for remote dataset that cannot be downloaded.
+    """
+
+    def __init__(self, url: str, reason: str):
+        self.url = url
+        self.reason = reason
+        self.message = f"Dataset cannot be downloaded from '{self.url}': {self.reason}"
+
+        super().__init__(self.message)
@@ -0,0 +1,491 @@
+"""
+Provides functions to render static dashboard artifacts: JSON figures and statistics of every time mode,
+month or season and preset range of years, written into a folder along with a manifest, so that a CDN can serve them.
+Every artifact is keyed by a hash of its inputs, i.e. its parameters and the rainfall data it is computed from,
+so that a rerun only renders the artifacts whose inputs changed.
+"""
+
+import hashlib
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from bcn_rainfall_core.utils.enums import (
+    DashboardFigure,
+    FigureFormat,
+    Month,
+    Season,
+    Statistic,
+    TimeMode,
+)
+from bcn_rainfall_core.utils.file_operations import write_atomically
+from bcn_rainfall_core.utils.schemas import StatisticQuery
+from bcn_rainfall_core.utils.statistics_table import NORMAL_YEAR_COUNT
+
+if TYPE_CHECKING:
+    from bcn_rainfall_core import Rainfall
+
+ARTIFACTS_FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+ARTIFACT_FILE_MODE = 0o644
+
+RAINFALL_FILE = "rainfall.json"
+YEARS_COMPARED_TO_NORMAL_FILE = "years_compared_to_normal.json"
+STATISTICS_FILE = "statistics.json"
+
+COMPARISON_FIGURES = (
+    DashboardFigure.RAINFALL_AVERAGES,
+    DashboardFigure.LINEAR_REGRESSION_SLOPES,
+    DashboardFigure.RELATIVE_DISTANCES_TO_NORMAL,
+    DashboardFigure.STANDARD_DEVIATIONS,
+)
+
+
+@dataclass(frozen=True)
+class PresetRange:
+    """
+    Named range of years, resolved against years of dataset: either fixed bounds or the last `year_count` years.
+    Bounds not set are the first and last years of dataset.
+    """
+
+    name: str
+    begin_year: int | None = None
+    end_year: int | None = None
+    year_count: int | None = None
+
+    def resolve(self, first_year: int, last_year: int) -> tuple[int, int]:
+        end_year = last_year if self.end_year is None else self.end_year
+        if self.year_count is not None:
+            return end_year - self.year_count + 1, end_year
+
+        return first_year if self.begin_year is None else self.begin_year, end_year
+
+
+PRESET_RANGES = (
+    PresetRange("last_30_years", year_count=30),
+    PresetRange("1971-2000", begin_year=1971, end_year=2000),
+    PresetRange("full_record"),
+)
+
+
+@dataclass(frozen=True)
+class ArtifactGroup:
+    """
+    Artifacts rendered together into a folder, from the same inputs: figures and statistics of whole years,
+    of a month or of a season, or comparison bars of every month or season.
+    """
+
+    folder: str
+    time_mode: TimeMode
+    begin_year: int
+    end_year: int
+    normal_year: int
+    month: Month | None = None
+    season: Season | None = None
+    is_comparison: bool = False
+
+    @property
+    def files(self) -> list[str]:
+        if self.is_comparison:
+            return [
+                f"{self.folder}/{dashboard_figure.value}.json"
+                for dashboard_figure in COMPARISON_FIGURES
+            ]
+
+        return [
+            f"{self.folder}/{file}"
+            for file in (RAINFALL_FILE, YEARS_COMPARED_TO_NORMAL_FILE, STATISTICS_FILE)
+        ]
+
+
+def list_artifact_groups(
+    rainfall: "Rainfall",
+    *,
+    normal_year: int,
+    preset_ranges: Sequence[PresetRange] = PRESET_RANGES,
+) -> list[ArtifactGroup]:
+    """
+    List groups of artifacts of every preset range: whole years, every month and season,
+    and comparisons of months and of seasons.
+
+    :param rainfall: A Rainfall instance.
+    :param normal_year: An integer representing the year
+    to start computing the 30 years normal of the rainfall.
+    :param preset_ranges: PresetRange instances with distinct names. Defaults to
+    the last 30 years, 1971-2000 and the full record.
+    :return: A list of ArtifactGroup instances, range by range.
+    """
+    years = rainfall.store.years
+    groups: list[ArtifactGroup] = []
+    for preset_range in preset_ranges:
+        begin_year, end_year = preset_range.resolve(int(years[0]), int(years[-1]))
+        yearly_group = ArtifactGroup(
+            f"{preset_range.name}/{TimeMode.YEARLY.value}",
+            TimeMode.YEARLY,
+            begin_year=begin_year,
+            end_year=end_year,
+            normal_year=normal_year,
+        )
+        monthly_folder = f"{preset_range.name}/{TimeMode.MONTHLY.value}"
+        seasonal_folder = f"{preset_range.name}/{TimeMode.SEASONAL.value}"
+
+        groups.append(yearly_group)
+        groups.append(
+            replace(
+                yearly_group,
+                folder=monthly_folder,
+                time_mode=TimeMode.MONTHLY,
+                is_comparison=True,
+            )
+        )
+        groups.extend(
+            replace(
+                yearly_group,
+                folder=f"{monthly_folder}/{month.value}",
+                time_mode=TimeMode.MONTHLY,
+                month=month,
+            )
+            for month in Month
+        )
+        groups.append(
+            replace(
+                yearly_group,
+                folder=seasonal_folder,
+                time_mode=TimeMode.SEASONAL,
+                is_comparison=True,
+            )
+        )
+        groups.extend(
+            replace(
+                yearly_group,
+                folder=f"{seasonal_folder}/{season.value}",
+                time_mode=TimeMode.SEASONAL,
+                season=season,
+            )
+            for season in Season
+        )
+
+    return groups
+
+
+def compute_input_hash(
+    rainfall: "Rainfall", group: ArtifactGroup, *, binary_arrays=False
+) -> str:
+    """
+    Compute hash of inputs of a group of artifacts: its parameters, versions of renderers,
+    and rainfall series it is computed from, over years of its range and over years of its normal.
+
+    :param rainfall: A Rainfall instance.
+    :param group: An ArtifactGroup instance.
+    :param binary_arrays: Whether figures encode trace values as base64 typed arrays or not. Defaults to False.
+    :return: A hexadecimal SHA-256 digest.
+    """
+    import plotly
+
+    import bcn_rainfall_core
+
+    store = rainfall.store
+    if group.is_comparison:
+        series_indexes = (
+            [store.get_series_index(month=month) for month in Month]
+            if group.time_mode == TimeMode.MONTHLY
+            else [store.get_series_index(season=season) for season in Season]
+        )
+    else:
+        series_indexes = [
+            store.get_series_index(month=group.month, season=group.season)
+        ]
+
+    digest = hashlib.sha256(
+        json.dumps(
+            [
+                ARTIFACTS_FORMAT_VERSION,
+                bcn_rainfall_core.__version__,
+                plotly.__version__,
+                group.folder,
+                group.begin_year,
+                group.end_year,
+                group.normal_year,
+                rainfall.round_precision,
+                binary_arrays,
+            ]
+        ).encode()
+    )
+    for year_slice in (
+        store.get_year_slice(group.begin_year, group.end_year),
+        store.get_year_slice(
+            group.normal_year, group.normal_year + NORMAL_YEAR_COUNT - 1
+        ),
+    ):
+        digest.update(np.ascontiguousarray(store.years[year_slice]).tobytes())
+        digest.update(
+            np.ascontiguousarray(store.series[series_indexes, year_slice]).tobytes()
+        )
+
+    return digest.hexdigest()
+
+
+def render_artifact_group(
+    rainfall: "Rainfall", group: ArtifactGroup, *, binary_arrays=False
+) -> dict[str, bytes]:
+    """
+    Render every artifact of a group as JSON.
+
+    :param rainfall: A Rainfall instance.
+    :param group: An ArtifactGroup instance.
+    :param binary_arrays: Whether to encode trace values as base64 typed arrays or not. Defaults to False.
+    :return: A dictionary of JSON contents by file path, relative to artifacts folder.
+    """
+    if group.is_comparison:
+        figures = rainfall.get_dashboard_figures(
+            normal_year=group.normal_year,
+            begin_year=group.begin_year,
+            end_year=group.end_year,
+            time_mode=group.time_mode,
+            dashboard_figures=COMPARISON_FIGURES,
+            figure_format=FigureFormat.JSON,
+            binary_arrays=binary_arrays,
+        )
+
+        return {
+            file: _to_json(figure)
+            for file, figure in zip(group.files, figures.values())
+        }
+
+    rainfall_figure = rainfall.get_bar_figure_of_rainfall_according_to_year(
+        group.time_mode,
+        begin_year=group.begin_year,
+        end_year=group.end_year,
+        month=group.month,
+        season=group.season,
+        plot_average=True,
+        plot_linear_regression=True,
+        figure_format=FigureFormat.JSON,
+        binary_arrays=binary_arrays,
+    )
+    pie_figure = rainfall.get_pie_figure_of_years_above_and_below_normal(
+        time_mode=group.time_mode,
+        normal_year=group.normal_year,
+        begin_year=group.begin_year,
+        end_year=group.end_year,
+        month=group.month,
+        season=group.season,
+        figure_format=FigureFormat.JSON,
+    )
+    statistics = rainfall.get_statistics(
+        [
+            StatisticQuery(
+                statistic=statistic,
+                time_mode=group.time_mode,
+                begin_year=group.normal_year
+                if statistic == Statistic.NORMAL
+                else group.begin_year,
+                end_year=group.end_year,
+                normal_year=group.normal_year,
+                month=group.month,
+                season=group.season,
+            )
+            for statistic in Statistic
+        ]
+    )
+
+    return dict(
+        zip(
+            group.files,
+            (
+                _to_json(rainfall_figure),
+                _to_json(pie_figure),
+                _to_json(
+                    {
+                        "begin_year": group.begin_year,
+                        "end_year": group.end_year,
+                        "normal_year": group.normal_year,
+                        **{
+                            statistic.value: None
+                            if isinstance(value, float) and np.isnan(value)
+                            else value
+                            for statistic, value in zip(Statistic, statistics)
+                        },
+                    }
+                ),
+            ),
+        )
+    )
+
+
+def load_manifest(folder_path: str | Path) -> dict | None:
+    """
+    Load manifest of artifacts folder.
+
+    :param folder_path: Path to artifacts folder.
+    :return: A dictionary with format version, normal year, resolved year ranges by name
+    and, by artifact path, hash of its inputs, hash of its content and its size in bytes.
+    None if manifest does not exist, is invalid or has another format version.
+    """
+    try:
+        with open(Path(folder_path, MANIFEST_FILE), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("format_version") != ARTIFACTS_FORMAT_VERSION
+    ):
+        return None
+
+    return manifest
+
+
+def generate_artifacts(
+    rainfall: "Rainfall",
+    folder_path: str | Path,
+    *,
+    normal_year: int,
+    preset_ranges: Sequence[PresetRange] = PRESET_RANGES,
+    binary_arrays=False,
+    max_workers: int | None = None,
+) -> list[str]:
+    """
+    Render every artifact of every preset range into folder, then write manifest.
+    Groups of artifacts whose input hash matches manifest of a previous run, and whose files are still there
+    with the same size, are kept as is. Artifacts of previous run that are not rendered anymore are removed.
+    Every file is written into a temporary file renamed afterward, so that it is either complete or absent.
+
+    :param rainfall: A Rainfall instance.
+    :param folder_path: Path to artifacts folder.
+    :param normal_year: An integer representing the year
+    to start computing the 30 years normal of the rainfall.
+    :param preset_ranges: PresetRange instances with distinct names. Defaults to
+    the last 30 years, 1971-2000 and the full record.
+    :param binary_arrays: Whether to encode trace values as base64 typed arrays, with floats at rainfall precision,
+    or not. Defaults to False.
+    :param max_workers: Count of processes to render artifacts with (optional).
+    Artifacts are rendered in current process if not set or lower than 2.
+    :return: Paths of artifacts rendered by this run, relative to folder.
+    """
+    folder_path = Path(folder_path)
+    previous_entries: dict[str, dict] = (load_manifest(folder_path) or {}).get(
+        "artifacts", {}
+    )
+
+    entries: dict[str, dict] = {}
+    stale_groups: list[ArtifactGroup] = []
+    input_hashes: dict[str, str] = {}
+    for group in list_artifact_groups(
+        rainfall, normal_year=normal_year, preset_ranges=preset_ranges
+    ):
+        input_hash = compute_input_hash(rainfall, group, binary_arrays=binary_arrays)
+        if all(
+            (entry := previous_entries.get(file)) is not None
+            and entry["input_hash"] == input_hash
+            and _get_size(folder_path / file) == entry["size"]
+            for file in group.files
+        ):
+            entries.update((file, previous_entries[file]) for file in group.files)
+        else:
+            stale_groups.append(group)
+            input_hashes[group.folder] = input_hash
+
+    rendered_files: list[str] = []
+    for group, contents in zip(
+        stale_groups,
+        _render_artifact_groups(
+            rainfall,
+            stale_groups,
+            binary_arrays=binary_arrays,
+            max_workers=max_workers,
+        ),
+    ):
+        for file, content in contents.items():
+            _write_artifact(folder_path / file, content)
+            entries[file] = {
+                "input_hash": input_hashes[group.folder],
+                "content_hash": hashlib.sha256(content).hexdigest(),
+                "size": len(content),
+            }
+            rendered_files.append(file)
+
+    years = rainfall.store.years
+    _write_artifact(
+        folder_path / MANIFEST_FILE,
+        _to_json(
+            {
+                "format_version": ARTIFACTS_FORMAT_VERSION,
+                "normal_year": normal_year,
+                "ranges": {
+                    preset_range.name: preset_range.resolve(
+                        int(years[0]), int(years[-1])
+                    )
+                    for preset_range in preset_ranges
+                },
+                "artifacts": dict(sorted(entries.items())),
+            },
+        ),
+    )
+
+    for file in previous_entries.keys() - entries.keys():
+        Path(folder_path, file).unlink(missing_ok=True)
+
+    return rendered_files
+
+
+# Rainfall instance of worker process, set once by pool initializer.
+_worker_rainfall: "Rainfall"
+
+
+def _render_artifact_groups(
+    rainfall: "Rainfall",
+    groups: list[ArtifactGroup],
+    *,
+    binary_arrays: bool,
+    max_workers: int | None,
+) -> list[dict[str, bytes]]:
+    if max_workers is None or max_workers < 2 or len(groups) < 2:
+        return [
+            render_artifact_group(rainfall, group, binary_arrays=binary_arrays)
+            for group in groups
+        ]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(rainfall,),
+    ) as executor:
+        return list(
+            executor.map(_render_in_worker, groups, [binary_arrays] * len(groups))
+        )
+
+
+def _init_worker(rainfall: "Rainfall"):
+    global _worker_rainfall
+    _worker_rainfall = rainfall
+
+
+def _render_in_worker(group: ArtifactGroup, binary_arrays: bool) -> dict[str, bytes]:
+    return render_artifact_group(_worker_rainfall, group, binary_arrays=binary_arrays)
+
+
+def _to_json(content: dict | bytes | None) -> bytes:
+    if isinstance(content, bytes):
+        return content
+
+    return json.dumps(content).encode()
+
+
+def _get_size(path: Path) -> int | None:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
+
+
+def _write_artifact(path: Path, content: bytes):
+    # Temporary files are only readable by owner, whereas artifacts are meant to be served.
+    write_atomically(path, lambda f: f.write(content), mode=ARTIFACT_FILE_MODE)
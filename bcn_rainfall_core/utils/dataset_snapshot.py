@@ -0,0 +1,219 @@
+"""
+Provides functions to save and load binary snapshots of parsed rainfall datasets.
+A snapshot is a folder of NumPy files memory-mapped on load, so that loading it skips CSV parsing.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from bcn_rainfall_core.utils.custom_exceptions import DataFormatError
+from bcn_rainfall_core.utils.rainfall_store import ARRAY_NAMES, RainfallStore
+
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_METADATA_FILE = "metadata.json"
+
+
+def get_snapshot_key(
+    source_path: str | Path, *, start_year: int, round_precision: int
+) -> str:
+    """
+    Compute snapshot key from the content hash of source file and from parameters of derived data.
+
+    :param source_path: Path to CSV source file.
+    :param start_year: An integer representing the year we should start get value from.
+    :param round_precision: An integer representing decimal precision for rainfall data.
+    :return: A hexadecimal SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    with open(source_path, "rb") as stream:
+        while chunk := stream.read(1 << 20):
+            digest.update(chunk)
+
+    digest.update(f"{SNAPSHOT_FORMAT_VERSION}:{start_year}:{round_precision}".encode())
+
+    return digest.hexdigest()
+
+
+def get_snapshot_path(
+    snapshot_dir: str | Path, source_path: str | Path, key: str
+) -> Path:
+    """
+    Retrieve path to snapshot folder of source file for given key.
+
+    :param snapshot_dir: Path to folder containing snapshots.
+    :param source_path: Path to CSV source file.
+    :param key: Snapshot key computed by `get_snapshot_key`.
+    :return: Path to snapshot folder.
+    """
+
+    return Path(snapshot_dir, f"{Path(source_path).stem}-{key}")
+
+
+def load_snapshot_metadata(snapshot_path: str | Path) -> dict | None:
+    """
+    Load metadata of snapshot folder.
+
+    :param snapshot_path: Path to snapshot folder.
+    :return: A dictionary of metadata. None if it does not exist, is invalid or of another format version.
+    """
+    try:
+        with open(Path(snapshot_path, SNAPSHOT_METADATA_FILE), encoding="utf-8") as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(metadata, dict)
+        or metadata.get("format_version") != SNAPSHOT_FORMAT_VERSION
+    ):
+        return None
+
+    return metadata
+
+
+def load_snapshot(snapshot_path: str | Path) -> RainfallStore | None:
+    """
+    Load store from snapshot folder; arrays are memory-mapped in read-only mode.
+
+    :param snapshot_path: Path to snapshot folder.
+    :return: A RainfallStore instance. None if snapshot does not exist or is invalid.
+    """
+    if (metadata := load_snapshot_metadata(snapshot_path)) is None:
+        return None
+
+    try:
+        return RainfallStore.from_arrays(
+            {
+                name: np.load(Path(snapshot_path, f"{name}.npy"), mmap_mode="r")
+                for name in ARRAY_NAMES
+            },
+            start_year=metadata["start_year"],
+            round_precision=metadata["round_precision"],
+            columns=metadata["columns"],
+        )
+    except (OSError, ValueError, KeyError, DataFormatError):
+        return None
+
+
+def save_snapshot(
+    store: RainfallStore,
+    snapshot_path: str | Path,
+    *,
+    source_path: str | Path | None = None,
+) -> Path:
+    """
+    Save store arrays into snapshot folder.
+    Files are written into a temporary folder renamed afterward, so that snapshot is either complete or absent.
+    An existing snapshot folder is first renamed aside: readers in between find no snapshot and rebuild it,
+    instead of reading a partially removed one.
+
+    :param store: A RainfallStore instance.
+    :param snapshot_path: Path to snapshot folder.
+    :param source_path: Path to CSV source file, recorded in metadata to find stale snapshots of it (optional).
+    :return: Path to snapshot folder.
+    """
+    snapshot_path = Path(snapshot_path)
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = Path(
+        tempfile.mkdtemp(prefix=f".{snapshot_path.name}-", dir=snapshot_path.parent)
+    )
+    replaced_path = Path(
+        tempfile.mkdtemp(
+            prefix=f".{snapshot_path.name}-replaced-", dir=snapshot_path.parent
+        )
+    )
+    try:
+        for name, array in store.get_arrays().items():
+            np.save(Path(tmp_path, f"{name}.npy"), array)
+
+        with open(Path(tmp_path, SNAPSHOT_METADATA_FILE), "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "format_version": SNAPSHOT_FORMAT_VERSION,
+                    "source_path": (
+                        str(Path(source_path).resolve())
+                        if source_path is not None
+                        else None
+                    ),
+                    "start_year": store.starting_year,
+                    "round_precision": store.round_precision,
+                    "columns": store.columns,
+                },
+                f,
+            )
+
+        try:
+            os.rename(snapshot_path, Path(replaced_path, snapshot_path.name))
+        except FileNotFoundError:
+            pass
+
+        os.rename(tmp_path, snapshot_path)
+    except OSError:
+        # Another process may have written the same snapshot in the meantime.
+        if load_snapshot(snapshot_path) is None:
+            raise
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        shutil.rmtree(replaced_path, ignore_errors=True)
+
+    return snapshot_path
+
+
+def load_or_build_store(
+    source_path: str | Path,
+    *,
+    start_year: int,
+    round_precision: int,
+    snapshot_dir: str | Path,
+) -> RainfallStore:
+    """
+    Load store from snapshot of source file if it is up-to-date;
+    otherwise, parse source file, save a new snapshot and remove stale ones.
+
+    :param source_path: Path to CSV source file.
+    :param start_year: An integer representing the year we should start get value from.
+    :param round_precision: An integer representing decimal precision for rainfall data.
+    :param snapshot_dir: Path to folder containing snapshots.
+    :return: A RainfallStore instance.
+    """
+    key = get_snapshot_key(
+        source_path, start_year=start_year, round_precision=round_precision
+    )
+    snapshot_path = get_snapshot_path(snapshot_dir, source_path, key)
+
+    if (store := load_snapshot(snapshot_path)) is not None:
+        return store
+
+    store = RainfallStore.from_dataframe(
+        pd.read_csv(source_path),
+        start_year=start_year,
+        round_precision=round_precision,
+    )
+    save_snapshot(store, snapshot_path, source_path=source_path)
+
+    resolved_source_path = str(Path(source_path).resolve())
+    for other_snapshot_path in Path(snapshot_dir).glob(
+        f"{Path(source_path).stem}-{'?' * len(key)}"
+    ):
+        if other_snapshot_path == snapshot_path:
+            continue
+
+        # Snapshots of other parameters or of same-named files from other folders are kept.
+        metadata = load_snapshot_metadata(other_snapshot_path)
+        if (
+            metadata is not None
+            and metadata.get("source_path") == resolved_source_path
+            and metadata.get("start_year") == store.starting_year
+            and metadata.get("round_precision") == store.round_precision
+        ):
+            shutil.rmtree(other_snapshot_path, ignore_errors=True)
+
+    return store
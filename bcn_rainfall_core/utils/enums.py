@@ -35,6 +35,7 @@ class Label(str, BaseEnum):
     """
 
     YEAR = "Year"
+    MONTH = "Month"
     RAINFALL = "Rainfall"
 
 
@@ -48,6 +49,19 @@ class TimeMode(BaseEnum):
     MONTHLY = "monthly"
 
 
+class Statistic(BaseEnum):
+    """
+    An Enum listing rainfall statistics that can be queried in batch.
+    """
+
+    AVERAGE = "average"
+    NORMAL = "normal"
+    RELATIVE_DISTANCE_TO_NORMAL = "relative_distance_to_normal"
+    STANDARD_DEVIATION = "standard_deviation"
+    YEARS_BELOW_NORMAL = "years_below_normal"
+    YEARS_ABOVE_NORMAL = "years_above_normal"
+
+
 class Month(BaseEnum):
     """
     An Enum listing all months: 'January', 'February', ..., 'December'.
@@ -108,3 +122,47 @@ class Season(BaseEnum):
 
     def get_months(self):
         return self.get_months_by_season_dict()[self]
+
+
+class KMeansEngine(BaseEnum):
+    """
+    An Enum listing engines computing K-Means clustering of rainfall.
+    """
+
+    SKLEARN = "sklearn"
+    OPTIMAL_1D = "optimal_1d"
+
+
+class BootstrapStatistic(BaseEnum):
+    """
+    An Enum listing rainfall statistics whose confidence interval can be estimated by bootstrap.
+    """
+
+    AVERAGE = "average"
+    NORMAL = "normal"
+    LINEAR_REGRESSION_SLOPE = "linear_regression_slope"
+
+
+class FigureFormat(BaseEnum):
+    """
+    An Enum listing formats figures can be returned in: plotly Figure object, plotly-compatible dictionary
+    or its JSON serialization as bytes.
+    """
+
+    FIGURE = "figure"
+    SPEC = "spec"
+    JSON = "json"
+
+
+class DashboardFigure(BaseEnum):
+    """
+    An Enum listing figures of the dashboard bundle: yearly rainfall, comparisons of months or seasons
+    and years compared to normal.
+    """
+
+    YEARLY_RAINFALL = "yearly_rainfall"
+    RAINFALL_AVERAGES = "rainfall_averages"
+    LINEAR_REGRESSION_SLOPES = "linear_regression_slopes"
+    RELATIVE_DISTANCES_TO_NORMAL = "relative_distances_to_normal"
+    STANDARD_DEVIATIONS = "standard_deviations"
+    YEARS_ABOVE_AND_BELOW_NORMAL = "years_above_and_below_normal"
@@ -0,0 +1,41 @@
+"""
+Provides functions to write files atomically, so that readers never see them partially written.
+"""
+
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import BinaryIO
+
+
+def write_atomically(
+    path: str | Path,
+    write: Callable[[BinaryIO], object],
+    *,
+    mode: int | None = None,
+):
+    """
+    Write file into a temporary file of the same folder, then replace file with it.
+    Temporary file is removed if writing fails.
+
+    :param path: Path to file to write.
+    :param write: A function writing content into given binary stream.
+    :param mode: Permission bits to set on file, e.g. 0o644 (optional).
+    Temporary files are only readable and writable by owner, hence by default so is file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}-", dir=path.parent)
+    try:
+        if mode is not None:
+            os.fchmod(fd, mode)
+
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
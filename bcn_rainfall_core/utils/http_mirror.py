@@ -0,0 +1,286 @@
+"""
+Provides a class keeping local mirrors of remote datasets, revalidated with conditional HTTP requests.
+"""
+
+import hashlib
+import http.client
+import json
+import shutil
+import time
+from functools import cache
+from pathlib import Path
+from threading import Lock, Thread
+from urllib.parse import SplitResult, urljoin, urlsplit
+
+from bcn_rainfall_core.utils.custom_exceptions import DatasetDownloadError
+from bcn_rainfall_core.utils.file_operations import write_atomically
+
+MAX_REDIRECT_COUNT = 5
+CHUNK_SIZE = 1 << 16
+
+
+class DatasetMirror:
+    """
+    Keeps an atomic local copy of remote datasets in a folder.
+    - Copies younger than `max_age` seconds are served without any request.
+    - Older copies are revalidated with ETag / Last-Modified conditional requests.
+    They are served stale while being revalidated in background, unless told otherwise.
+    - Connections are kept alive and reused for every request to the same host.
+    """
+
+    def __init__(self, mirror_dir: str | Path, *, max_age=3600.0, timeout=30.0):
+        self.mirror_dir = Path(mirror_dir)
+        self.max_age = max_age
+        self.timeout = timeout
+        self._connections: dict[tuple[str, str], http.client.HTTPConnection] = {}
+        self._connection_locks: dict[tuple[str, str], Lock] = {}
+        self._url_locks: dict[str, Lock] = {}
+        self._revalidations: dict[str, Thread] = {}
+        self._lock = Lock()
+
+    def get_path(self, url: str) -> Path:
+        """
+        Retrieve path of local copy for given URL.
+
+        :param url: URL of remote dataset.
+        :return: Path to local copy, which may not exist yet.
+        """
+        name = Path(urlsplit(url).path).name or "dataset"
+        url_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
+
+        return Path(self.mirror_dir, f"{url_hash}-{name}")
+
+    def get_metadata(self, url: str) -> dict | None:
+        """
+        Retrieve metadata of local copy for given URL: ETag, Last-Modified and fetch time.
+
+        :param url: URL of remote dataset.
+        :return: A dict of metadata. None if there is no valid local copy.
+        """
+        path = self.get_path(url)
+        try:
+            with open(
+                path.with_name(f"{path.name}.json"), encoding="utf-8"
+            ) as metadata_file:
+                metadata = json.load(metadata_file)
+        except (OSError, ValueError):
+            return None
+
+        if not path.exists():
+            return None
+
+        return metadata
+
+    def fetch(self, url: str, *, stale_while_revalidate=True) -> Path:
+        """
+        Retrieve path to an up-to-date enough local copy of remote dataset, downloading it if needed.
+
+        :param url: URL of remote dataset.
+        :param stale_while_revalidate: Whether to serve an expired local copy right away while revalidating it
+        in background or to wait for revalidation. Defaults to True.
+        :return: Path to local copy.
+        :raise DatasetDownloadError: If there is no local copy and download fails.
+        """
+        path = self.get_path(url)
+        metadata = self.get_metadata(url)
+
+        if metadata is None:
+            self.revalidate(url)
+        elif time.time() - metadata["fetched_at"] >= self.max_age:
+            if stale_while_revalidate:
+                self._revalidate_in_background(url)
+            else:
+                try:
+                    self.revalidate(url)
+                except DatasetDownloadError:
+                    pass
+
+        return path
+
+    def revalidate(self, url: str) -> bool:
+        """
+        Send a conditional request for remote dataset and update local copy if it has changed.
+
+        :param url: URL of remote dataset.
+        :return: True if local copy has been downloaded, False if it was still valid.
+        :raise DatasetDownloadError: If request fails.
+        """
+        with self._get_url_lock(url):
+            metadata = self.get_metadata(url) or {}
+
+            headers = {}
+            if etag := metadata.get("etag"):
+                headers["If-None-Match"] = etag
+            if last_modified := metadata.get("last_modified"):
+                headers["If-Modified-Since"] = last_modified
+
+            try:
+                return self._request(url, headers, metadata)
+            except (OSError, http.client.HTTPException) as exc:
+                raise DatasetDownloadError(url, str(exc)) from exc
+
+    def wait_for_revalidations(self):
+        """
+        Wait for every background revalidation to be over.
+        """
+        with self._lock:
+            threads = list(self._revalidations.values())
+
+        for thread in threads:
+            thread.join()
+
+    def close(self):
+        """
+        Close every kept-alive connection.
+        """
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+
+        for connection in connections:
+            connection.close()
+
+    def _request(self, url: str, headers: dict[str, str], metadata: dict) -> bool:
+        request_url = url
+        for _ in range(MAX_REDIRECT_COUNT + 1):
+            split_url = urlsplit(request_url)
+            connection_key = (split_url.scheme, split_url.netloc)
+
+            with self._get_connection_lock(connection_key):
+                try:
+                    response = self._send(connection_key, split_url, headers)
+                    if response.status in {301, 302, 303, 307, 308}:
+                        request_url = urljoin(
+                            request_url, response.getheader("Location", "")
+                        )
+                        response.read()
+                        continue
+
+                    if response.status == 304:
+                        response.read()
+                        self._write_metadata(
+                            url, {**metadata, "fetched_at": time.time()}
+                        )
+
+                        return False
+
+                    if response.status != 200:
+                        response.read()
+                        raise DatasetDownloadError(url, f"HTTP {response.status}")
+
+                    self._write_content(url, response)
+                    self._write_metadata(
+                        url,
+                        {
+                            "etag": response.getheader("ETag"),
+                            "last_modified": response.getheader("Last-Modified"),
+                            "fetched_at": time.time(),
+                        },
+                    )
+
+                    return True
+                except (OSError, http.client.HTTPException):
+                    # Connection is left mid-request on any failure, even a timeout: never reuse it.
+                    self._drop_connection(connection_key)
+                    raise
+
+        raise DatasetDownloadError(url, "too many redirects")
+
+    def _send(
+        self,
+        connection_key: tuple[str, str],
+        split_url: SplitResult,
+        headers: dict[str, str],
+    ) -> http.client.HTTPResponse:
+        path = split_url.path or "/"
+        if split_url.query:
+            path = f"{path}?{split_url.query}"
+
+        try:
+            connection = self._get_connection(connection_key)
+            connection.request("GET", path, headers=headers)
+
+            return connection.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionError):
+            # Kept-alive connection may have been closed by server: retry once with a new one.
+            self._drop_connection(connection_key)
+
+        connection = self._get_connection(connection_key)
+        connection.request("GET", path, headers=headers)
+
+        return connection.getresponse()
+
+    def _get_connection(
+        self, connection_key: tuple[str, str]
+    ) -> http.client.HTTPConnection:
+        with self._lock:
+            if connection_key not in self._connections:
+                scheme, netloc = connection_key
+                connection_class = (
+                    http.client.HTTPSConnection
+                    if scheme == "https"
+                    else http.client.HTTPConnection
+                )
+                self._connections[connection_key] = connection_class(
+                    netloc, timeout=self.timeout
+                )
+
+            return self._connections[connection_key]
+
+    def _drop_connection(self, connection_key: tuple[str, str]):
+        with self._lock:
+            if connection := self._connections.pop(connection_key, None):
+                connection.close()
+
+    def _get_connection_lock(self, connection_key: tuple[str, str]) -> Lock:
+        with self._lock:
+            return self._connection_locks.setdefault(connection_key, Lock())
+
+    def _get_url_lock(self, url: str) -> Lock:
+        with self._lock:
+            return self._url_locks.setdefault(url, Lock())
+
+    def _revalidate_in_background(self, url: str):
+        with self._lock:
+            if (thread := self._revalidations.get(url)) and thread.is_alive():
+                return
+
+            thread = Thread(target=self._revalidate_quietly, args=(url,), daemon=True)
+            self._revalidations[url] = thread
+            thread.start()
+
+    def _revalidate_quietly(self, url: str):
+        try:
+            self.revalidate(url)
+        except DatasetDownloadError:
+            pass
+
+    def _write_content(self, url: str, response: http.client.HTTPResponse):
+        write_atomically(
+            self.get_path(url),
+            lambda f: shutil.copyfileobj(response, f, CHUNK_SIZE),
+        )
+
+    def _write_metadata(self, url: str, metadata: dict):
+        path = self.get_path(url)
+        write_atomically(
+            path.with_name(f"{path.name}.json"),
+            lambda f: f.write(json.dumps(metadata).encode()),
+        )
+
+
+@cache
+def get_dataset_mirror(
+    mirror_dir: str, *, max_age=3600.0, timeout=30.0
+) -> DatasetMirror:
+    """
+    Retrieve a process-wide DatasetMirror instance for given settings,
+    so that connections are reused across instantiations of rainfall data.
+
+    :param mirror_dir: Path to folder containing local copies.
+    :param max_age: Age in seconds under which local copies are served without revalidation.
+    :param timeout: Timeout in seconds of HTTP requests.
+    :return: A DatasetMirror instance.
+    """
+
+    return DatasetMirror(mirror_dir, max_age=max_age, timeout=timeout)
@@ -0,0 +1,124 @@
+"""
+Provides an exact and deterministic k-means clustering of one-dimensional values by dynamic programming.
+Sorted values are split into contiguous clusters minimizing the sum of squared distances to cluster averages;
+each layer of the dynamic program is solved by divide and conquer on split points,
+vectorized over every interval of a recursion level at once.
+"""
+
+from collections.abc import Callable
+
+import numpy as np
+
+
+def compute_optimal_kmeans_1d(values: np.ndarray, cluster_count: int) -> np.ndarray:
+    """
+    Cluster values into at most cluster_count clusters with an optimal k-means.
+    Clusters are labelled by increasing average value, so that labels do not depend on anything but values.
+
+    :param values: A one-dimensional NumPy array of values.
+    :param cluster_count: Maximal count of clusters; values are put in as many clusters as there are values if less.
+    :return: A NumPy array of cluster labels between 0 and cluster count - 1, one per value.
+    :raise ValueError: If cluster_count is not a positive integer.
+    """
+    if cluster_count < 1:
+        raise ValueError(
+            f"Cluster count should be a positive integer, got {cluster_count}."
+        )
+
+    values = np.asarray(values, dtype=np.float64)
+    value_count = len(values)
+    cluster_count = min(cluster_count, value_count)
+    if cluster_count == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    order = np.argsort(values, kind="stable")
+    sorted_values = values[order] - values.mean()
+
+    cumulative_sums = np.concatenate(([0.0], np.cumsum(sorted_values)))
+    cumulative_squared_sums = np.concatenate(([0.0], np.cumsum(sorted_values**2)))
+
+    def get_costs(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        Sum of squared distances to average of sorted values from starts to ends, both included.
+        """
+        counts = ends - starts + 1
+        sums = cumulative_sums[ends + 1] - cumulative_sums[starts]
+
+        return np.maximum(
+            cumulative_squared_sums[ends + 1]
+            - cumulative_squared_sums[starts]
+            - sums * sums / counts,
+            0.0,
+        )
+
+    indexes = np.arange(value_count)
+    costs = get_costs(np.zeros_like(indexes), indexes)
+    cluster_starts = np.zeros((cluster_count, value_count), dtype=np.int64)
+    for cluster_index in range(1, cluster_count):
+        costs, cluster_starts[cluster_index] = _solve_layer(
+            costs, get_costs, cluster_index, value_count
+        )
+
+    sorted_labels = np.empty(value_count, dtype=np.int64)
+    end = value_count - 1
+    for cluster_index in range(cluster_count - 1, -1, -1):
+        start = cluster_starts[cluster_index, end]
+        sorted_labels[start : end + 1] = cluster_index
+        end = start - 1
+
+    labels = np.empty(value_count, dtype=np.int64)
+    labels[order] = sorted_labels
+
+    return labels
+
+
+def _solve_layer(
+    previous_costs: np.ndarray,
+    get_costs: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    cluster_index: int,
+    value_count: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute optimal costs of splitting sorted values up to every index into cluster_index + 1 clusters,
+    along with start of last cluster, from optimal costs with one cluster less.
+    Optimal starts never decrease with index, so that each recursion level scans O(values) candidates.
+    """
+    costs = np.full(value_count, np.inf)
+    starts = np.zeros(value_count, dtype=np.int64)
+
+    # Intervals of indexes [low, high] whose optimal starts are within [start_low, start_high].
+    lows = np.array([cluster_index])
+    highs = np.array([value_count - 1])
+    start_lows = np.array([cluster_index])
+    start_highs = np.array([value_count - 1])
+    while len(lows):
+        middles = (lows + highs) // 2
+        candidate_counts = np.minimum(start_highs, middles) - start_lows + 1
+        offsets = np.concatenate(([0], np.cumsum(candidate_counts)[:-1]))
+
+        owners = np.repeat(np.arange(len(lows)), candidate_counts)
+        candidates = start_lows[owners] + np.arange(len(owners)) - offsets[owners]
+        candidate_costs = previous_costs[candidates - 1] + get_costs(
+            candidates, middles[owners]
+        )
+
+        # First candidate reaching the minimal cost of its interval.
+        best_costs = np.minimum.reduceat(candidate_costs, offsets)
+        is_best = candidate_costs == best_costs[owners]
+        best_positions = np.flatnonzero(is_best)
+        _, first_positions = np.unique(owners[best_positions], return_index=True)
+        best_starts = candidates[best_positions[first_positions]]
+
+        costs[middles] = best_costs
+        starts[middles] = best_starts
+
+        has_left = lows < middles
+        has_right = middles < highs
+        lows, highs, start_lows, start_highs = (
+            np.concatenate((lows[has_left], middles[has_right] + 1)),
+            np.concatenate((middles[has_left] - 1, highs[has_right])),
+            np.concatenate((start_lows[has_left], best_starts[has_right])),
+            np.concatenate((best_starts[has_left], start_highs[has_right])),
+        )
+
+    return costs, starts
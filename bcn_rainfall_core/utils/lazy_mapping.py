@@ -0,0 +1,68 @@
+"""
+Provides a read-only mapping whose values are built on first access and then cached.
+"""
+
+from collections.abc import Callable, Iterator, Mapping
+from threading import Lock
+from typing import TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LazyMapping(Mapping[K, V]):
+    """
+    Read-only mapping with a fixed set of keys whose values are built on demand by a factory.
+    Every value is built at most once, even when accessed concurrently from several threads.
+    """
+
+    def __init__(self, keys: list[K], factory: Callable[[K], V]):
+        self._keys = list(keys)
+        self._factory = factory
+        self._values: dict[K, V] = {}
+        self._lock = Lock()
+
+    def __getitem__(self, key: K) -> V:
+        try:
+            return self._values[key]
+        except KeyError:
+            if key not in self._keys:
+                raise
+
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = self._factory(key)
+
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(keys={self._keys}, built={list(self._values)})"
+
+    def is_built(self, key: K) -> bool:
+        """
+        Tell whether value for given key has already been built.
+
+        :param key: A key of the mapping.
+        :return: True if value is cached, False otherwise.
+        """
+        return key in self._values
+
+    def warm_up(self) -> "LazyMapping[K, V]":
+        """
+        Build every value that has not been built yet.
+
+        :return: The mapping itself, fully built.
+        """
+        for key in self._keys:
+            self[key]
+
+        return self
@@ -0,0 +1,120 @@
+"""
+Provides a closed-form least squares engine fitting linear regressions of rainfall according to year
+for many series and many year ranges at once over a RainfallStore.
+Rainfall averages come from store prefix sums; cross products and residuals are computed
+over a padded (fits x years) matrix in a single vectorized pass.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from bcn_rainfall_core.utils.rainfall_store import RainfallStore
+
+
+def fit_linear_regressions(
+    store: RainfallStore,
+    series_indexes: int | Sequence[int] | np.ndarray,
+    begin_years: int | Sequence[int] | np.ndarray,
+    end_years: int | Sequence[int] | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Fit linear regressions of rainfall according to year, one per (series, begin year, end year) triplet.
+    Arguments are broadcast against each other, e.g. many series over one range or one series over many ranges.
+    Results are the same as with scikit-learn LinearRegression, except for rounding ties:
+    predictions are rounded to store precision and R2 scores are computed against rounded predictions.
+
+    :param store: A RainfallStore instance.
+    :param series_indexes: Row index(es) of series within store series matrix.
+    :param begin_years: Integer(s) representing the year
+    to start getting our rainfall values.
+    :param end_years: Integer(s) representing the year
+    to end getting our rainfall values.
+    :return: A tuple (r2_scores, slopes, intercepts, predicted_rainfall) where predicted_rainfall
+    is a (fits x years) matrix padded with NaN after the last year of each range; slopes are not rounded.
+    R2 scores are NaN for ranges of less than 2 years; slopes and intercepts are NaN for empty ranges.
+    """
+    series_indexes, begin_years, end_years = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(series_indexes, dtype=np.int64)),
+        np.atleast_1d(np.asarray(begin_years, dtype=np.int64)),
+        np.atleast_1d(np.asarray(end_years, dtype=np.int64)),
+    )
+    starts, stops = store.get_year_bounds(begin_years, end_years)
+    lengths = stops - starts
+
+    offsets = np.arange(int(lengths.max(initial=0)))
+    in_range = offsets < lengths[:, np.newaxis]
+    columns = np.minimum(
+        starts[:, np.newaxis] + offsets, max(store.series.shape[1] - 1, 0)
+    )
+    years = np.where(in_range, store.years[columns], np.nan)
+    rainfall = np.where(
+        in_range, store.series[series_indexes[:, np.newaxis], columns], np.nan
+    )
+
+    return fit_padded_linear_regressions(
+        years,
+        rainfall,
+        store.get_average(series_indexes, begin_years, end_years),
+        round_precision=store.round_precision,
+    )
+
+
+def fit_padded_linear_regressions(
+    years: np.ndarray,
+    rainfall: np.ndarray,
+    rainfall_averages: np.ndarray,
+    *,
+    round_precision: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Fit linear regressions of rainfall according to year, one per row of (fits x years) matrices.
+    Rows may hold different years: years are NaN where a fit has no value, e.g. padding or missing years.
+
+    :param years: A (fits x years) NumPy matrix of years; NaN where a fit has no value.
+    :param rainfall: A (fits x years) NumPy matrix of rainfall values (in mm).
+    :param rainfall_averages: A NumPy array of rainfall averages of every fit.
+    :param round_precision: An integer representing decimal precision for rainfall data.
+    :return: A tuple (r2_scores, slopes, intercepts, predicted_rainfall) as with `fit_linear_regressions`.
+    """
+    in_range = ~np.isnan(years)
+    lengths = np.count_nonzero(in_range, axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        year_averages = np.where(in_range, years, 0.0).sum(axis=1) / lengths
+
+        year_deviations = np.where(in_range, years - year_averages[:, np.newaxis], 0.0)
+        rainfall_deviations = np.where(
+            in_range, rainfall - rainfall_averages[:, np.newaxis], 0.0
+        )
+        year_squared_sums = np.einsum("ij,ij->i", year_deviations, year_deviations)
+
+        # Like least squares solvers, a single year is fitted with a null slope.
+        slopes = np.where(
+            year_squared_sums != 0,
+            np.einsum("ij,ij->i", year_deviations, rainfall_deviations)
+            / year_squared_sums,
+            0.0,
+        )
+        slopes[lengths == 0] = np.nan
+        intercepts = rainfall_averages - slopes * year_averages
+
+        predicted_rainfall = np.round(
+            intercepts[:, np.newaxis] + slopes[:, np.newaxis] * years,
+            round_precision,
+        )
+
+        residual_sums = np.where(
+            in_range, np.square(rainfall - predicted_rainfall), 0.0
+        ).sum(axis=1)
+        total_sums = np.square(rainfall_deviations).sum(axis=1)
+
+        # Constant rainfall scores 1 if perfectly predicted, 0 otherwise, like scikit-learn.
+        r2_scores = np.where(
+            total_sums != 0,
+            1 - residual_sums / total_sums,
+            np.where(residual_sums == 0, 1.0, 0.0),
+        )
+        r2_scores[lengths < 2] = np.nan
+
+    return r2_scores, slopes, intercepts, predicted_rainfall
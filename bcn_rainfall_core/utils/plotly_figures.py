@@ -2,66 +2,285 @@
 Provides useful functions for plotting rainfall data in all shapes.
 """
 
-from typing import Union
+import base64
+from collections.abc import Mapping, Sequence
+from functools import cache
+from itertools import groupby
+from typing import TYPE_CHECKING, Union
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objs as go
-from plotly.basedatatypes import BaseTraceType
 from pydantic import PositiveFloat
 
 import bcn_rainfall_core.models as models
-from bcn_rainfall_core.utils import Label, TimeMode
+from bcn_rainfall_core.utils import FigureFormat, Label, Month, TimeMode, spi
+from bcn_rainfall_core.utils import rolling_statistics as rolling_stats
+from bcn_rainfall_core.utils import statistics_table as stats_table
 
-FIGURE_TYPE_TO_PLOTLY_TRACE: dict[str, type[BaseTraceType]] = {
-    "bar": go.Bar,
-    "scatter": go.Scatter,
+if TYPE_CHECKING:
+    import plotly.graph_objs as go
+
+# Figure as a plotly Figure object, as a plotly-compatible dictionary or as its JSON serialization.
+FigureOutput = Union["go.Figure", dict, bytes]
+
+FIGURE_TYPE_TO_PLOTLY_TRACE: dict[str, str] = {
+    "bar": "bar",
+    "scatter": "scatter",
+}
+
+ROLLING_STATISTIC_TO_TRACE_LABEL: dict[str, str] = {
+    rolling_stats.AVERAGE: "Moving average (mm)",
+    rolling_stats.VARIANCE: "Moving variance (mm²)",
+    rolling_stats.STANDARD_DEVIATION: "Moving standard deviation (mm)",
+    rolling_stats.LINEAR_REGRESSION_SLOPE: "Moving linear regression slope (mm/year)",
 }
 
+# Dtypes of integer typed arrays understood by plotly.js, from the narrowest one.
+TYPED_ARRAY_INTEGER_DTYPES = ("i1", "u1", "i2", "u2", "i4", "u4")
+
+# Shorter arrays are smaller as JSON lists of numbers than as typed arrays.
+TYPED_ARRAY_MIN_LENGTH = 16
+
+TEMPLATE_NAME = "bcn_rainfall"
+
+# House style of every figure, registered once as a plotly.io template on top of default one.
+TEMPLATE_LAYOUT: dict = {
+    "legend": {
+        "yanchor": "top",
+        "y": 0.99,
+        "xanchor": "left",
+        "x": 0.01,
+        "bgcolor": "rgba(35, 35, 35, 0.75)",
+    },
+    "font": {
+        "color": "#dfd0c1",
+        "family": "Khula, sans-serif",
+        "size": 11,
+    },
+    "paper_bgcolor": "#25201a",
+    "plot_bgcolor": "#422d05",
+    "margin": {"t": 75, "r": 30, "b": 45, "l": 65},
+    "yaxis": {
+        "title_standoff": 5,
+    },
+    "autosize": True,
+}
+
+
+@cache
+def get_plotly_template() -> "go.layout.Template":
+    """
+    Build house style template from default plotly template, and register it in plotly.io templates
+    under 'bcn_rainfall' name. It is built and validated once, then reused by every figure.
+
+    :return: A plotly Template object.
+    """
+    import plotly.graph_objs as go
+    import plotly.io as pio
+
+    template = go.layout.Template(pio.templates[pio.templates.default])
+    template.layout.update(TEMPLATE_LAYOUT)
+    pio.templates[TEMPLATE_NAME] = template
+
+    return template
+
+
+@cache
+def get_plotly_template_spec() -> dict:
+    """
+    Retrieve house style template as a plotly-compatible dictionary, computed once.
+    It is shared by every figure spec and should not be modified.
+
+    :return: A dictionary of template properties.
+    """
+
+    return get_plotly_template().to_plotly_json()
+
+
+def encode_typed_array(values: np.ndarray, precision: int) -> dict | np.ndarray:
+    """
+    Encode numeric array as a base64 typed array, i.e. the {'dtype': ..., 'bdata': ...} form plotly.js understands.
+    Integers are encoded with the narrowest dtype holding them all.
+    Floats are rounded to precision, then encoded as single precision floats if it keeps rounded values,
+    as double precision ones otherwise.
+
+    :param values: A NumPy array.
+    :param precision: Count of decimals to keep in floats.
+    :return: A dictionary with dtype and base64 little-endian data of typed array;
+    values as is if they are not numeric, e.g. strings or dates.
+    """
+    if values.dtype.kind in "iub":
+        dtype = "f8"
+        for integer_dtype in TYPED_ARRAY_INTEGER_DTYPES:
+            bounds = np.iinfo(integer_dtype)
+            if not len(values) or (
+                bounds.min <= values.min() and values.max() <= bounds.max
+            ):
+                dtype = integer_dtype
+                break
+    elif values.dtype.kind == "f":
+        values = np.round(values, precision)
+        dtype = (
+            "f4"
+            if np.array_equal(
+                np.round(values.astype(np.float32).astype(np.float64), precision),
+                values,
+                equal_nan=True,
+            )
+            else "f8"
+        )
+    else:
+        return values
 
-def _get_plotly_trace_by_figure_type(figure_type: str) -> type[BaseTraceType] | None:
-    return FIGURE_TYPE_TO_PLOTLY_TRACE.get(figure_type.casefold())
+    return {
+        "dtype": dtype,
+        "bdata": base64.b64encode(
+            np.ascontiguousarray(values, dtype=f"<{dtype}").tobytes()
+        ).decode("ascii"),
+    }
 
 
-def update_plotly_figure_layout(
-    figure: go.Figure,
+def build_figure(
+    traces: Sequence[dict],
     *,
     title: str,
     xaxis_title: str | None = None,
     yaxis_title: str | None = None,
     display_xaxis_range_slider=False,
-):
-    figure.update_layout(
-        title=title,
-        legend={
-            "yanchor": "top",
-            "y": 0.99,
-            "xanchor": "left",
-            "x": 0.01,
-            "bgcolor": "rgba(35, 35, 35, 0.75)",
-        },
-        font={
-            "color": "#dfd0c1",
-            "family": "Khula, sans-serif",
-            "size": 11,
-        },
-        paper_bgcolor="#25201a",
-        plot_bgcolor="#422d05",
-        margin={"t": 75, "r": 30, "b": 45, "l": 65},
-        xaxis={
-            "rangeslider_visible": display_xaxis_range_slider,
-        },
-        yaxis={
-            "title_standoff": 5,
-        },
-        autosize=True,
+    shapes: Sequence[dict] = (),
+    figure_format=FigureFormat.FIGURE,
+    binary_precision: int | None = None,
+) -> FigureOutput:
+    """
+    Assemble plotly figure in house style from plain trace dictionaries, without validating them:
+    traces should hold valid plotly properties, with NumPy arrays or lists as data.
+    Figure is either built as a plotly Figure object, or emitted as a spec without creating any plotly object;
+    spec holds the same properties in the same order, so that both serialize to the same JSON.
+
+    :param traces: Dictionaries of trace properties, each with its 'type', e.g. 'bar'.
+    :param title: A string to title figure.
+    :param xaxis_title: A string to title x-axis (optional).
+    :param yaxis_title: A string to title y-axis (optional).
+    :param display_xaxis_range_slider: Whether to display a range slider under x-axis or not.
+    Defaults to False.
+    :param shapes: Dictionaries of layout shapes properties, e.g. lines (optional).
+    :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+    :param binary_precision: If set, NumPy arrays of trace x and y values are encoded as base64 typed arrays,
+    with floats rounded to this count of decimals (optional). Arrays of less than 16 values are kept as is.
+    :return: A plotly Figure object, a plotly-compatible dictionary or its JSON serialization as bytes.
+    """
+    if binary_precision is not None:
+        traces = [
+            {
+                key: encode_typed_array(value, binary_precision)
+                if key in ("x", "y")
+                and isinstance(value, np.ndarray)
+                and len(value) >= TYPED_ARRAY_MIN_LENGTH
+                else value
+                for key, value in trace.items()
+            }
+            for trace in traces
+        ]
+
+    xaxis: dict = {"rangeslider": {"visible": display_xaxis_range_slider}}
+    if xaxis_title is not None:
+        xaxis["title"] = {"text": xaxis_title}
+
+    # Plotly Figure objects list layout arrays of objects, such as shapes, first.
+    layout: dict = {"shapes": list(shapes)} if shapes else {}
+    layout["template"] = (
+        get_plotly_template()
+        if figure_format == FigureFormat.FIGURE
+        else get_plotly_template_spec()
     )
+    layout["title"] = {"text": title}
+    layout["xaxis"] = xaxis
+    if yaxis_title is not None:
+        layout["yaxis"] = {"title": {"text": yaxis_title}}
 
-    if xaxis_title is not None:
-        figure.update_xaxes(title_text=xaxis_title)
+    if figure_format == FigureFormat.FIGURE:
+        import plotly.graph_objs as go
 
-    if yaxis_title is not None:
-        figure.update_yaxes(title_text=yaxis_title)
+        return go.Figure(data=list(traces), layout=layout, _validate=False)
+
+    # Plotly Figure objects list trace properties alphabetically, then trace type.
+    spec = {
+        "data": [
+            {
+                **{key: trace[key] for key in sorted(trace) if key != "type"},
+                "type": trace["type"],
+            }
+            for trace in traces
+        ],
+        "layout": layout,
+    }
+    if figure_format == FigureFormat.SPEC:
+        return spec
+
+    return to_json_bytes(spec)
+
+
+def to_json_bytes(figure: FigureOutput) -> bytes:
+    """
+    Serialize figure to JSON the way plotly does, whatever its format.
+
+    :param figure: A plotly Figure object, a plotly-compatible dictionary or its JSON serialization as bytes.
+    :return: JSON serialization of figure as UTF-8 bytes.
+    """
+    import plotly.io as pio
+
+    if isinstance(figure, bytes):
+        return figure
+
+    return pio.to_json(figure, validate=False).encode()
+
+
+def _get_statistics_table(
+    rainfall_instance_by_label: Mapping[str, "models.MonthlyRainfall"]
+    | Mapping[str, "models.SeasonalRainfall"],
+    *,
+    begin_year: int,
+    end_year: int,
+    normal_year: int | None = None,
+) -> pd.DataFrame:
+    """
+    Compute statistics of every instance of the mapping at once, one table per store shared by instances.
+
+    :return: A pandas DataFrame with one row per label, in the order of the mapping.
+    """
+    tables: list[pd.DataFrame] = []
+    for store, items in groupby(
+        rainfall_instance_by_label.items(), key=lambda item: item[1].store
+    ):
+        labels, rainfall_instances = zip(*items)
+        tables.append(
+            stats_table.compute_statistics_table(
+                store,
+                [
+                    rainfall_instance.series_index
+                    for rainfall_instance in rainfall_instances
+                ],
+                labels,
+                begin_year=begin_year,
+                end_year=end_year,
+                normal_year=normal_year,
+            )
+        )
+
+    if not tables:
+        return pd.DataFrame(
+            columns=[
+                stats_table.AVERAGE,
+                stats_table.NORMAL,
+                stats_table.RELATIVE_DISTANCE_TO_NORMAL,
+                stats_table.STANDARD_DEVIATION,
+                stats_table.WEIGHTED_STANDARD_DEVIATION,
+                stats_table.LINEAR_REGRESSION_SLOPE,
+                stats_table.R2_SCORE,
+            ]
+        )
+
+    return pd.concat(tables)
 
 
 def get_figure_of_column_according_to_year(
@@ -71,19 +290,23 @@ def get_figure_of_column_according_to_year(
     figure_type="bar",
     figure_label: str | None = None,
     trace_label: str | None = None,
-) -> go.Figure | None:
+    figure_format=FigureFormat.FIGURE,
+    binary_precision: int | None = None,
+) -> "FigureOutput | None":
     """
     Return plotly figure for specified column data according to year.
 
     :param yearly_rainfall: A pandas DataFrame displaying rainfall data (in mm) according to year.
     :param label: A Label enum designating the column to be displayed as bars for y-values.
-    :param figure_type: A case-insensitive string corresponding to a plotly BaseTraceType mapped in global dictionary;
-    use private function to retrieve plotly trace class.
+    :param figure_type: A case-insensitive string corresponding to a plotly trace type mapped in global dictionary.
     :param figure_label: A string to label graphic data (optional).
     If not set or set to "", label value is used.
     :param trace_label: A string to label trace data (optional).
     If not set or set to "", label value is used.
-    :return: A plotly Figure object if data has been successfully plotted, None otherwise.
+    :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+    :param binary_precision: If set, trace values are encoded as base64 typed arrays,
+    with floats rounded to this count of decimals (optional).
+    :return: A figure in requested format if data has been successfully plotted, None otherwise.
     """
     if (
         Label.YEAR not in yearly_rainfall.columns
@@ -91,136 +314,273 @@ def get_figure_of_column_according_to_year(
     ):
         return None
 
-    if plotly_trace := _get_plotly_trace_by_figure_type(figure_type):
-        figure = go.Figure(
-            plotly_trace(
-                x=yearly_rainfall[Label.YEAR.value],
-                y=yearly_rainfall[label.value],
-                name=trace_label or label.value,
-            )
-        )
-
-        update_plotly_figure_layout(
-            figure,
+    if trace_type := FIGURE_TYPE_TO_PLOTLY_TRACE.get(figure_type.casefold()):
+        return build_figure(
+            [
+                {
+                    "type": trace_type,
+                    "x": yearly_rainfall[Label.YEAR.value].to_numpy(),
+                    "y": yearly_rainfall[label.value].to_numpy(),
+                    "name": trace_label or label.value,
+                }
+            ],
             title=figure_label or label.value,
             xaxis_title=Label.YEAR.value,
             yaxis_title=label.value,
+            figure_format=figure_format,
+            binary_precision=binary_precision,
         )
 
-        return figure
-
     return None
 
 
+def get_figure_of_rolling_statistics(
+    rolling_statistics: pd.DataFrame,
+    *,
+    window: int,
+    statistics: Sequence[str],
+    figure_label: str | None = None,
+    figure_format=FigureFormat.FIGURE,
+    binary_precision: int | None = None,
+) -> "FigureOutput | None":
+    """
+    Return plotly figure displaying rolling statistics according to the first year of each window, one line per statistic.
+
+    :param rolling_statistics: A pandas DataFrame with a year column and one column per rolling statistic.
+    :param window: Count of years of each window.
+    :param statistics: Names of statistics to plot, among
+    ['average', 'variance', 'standard_deviation', 'linear_regression_slope'].
+    :param figure_label: A string to label graphic data (optional).
+    :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+    :param binary_precision: If set, trace values are encoded as base64 typed arrays,
+    with floats rounded to this count of decimals (optional).
+    :return: A figure in requested format if data has been successfully plotted, None otherwise.
+    """
+    if (
+        not statistics
+        or Label.YEAR not in rolling_statistics.columns
+        or any(
+            statistic not in rolling_statistics.columns
+            or statistic not in ROLLING_STATISTIC_TO_TRACE_LABEL
+            for statistic in statistics
+        )
+    ):
+        return None
+
+    years = rolling_statistics[Label.YEAR.value].to_numpy()
+
+    return build_figure(
+        [
+            {
+                "type": "scatter",
+                "x": years,
+                "y": rolling_statistics[statistic].to_numpy(),
+                "name": ROLLING_STATISTIC_TO_TRACE_LABEL[statistic],
+            }
+            for statistic in statistics
+        ],
+        title=figure_label or f"{window} years rolling statistics",
+        xaxis_title=f"First year of {window} years window",
+        yaxis_title=ROLLING_STATISTIC_TO_TRACE_LABEL[statistics[0]]
+        if len(statistics) == 1
+        else None,
+        display_xaxis_range_slider=True,
+        figure_format=figure_format,
+        binary_precision=binary_precision,
+    )
+
+
+def get_figure_of_spi(
+    spi_data: pd.DataFrame,
+    *,
+    scales: Sequence[int],
+    figure_label: str | None = None,
+    figure_format=FigureFormat.FIGURE,
+    binary_precision: int | None = None,
+) -> "FigureOutput | None":
+    """
+    Return plotly figure displaying Standardized Precipitation Index according to month, one line per time scale,
+    with dotted lines at thresholds of moderate, severe and extreme drought.
+
+    :param spi_data: A pandas DataFrame with year and month columns and one SPI column per scale.
+    :param scales: Counts of months of time scales to plot.
+    :param figure_label: A string to label graphic data (optional).
+    :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+    :param binary_precision: If set, trace values are encoded as base64 typed arrays,
+    with floats rounded to this count of decimals (optional).
+    :return: A figure in requested format if data has been successfully plotted, None otherwise.
+    """
+    if (
+        not scales
+        or spi_data.empty
+        or any(spi.get_spi_column(scale) not in spi_data.columns for scale in scales)
+    ):
+        return None
+
+    month_ranks = {month.value: month.get_rank() for month in Month}
+    dates = np.datetime_as_string(
+        pd.to_datetime(
+            pd.DataFrame(
+                {
+                    "year": spi_data[Label.YEAR.value],
+                    "month": spi_data[Label.MONTH.value].map(month_ranks),
+                    "day": 1,
+                }
+            )
+        ).to_numpy(),
+        unit="s",
+    )
+
+    return build_figure(
+        [
+            {
+                "type": "scatter",
+                "x": dates,
+                "y": spi_data[spi.get_spi_column(scale)].to_numpy(),
+                "name": f"SPI-{scale}",
+            }
+            for scale in scales
+        ],
+        title=figure_label or "Standardized Precipitation Index",
+        xaxis_title="Month",
+        yaxis_title="SPI",
+        display_xaxis_range_slider=True,
+        shapes=[
+            {
+                "type": "line",
+                "xref": "x domain",
+                "x0": 0,
+                "x1": 1,
+                "yref": "y",
+                "y0": threshold,
+                "y1": threshold,
+                "line": {"dash": "dot", "color": "#dfd0c1"},
+            }
+            for threshold in spi.DROUGHT_THRESHOLDS
+        ],
+        figure_format=figure_format,
+        binary_precision=binary_precision,
+    )
+
+
 def get_bar_figure_of_rainfall_averages(
-    rainfall_instance_by_label: dict[str, "models.MonthlyRainfall"]
-    | dict[str, "models.SeasonalRainfall"],
+    rainfall_instance_by_label: Mapping[str, "models.MonthlyRainfall"]
+    | Mapping[str, "models.SeasonalRainfall"],
     *,
     time_mode: TimeMode,
     begin_year: int,
     end_year: int,
-) -> go.Figure:
+    figure_format=FigureFormat.FIGURE,
+    binary_precision: int | None = None,
+    table: pd.DataFrame | None = None,
+) -> FigureOutput:
     """
-    Return plotly bar figure displaying average rainfall for each month or for each season passed through the dict.
+    Return plotly bar figure displaying average rainfall for each month or for each season passed through the mapping.
 
-    :param rainfall_instance_by_label: A dict of months respectively mapped with instances of MonthlyRainfall
-    or a dict of seasons respectively mapped with instances of SeasonalRainfall.
+    :param rainfall_instance_by_label: A mapping of months respectively mapped with instances of MonthlyRainfall
+    or a mapping of seasons respectively mapped with instances of SeasonalRainfall.
     To be purposeful, all instances should have the same time frame in years.
     :param time_mode: A TimeMode Enum: ['monthly', 'seasonal'].
     :param begin_year: An integer representing the year
     to start getting our rainfall values.
     :param end_year: An integer representing the year
     to end getting our rainfall values.
-    :return: A plotly Figure object of the rainfall averages for each month or for each season.
+    :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+    :param binary_precision: If set, trace values are encoded as base64 typed arrays,
+    with floats rounded to this count of decimals (optional).
+    :param table: Statistics table of instances computed beforehand, e.g. to share it between figures (optional).
+    :return: A figure in requested format of the rainfall averages for each month or for each season.
     """
-    labels: list[str] = []
-    averages: list[float] = []
-    for label, rainfall_instance in rainfall_instance_by_label.items():
-        labels.append(label)
-
-        averages.append(
-            rainfall_instance.get_average_yearly_rainfall(begin_year, end_year)
+    if table is None:
+        table = _get_statistics_table(
+            rainfall_instance_by_label, begin_year=begin_year, end_year=end_year
         )
 
-    figure = go.Figure(go.Bar(x=labels, y=averages, name=time_mode.value.capitalize()))
-
-    update_plotly_figure_layout(
-        figure,
+    return build_figure(
+        [
+            {
+                "type": "bar",
+                "x": table.index.tolist(),
+                "y": table[stats_table.AVERAGE].to_numpy(),
+                "name": time_mode.value.capitalize(),
+            }
+        ],
         title=f"Average rainfall (mm) between {begin_year} and {end_year}",
         xaxis_title=time_mode.value.capitalize()[:-2],
         yaxis_title=Label.RAINFALL.value,
+        figure_format=figure_format,
+        binary_precision=binary_precision,
     )
 
-    return figure
-
 
 def get_bar_figure_of_rainfall_linreg_slopes(
-    rainfall_instance_by_label: dict[str, "models.MonthlyRainfall"]
-    | dict[str, "models.SeasonalRainfall"],
+    rainfall_instance_by_label: Mapping[str, "models.MonthlyRainfall"]
+    | Mapping[str, "models.SeasonalRainfall"],
     *,
     time_mode: TimeMode,
     begin_year: int,
     end_year: int,
-) -> go.Figure:
+    figure_format=FigureFormat.FIGURE,
+    binary_precision: int | None = None,
+    table: pd.DataFrame | None = None,
+) -> FigureOutput:
     """
     Return plotly bar figure displaying rainfall linear regression slopes for each month or
-    for each season passed through the dict.
+    for each season passed through the mapping.
 
-    :param rainfall_instance_by_label: A dict of months respectively mapped with instances of MonthlyRainfall
-    or a dict of seasons respectively mapped with instances of SeasonalRainfall.
+    :param rainfall_instance_by_label: A mapping of months respectively mapped with instances of MonthlyRainfall
+    or a mapping of seasons respectively mapped with instances of SeasonalRainfall.
     :param time_mode: A TimeMode Enum: ['monthly', 'seasonal'].
     :param begin_year: An integer representing the year
     to start getting our rainfall values.
     :param end_year: An integer representing the year
     to end getting our rainfall values.
-    :return: A plotly Figure object of the rainfall LinReg slopes for each month.
+    :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+    :param binary_precision: If set, trace values are encoded as base64 typed arrays,
+    with floats rounded to this count of decimals (optional).
+    :param table: Statistics table of instances computed beforehand, e.g. to share it between figures (optional).
+    :return: A figure in requested format of the rainfall LinReg slopes for each month.
     """
-    labels: list[str] = []
-    slopes: list[float] = []
-    r2_scores: list[float] = []
-    for label, rainfall_instance in rainfall_instance_by_label.items():
-        labels.append(label)
-
-        (r2_score, slope), _ = rainfall_instance.get_linear_regression(
-            begin_year, end_year
-        )
-
-        slopes.append(slope)
-        r2_scores.append(r2_score)
-
-    figure = go.Figure(
-        go.Bar(
-            x=labels,
-            y=slopes,
-            name=time_mode.value.capitalize(),
+    if table is None:
+        table = _get_statistics_table(
+            rainfall_instance_by_label, begin_year=begin_year, end_year=end_year
         )
-    )
 
-    update_plotly_figure_layout(
-        figure,
+    return build_figure(
+        [
+            {
+                "type": "bar",
+                "x": table.index.tolist(),
+                "y": table[stats_table.LINEAR_REGRESSION_SLOPE].to_numpy(),
+                "name": time_mode.value.capitalize(),
+            }
+        ],
         title=f"Linear regression slope (mm/year) between {begin_year} and {end_year}",
         xaxis_title=time_mode.value.capitalize()[:-2],
         yaxis_title="Linear regression slope (mm/year)",
+        figure_format=figure_format,
+        binary_precision=binary_precision,
     )
 
-    return figure
-
 
 def get_bar_figure_of_relative_distances_to_normal(
-    rainfall_instance_by_label: dict[str, "models.MonthlyRainfall"]
-    | dict[str, "models.SeasonalRainfall"],
+    rainfall_instance_by_label: Mapping[str, "models.MonthlyRainfall"]
+    | Mapping[str, "models.SeasonalRainfall"],
     *,
     time_mode: TimeMode,
     normal_year: int,
     begin_year: int,
     end_year: int,
-) -> go.Figure:
+    figure_format=FigureFormat.FIGURE,
+    binary_precision: int | None = None,
+    table: pd.DataFrame | None = None,
+) -> FigureOutput:
     """
     Return plotly bar figure displaying relative distances to normal for each month or
-    for each season passed through the dict.
+    for each season passed through the mapping.
 
-    :param rainfall_instance_by_label: A dict of months respectively mapped with instances of MonthlyRainfall
-    or a dict of seasons respectively mapped with instances of SeasonalRainfall.
+    :param rainfall_instance_by_label: A mapping of months respectively mapped with instances of MonthlyRainfall
+    or a mapping of seasons respectively mapped with instances of SeasonalRainfall.
     :param time_mode: A TimeMode Enum: ['monthly', 'seasonal'].
     :param normal_year: An integer representing the year
     to start computing the 30 years normal of the rainfall.
@@ -228,50 +588,54 @@ def get_bar_figure_of_relative_distances_to_normal(
     to start getting our rainfall values.
     :param end_year: An integer representing the year
     to end getting our rainfall values.
-    :return: A plotly Figure object of the rainfall relative distances to normal for each month or for each season.
+    :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+    :param binary_precision: If set, trace values are encoded as base64 typed arrays,
+    with floats rounded to this count of decimals (optional).
+    :param table: Statistics table of instances computed beforehand with normal year, e.g. to share it
+    between figures (optional).
+    :return: A figure in requested format of the rainfall relative distances to normal for each month or for each season.
     """
-    labels: list[str] = []
-    relative_distances_to_normal: list[float | None] = []
-    for label, rainfall_instance in rainfall_instance_by_label.items():
-        labels.append(label)
-        relative_distances_to_normal.append(
-            rainfall_instance.get_relative_distance_to_normal(
-                normal_year, begin_year, end_year
-            )
-        )
-
-    figure = go.Figure(
-        go.Bar(
-            x=labels,
-            y=relative_distances_to_normal,
-            name=time_mode.value.capitalize(),
+    if table is None:
+        table = _get_statistics_table(
+            rainfall_instance_by_label,
+            begin_year=begin_year,
+            end_year=end_year,
+            normal_year=normal_year,
         )
-    )
-
-    update_plotly_figure_layout(
-        figure,
+    return build_figure(
+        [
+            {
+                "type": "bar",
+                "x": table.index.tolist(),
+                "y": table[stats_table.RELATIVE_DISTANCE_TO_NORMAL].to_numpy(),
+                "name": time_mode.value.capitalize(),
+            }
+        ],
         title=f"Relative distance to {normal_year}-{normal_year + 29} normal between {begin_year} and {end_year} (%)",
         xaxis_title=time_mode.value.capitalize()[:-2],
         yaxis_title="Relative distance to normal (%)",
+        figure_format=figure_format,
+        binary_precision=binary_precision,
     )
 
-    return figure
-
 
 def get_bar_figure_of_standard_deviations(
-    rainfall_instance_by_label: dict[str, "models.MonthlyRainfall"]
-    | dict[str, "models.SeasonalRainfall"],
+    rainfall_instance_by_label: Mapping[str, "models.MonthlyRainfall"]
+    | Mapping[str, "models.SeasonalRainfall"],
     *,
     time_mode: TimeMode,
     begin_year: int,
     end_year: int,
     weigh_by_average=False,
-) -> go.Figure:
+    figure_format=FigureFormat.FIGURE,
+    binary_precision: int | None = None,
+    table: pd.DataFrame | None = None,
+) -> FigureOutput:
     """
-    Return plotly bar figure displaying standard deviations for each month or for each season passed through the dict.
+    Return plotly bar figure displaying standard deviations for each month or for each season passed through the mapping.
 
-    :param rainfall_instance_by_label: A dict of months respectively mapped with instances of MonthlyRainfall
-    or a dict of seasons respectively mapped with instances of SeasonalRainfall.
+    :param rainfall_instance_by_label: A mapping of months respectively mapped with instances of MonthlyRainfall
+    or a mapping of seasons respectively mapped with instances of SeasonalRainfall.
     :param time_mode: A TimeMode Enum: ['monthly', 'seasonal'].
     :param begin_year: An integer representing the year
     to start getting our rainfall values.
@@ -279,39 +643,39 @@ def get_bar_figure_of_standard_deviations(
     to end getting our rainfall values.
     :param bool weigh_by_average: Whether to divide standard deviation by average or not (optional).
     Defaults to False.
-    :return: A plotly Figure object of the rainfall standard deviations for each month or for each season.
+    :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+    :param binary_precision: If set, trace values are encoded as base64 typed arrays,
+    with floats rounded to this count of decimals (optional).
+    :param table: Statistics table of instances computed beforehand, e.g. to share it between figures (optional).
+    :return: A figure in requested format of the rainfall standard deviations for each month or for each season.
     """
-    labels: list[str] = []
-    standard_deviations: list[float | None] = []
-    for label, rainfall_instance in rainfall_instance_by_label.items():
-        labels.append(label)
-
-        standard_deviation = rainfall_instance.get_rainfall_standard_deviation(
-            begin_year, end_year, weigh_by_average=weigh_by_average
-        )
-        if weigh_by_average:
-            standard_deviation *= 100
-
-        standard_deviations.append(standard_deviation)
-
-    figure = go.Figure(
-        go.Bar(
-            x=labels,
-            y=standard_deviations,
-            name=time_mode.value.capitalize(),
+    if table is None:
+        table = _get_statistics_table(
+            rainfall_instance_by_label, begin_year=begin_year, end_year=end_year
         )
-    )
+    if weigh_by_average:
+        standard_deviations = table[stats_table.WEIGHTED_STANDARD_DEVIATION] * 100
+    else:
+        standard_deviations = table[stats_table.STANDARD_DEVIATION]
 
     title_suffix = "weighted by average (%)" if weigh_by_average else "(mm)"
-    update_plotly_figure_layout(
-        figure,
+
+    return build_figure(
+        [
+            {
+                "type": "bar",
+                "x": table.index.tolist(),
+                "y": standard_deviations.to_numpy(),
+                "name": time_mode.value.capitalize(),
+            }
+        ],
         title=f"Standard deviations between {begin_year} and {end_year} {title_suffix}",
         xaxis_title=time_mode.value.capitalize()[:-2],
         yaxis_title=f"Standard deviation {title_suffix}",
+        figure_format=figure_format,
+        binary_precision=binary_precision,
     )
 
-    return figure
-
 
 def get_pie_figure_of_years_above_and_below_normal(
     rainfall_instance: Union[
@@ -327,7 +691,8 @@ def get_pie_figure_of_years_above_and_below_normal(
         120,
         float("inf"),
     ),
-) -> go.Figure | None:
+    figure_format=FigureFormat.FIGURE,
+) -> "FigureOutput | None":
     """
     Return plotly pie figure displaying the percentage of years above and below normal for the given time mode,
     between the given years, and for the normal computed from the given year.
@@ -346,32 +711,25 @@ def get_pie_figure_of_years_above_and_below_normal(
     3. Between 100 and 150 of normal rainfall.
     4. Above 150 % of normal rainfall.
     Defaults to (0, 80, 120, float("inf")).
-    :return: A plotly Figure object of the percentage of years above and below normal as a pie chart.
+    :param figure_format: A FigureFormat Enum: ['figure', 'spec', 'json']. Defaults to 'figure'.
+    :return: A figure in requested format of the percentage of years above and below normal as a pie chart.
     None if percentages_of_normal tuple has less than 2 values;
     """
+    from plotly.colors import sequential
+
     if len(percentages_of_normal) < 2:
         return None
 
     sorted_percentages_of_normal = sorted(percentages_of_normal)
 
-    values: list[float] = []
+    values, _ = rainfall_instance.classify_years_by_percentages_of_normal(
+        normal_year, begin_year, end_year, percentages=sorted_percentages_of_normal
+    )
     labels: list[str] = []
     for idx in range(len(sorted_percentages_of_normal) - 1):
         percentage_1 = sorted_percentages_of_normal[idx]
         percentage_2 = sorted_percentages_of_normal[idx + 1]
 
-        values.append(
-            rainfall_instance.get_years_between_two_percentages_of_normal(
-                normal_year,
-                begin_year,
-                end_year,
-                percentages=(
-                    percentage_1,
-                    percentage_2,
-                ),
-            )
-        )
-
         if percentage_1 == 0 and percentage_2 < float("inf"):
             label = f"Years below {percentage_2}% of normal"
         elif percentage_1 > 0 and percentage_2 == float("inf"):
@@ -390,24 +748,22 @@ def get_pie_figure_of_years_above_and_below_normal(
         figure_title = f"{figure_title} for {rainfall_instance.season.value}"
         figure_label = f"{figure_label} for {rainfall_instance.season.value}"
 
-    figure = go.Figure(
-        go.Pie(
-            labels=labels,
-            values=values,
-            name=figure_label,
-            marker={
-                "colors": px.colors.sequential.Blues[::2]
-                if len(values) <= 6
-                else px.colors.sequential.Blues
-            },
-            scalegroup="one",
-            sort=False,
-        ),
-    )
-
-    update_plotly_figure_layout(
-        figure,
+    return build_figure(
+        [
+            {
+                "type": "pie",
+                "labels": labels,
+                "values": values,
+                "name": figure_label,
+                "marker": {
+                    "colors": sequential.Blues[::2]
+                    if len(values) <= 6
+                    else sequential.Blues
+                },
+                "scalegroup": "one",
+                "sort": False,
+            }
+        ],
         title=figure_title,
+        figure_format=figure_format,
     )
-
-    return figure
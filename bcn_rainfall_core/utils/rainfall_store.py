@@ -0,0 +1,583 @@
+"""
+Provides a class owning rainfall data as NumPy arrays, shared by every rainfall entity.
+Yearly, monthly and seasonal series are all derived once from a single (years x months) matrix.
+"""
+
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from bcn_rainfall_core.utils.custom_exceptions import DataFormatError
+from bcn_rainfall_core.utils.enums import Label, Month, Season
+
+YEARLY_SERIES_INDEX = 0
+SERIES_COUNT = 1 + len(Month) + len(Season)
+ARRAY_NAMES = (
+    "raw_years",
+    "raw_rainfall",
+    "series",
+    "cumulative_sums",
+    "series_references",
+    "cumulative_deviations",
+    "cumulative_squared_deviations",
+)
+CUMULATIVE_ARRAY_NAMES = (
+    "cumulative_sums",
+    "cumulative_deviations",
+    "cumulative_squared_deviations",
+)
+MIN_CAPACITY = 16
+YEAR_MONTH_RANKS = list(range(1, len(Month) + 1))
+SEASON_MONTH_RANKS = [
+    [month.get_rank() for month in season.get_months()] for season in Season
+]
+SERIES_INDEX_BY_MONTH = {month: month.get_rank() for month in Month}
+SERIES_INDEX_BY_SEASON = {
+    season: 1 + len(Month) + season_index for season_index, season in enumerate(Season)
+}
+
+
+class RainfallStore:
+    """
+    Owns raw rainfall data as a contiguous (years x months) NumPy matrix with its year vector.
+    It derives the 17 rainfall series (1 yearly, 12 monthly and 4 seasonal) as rows of one matrix
+    so that every entity is a thin view over it.
+    Cumulative sums of every series are indexed so that moments over any year range cost two lookups.
+    Years can be upserted in place: arrays grow by doubling their capacity
+    and only indexes from the updated year onward are recomputed.
+    """
+
+    def __init__(
+        self,
+        years: np.ndarray,
+        monthly_rainfall: np.ndarray,
+        *,
+        start_year: int,
+        round_precision: int,
+        columns: list[str] | None = None,
+    ):
+        if monthly_rainfall.ndim != 2 or monthly_rainfall.shape != (
+            len(years),
+            len(Month),
+        ):
+            raise DataFormatError("[Year, Jan_rain, Feb_rain, ..., Dec_rain] (matrix)")
+
+        order = np.argsort(years, kind="stable")
+        self.raw_years = np.ascontiguousarray(years[order], dtype=np.int64)
+        self.raw_rainfall = np.ascontiguousarray(
+            monthly_rainfall[order], dtype=np.float64
+        )
+        self.columns = columns or [Label.YEAR.value] + Month.values()
+        self.starting_year = start_year
+        self.round_precision = round_precision
+        self.start_index = int(np.searchsorted(self.raw_years, start_year))
+        self.series = self._compute_series()
+        self._index_series()
+        self.version = 0
+        self._buffers: dict[str, np.ndarray] | None = None
+
+    @classmethod
+    def from_dataframe(
+        cls, raw_data: pd.DataFrame, *, start_year: int, round_precision: int
+    ) -> "RainfallStore":
+        """
+        Build store from a pandas DataFrame shaped as rainfall values for each month according to year.
+
+        :param raw_data: A pandas DataFrame with 13 columns: 1 for the year; 12 for every monthly rainfall.
+        :param start_year: An integer representing the year we should start get value from.
+        :param round_precision: An integer representing decimal precision for rainfall data.
+        :return: A RainfallStore instance.
+        :raise DataFormatError: If raw_data doesn't have exactly 13 columns.
+        """
+        if not isinstance(raw_data, pd.DataFrame) or len(raw_data.columns) != 1 + len(
+            Month
+        ):
+            raise DataFormatError(
+                "[Year, Jan_rain, Feb_rain, ..., Dec_rain] (pandas DataFrame)"
+            )
+
+        return cls(
+            raw_data.iloc[:, 0].to_numpy(dtype=np.int64),
+            raw_data.iloc[:, 1:].to_numpy(dtype=np.float64),
+            start_year=start_year,
+            round_precision=round_precision,
+            columns=[str(column) for column in raw_data.columns],
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        arrays: Mapping[str, np.ndarray],
+        *,
+        start_year: int,
+        round_precision: int,
+        columns: list[str],
+    ) -> "RainfallStore":
+        """
+        Rebuild store from arrays exported with `get_arrays`, without computing anything.
+        Arrays are used as is, so they can be memory-mapped.
+
+        :param arrays: A mapping of every array named in ARRAY_NAMES.
+        :param start_year: An integer representing the year we should start get value from.
+        :param round_precision: An integer representing decimal precision for rainfall data.
+        :param columns: Names of raw data columns.
+        :return: A RainfallStore instance.
+        :raise DataFormatError: If arrays are missing or inconsistently shaped.
+        """
+        if any(name not in arrays for name in ARRAY_NAMES) or arrays[
+            "series"
+        ].shape != (
+            SERIES_COUNT,
+            len(arrays["cumulative_sums"][0]) - 1,
+        ):
+            raise DataFormatError(f"Arrays named {ARRAY_NAMES}")
+
+        store = cls.__new__(cls)
+        for name in ARRAY_NAMES:
+            setattr(store, name, arrays[name])
+
+        store.columns = columns
+        store.starting_year = start_year
+        store.round_precision = round_precision
+        store.rainfall_scale = 10.0**round_precision
+        store.start_index = int(np.searchsorted(store.raw_years, start_year))
+        store.version = 0
+        store._buffers = None
+
+        return store
+
+    def get_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Export raw data, derived series and their indexes as arrays.
+
+        :return: A dict of every array named in ARRAY_NAMES.
+        """
+
+        return {name: getattr(self, name) for name in ARRAY_NAMES}
+
+    @property
+    def raw_data(self) -> pd.DataFrame:
+        """
+        Raw data rebuilt as a pandas DataFrame: rainfall values for each month according to year.
+        It is a copy, so that modifying it leaves store untouched.
+        """
+        raw_data = pd.DataFrame(self.raw_rainfall, columns=self.columns[1:], copy=True)
+        raw_data.insert(0, self.columns[0], self.raw_years)
+
+        return raw_data
+
+    @property
+    def years(self) -> np.ndarray:
+        """
+        Years starting from store starting year, as a view over raw years.
+        """
+        return self.raw_years[self.start_index :]
+
+    @staticmethod
+    def get_series_index(
+        *, month: Month | None = None, season: Season | None = None
+    ) -> int:
+        """
+        Retrieve index of rainfall series for given month or season; yearly series if none is given.
+
+        :param month: A Month Enum: ['January', 'February', ..., 'December'] (optional).
+        :param season: A Season Enum: ['winter', 'spring', 'summer', 'fall'] (optional).
+        :return: Row index of series within series matrix.
+        """
+        if month is not None:
+            return SERIES_INDEX_BY_MONTH[month]
+
+        if season is not None:
+            return SERIES_INDEX_BY_SEASON[season]
+
+        return YEARLY_SERIES_INDEX
+
+    def compute_rainfall(
+        self, start_month: Month, end_month: Month | None = None
+    ) -> np.ndarray:
+        """
+        Compute rounded rainfall summed between two months for every year from starting year.
+        Months are summed one after the other to match pandas column-wise summation.
+
+        :param start_month: A Month Enum representing the month
+        to start getting our rainfall values.
+        :param end_month: A Month Enum representing the month
+        to end getting our rainfall values (optional).
+        If not given, we compute rainfall only for given start_month.
+        :return: A NumPy array of rainfall values (in mm) according to year.
+        """
+        start_rank = start_month.get_rank()
+        end_rank = end_month.get_rank() if end_month else start_rank
+        if end_rank < start_rank:
+            ranks = [start_rank, *range(1, end_rank + 1)]
+        else:
+            ranks = list(range(start_rank, end_rank + 1))
+
+        rainfall = self._sum_months(
+            np.nan_to_num(self.raw_rainfall[self.start_index :]), ranks
+        )
+
+        return np.round(rainfall, self.round_precision, out=rainfall)
+
+    @classmethod
+    def compute_series(
+        cls, raw_rainfall: np.ndarray, *, round_precision: int
+    ) -> np.ndarray:
+        """
+        Compute rounded yearly, monthly and seasonal rainfall series from rows of monthly rainfall.
+        Missing months count as no rainfall.
+
+        :param raw_rainfall: A (years x months) NumPy matrix of rainfall values (in mm).
+        :param round_precision: An integer representing decimal precision for rainfall data.
+        :return: A (series x years) NumPy matrix of rainfall values (in mm).
+        """
+        monthly_rainfall = np.nan_to_num(raw_rainfall)
+
+        series = np.empty((SERIES_COUNT, len(monthly_rainfall)))
+        series[YEARLY_SERIES_INDEX] = cls._sum_months(
+            monthly_rainfall, YEAR_MONTH_RANKS
+        )
+        series[1 : 1 + len(Month)] = monthly_rainfall.T
+        for season_index, ranks in enumerate(SEASON_MONTH_RANKS, start=1 + len(Month)):
+            series[season_index] = cls._sum_months(monthly_rainfall, ranks)
+
+        return np.round(series, round_precision, out=series)
+
+    def get_year_bounds(
+        self, begin_year: int | np.ndarray, end_year: int | np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Retrieve bounds of series columns for years within year ranges.
+        Accepts scalars or arrays of years to resolve many ranges at once.
+
+        :param begin_year: Integer(s) representing the year
+        to start getting our rainfall values.
+        :param end_year: Integer(s) representing the year
+        to end getting our rainfall values (optional).
+        :return: A tuple (starts, stops) of column indexes; stops are excluded.
+        """
+
+        return self.search_year_bounds(self.years, begin_year, end_year)
+
+    @staticmethod
+    def search_year_bounds(
+        years: np.ndarray,
+        begin_year: int | np.ndarray,
+        end_year: int | np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Search bounds of sorted years within year ranges.
+
+        :param years: A sorted NumPy array of years.
+        :param begin_year: Integer(s) representing the year
+        to start getting our rainfall values.
+        :param end_year: Integer(s) representing the year
+        to end getting our rainfall values (optional).
+        :return: A tuple (starts, stops) of indexes within years; stops are excluded.
+        """
+        starts = np.searchsorted(years, begin_year, side="left")
+        if end_year is None:
+            return starts, np.full_like(starts, len(years))
+
+        return starts, np.maximum(
+            starts, np.searchsorted(years, end_year, side="right")
+        )
+
+    def get_year_slice(self, begin_year: int, end_year: int | None = None) -> slice:
+        """
+        Retrieve slice of series columns for years within a specific year range.
+
+        :param begin_year: An integer representing the year
+        to start getting our rainfall values.
+        :param end_year: An integer representing the year
+        to end getting our rainfall values (optional).
+        :return: A slice to apply on years or on series columns.
+        """
+        start, stop = self.get_year_bounds(begin_year, end_year)
+
+        return slice(int(start), int(stop))
+
+    def get_moments(
+        self,
+        series_index: int | np.ndarray,
+        begin_year: int | np.ndarray,
+        end_year: int | np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Retrieve count, sum and sum of squares of rainfall deviations from series reference
+        within year ranges, with two lookups in cumulative sums.
+        Accepts scalars or broadcastable arrays to resolve many queries at once.
+
+        :param series_index: Row index(es) of series within series matrix.
+        :param begin_year: Integer(s) representing the year
+        to start getting our rainfall values.
+        :param end_year: Integer(s) representing the year
+        to end getting our rainfall values (optional).
+        :return: A tuple (counts, deviation_sums, squared_deviation_sums).
+        """
+        starts, stops = self.get_year_bounds(begin_year, end_year)
+
+        return (
+            stops - starts,
+            self.cumulative_deviations[series_index, stops]
+            - self.cumulative_deviations[series_index, starts],
+            self.cumulative_squared_deviations[series_index, stops]
+            - self.cumulative_squared_deviations[series_index, starts],
+        )
+
+    def get_average(
+        self,
+        series_index: int | np.ndarray,
+        begin_year: int | np.ndarray,
+        end_year: int | np.ndarray | None = None,
+        *,
+        round_precision: int | None = None,
+    ) -> np.ndarray:
+        """
+        Compute rainfall average within year ranges; NaN for empty ranges.
+        Sums are exact since they are indexed on rainfall scaled to integers by store precision,
+        so that rounding ties are always resolved the same way.
+
+        :param series_index: Row index(es) of series within series matrix.
+        :param begin_year: Integer(s) representing the year
+        to start getting our rainfall values.
+        :param end_year: Integer(s) representing the year
+        to end getting our rainfall values (optional).
+        :param round_precision: Decimal precision to round averages to (optional).
+        :return: Average(s) as a NumPy float or array.
+        """
+        starts, stops = self.get_year_bounds(begin_year, end_year)
+        sums = (
+            self.cumulative_sums[series_index, stops]
+            - self.cumulative_sums[series_index, starts]
+        )
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            averages = sums / (stops - starts)
+
+        if round_precision is not None:
+            averages = np.round(averages, round_precision - self.round_precision)
+
+        return averages / self.rainfall_scale
+
+    def get_variance(
+        self,
+        series_index: int | np.ndarray,
+        begin_year: int | np.ndarray,
+        end_year: int | np.ndarray | None = None,
+        *,
+        ddof=1,
+    ) -> np.ndarray:
+        """
+        Compute rainfall variance within year ranges; NaN if ranges are too short.
+
+        :param series_index: Row index(es) of series within series matrix.
+        :param begin_year: Integer(s) representing the year
+        to start getting our rainfall values.
+        :param end_year: Integer(s) representing the year
+        to end getting our rainfall values (optional).
+        :param ddof: Delta degrees of freedom. Defaults to 1, like pandas.
+        :return: Variance(s) as a NumPy float or array.
+        """
+        counts, sums, squared_sums = self.get_moments(
+            series_index, begin_year, end_year
+        )
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            variances = np.maximum(squared_sums - sums * sums / counts, 0.0) / (
+                counts - ddof
+            )
+
+        return np.where(counts > ddof, variances, np.nan)
+
+    def get_rainfall(
+        self, series_index: int, begin_year: int, end_year: int | None = None
+    ) -> np.ndarray:
+        """
+        Retrieve rainfall values of a series within a specific year range.
+
+        :param series_index: Row index of series within series matrix.
+        :param begin_year: An integer representing the year
+        to start getting our rainfall values.
+        :param end_year: An integer representing the year
+        to end getting our rainfall values (optional).
+        :return: A NumPy array view of rainfall values (in mm).
+        """
+
+        return self.series[series_index, self.get_year_slice(begin_year, end_year)]
+
+    def upsert_year(
+        self, year: int, monthly_rainfall: Sequence[float | None] | np.ndarray
+    ) -> bool:
+        """
+        Insert or replace rainfall values of every month for given year.
+        Derived series and their indexes are updated in place from that year onward,
+        so that updating the last year costs constant time.
+
+        :param year: An integer representing the year to upsert.
+        :param monthly_rainfall: 12 rainfall values (in mm) from January to December; None or NaN if missing.
+        :return: True if year has been inserted, False if it has been updated.
+        :raise DataFormatError: If there are not exactly 12 rainfall values.
+        """
+        values = np.array(
+            [np.nan if value is None else value for value in monthly_rainfall],
+            dtype=np.float64,
+        )
+        if values.shape != (len(Month),):
+            raise DataFormatError("[Jan_rain, Feb_rain, ..., Dec_rain] (sequence)")
+
+        row, inserted = self._get_or_insert_row(year)
+        self.raw_rainfall[row] = values
+        self._update_row(row)
+
+        return inserted
+
+    def upsert_month(self, year: int, month: Month, value: float | None) -> bool:
+        """
+        Insert or replace rainfall value of a single month for given year.
+        If year does not exist yet, its other months are set as missing.
+
+        :param year: An integer representing the year to upsert.
+        :param month: A Month Enum representing the month to upsert.
+        :param value: Rainfall value (in mm); None or NaN if missing.
+        :return: True if year has been inserted, False if it has been updated.
+        """
+        row, inserted = self._get_or_insert_row(year)
+        self.raw_rainfall[row, month.get_rank() - 1] = (
+            np.nan if value is None else value
+        )
+        self._update_row(row)
+
+        return inserted
+
+    def _get_or_insert_row(self, year: int) -> tuple[int, bool]:
+        row = int(np.searchsorted(self.raw_years, year))
+        if row < len(self.raw_years) and self.raw_years[row] == year:
+            self._reserve(len(self.raw_years))
+
+            return row, False
+
+        raw_count = len(self.raw_years)
+        self._reserve(raw_count + 1)
+        if year < self.starting_year:
+            self.start_index += 1
+        self._set_views(raw_count + 1)
+
+        # Shift following years by one: nothing to move when appending a year.
+        self.raw_years[row + 1 :] = self.raw_years[row:-1].copy()
+        self.raw_rainfall[row + 1 :] = self.raw_rainfall[row:-1].copy()
+        self.raw_years[row] = year
+        self.raw_rainfall[row] = np.nan
+
+        if (column := row - self.start_index) >= 0:
+            self.series[:, column + 1 :] = self.series[:, column:-1].copy()
+
+        return row, True
+
+    def _update_row(self, row: int):
+        self.version += 1
+        if (column := row - self.start_index) < 0:
+            return
+
+        self.series[:, column] = self.compute_series(
+            self.raw_rainfall[row : row + 1], round_precision=self.round_precision
+        )[:, 0]
+        self._index_series_from(column)
+
+    def _reserve(self, raw_count: int):
+        """
+        Make arrays writable and large enough to hold given count of years.
+        Capacity is doubled when exceeded, so that appending years costs amortized constant time.
+        Arrays loaded as is (e.g. memory-mapped) are copied on first update.
+        """
+        if self._buffers is not None and len(self._buffers["raw_years"]) >= raw_count:
+            return
+
+        current_count = len(self.raw_years)
+        extra_count = max(raw_count, 2 * current_count, MIN_CAPACITY) - current_count
+
+        self._buffers = {}
+        for name, axis in (
+            ("raw_years", 0),
+            ("raw_rainfall", 0),
+            ("series", 1),
+            *((name, 1) for name in CUMULATIVE_ARRAY_NAMES),
+        ):
+            array = getattr(self, name)
+            shape = list(array.shape)
+            shape[axis] += extra_count
+            buffer = np.empty(shape, dtype=array.dtype)
+            buffer[tuple(slice(0, length) for length in array.shape)] = array
+            self._buffers[name] = buffer
+
+        self._set_views(current_count)
+
+    def _set_views(self, raw_count: int):
+        assert self._buffers is not None
+
+        series_count = raw_count - self.start_index
+        self.raw_years = self._buffers["raw_years"][:raw_count]
+        self.raw_rainfall = self._buffers["raw_rainfall"][:raw_count]
+        self.series = self._buffers["series"][:, :series_count]
+        for name in CUMULATIVE_ARRAY_NAMES:
+            setattr(self, name, self._buffers[name][:, : series_count + 1])
+
+    def _index_series_from(self, column: int):
+        """
+        Recompute cumulative sums from given series column onward, starting from the sums before it.
+        Series references are kept: deviations to any fixed reference give the same variances.
+        """
+        scaled_rainfall = np.rint(self.series[:, column:] * self.rainfall_scale)
+        deviations = self.series[:, column:] - self.series_references[:, np.newaxis]
+
+        for name, values in (
+            ("cumulative_sums", scaled_rainfall),
+            ("cumulative_deviations", deviations),
+            ("cumulative_squared_deviations", np.square(deviations)),
+        ):
+            cumulative_array = getattr(self, name)
+            values[:, 0] += cumulative_array[:, column]
+            np.cumsum(values, axis=1, out=cumulative_array[:, column + 1 :])
+
+    def _compute_series(self) -> np.ndarray:
+        return self.compute_series(
+            self.raw_rainfall[self.start_index :], round_precision=self.round_precision
+        )
+
+    def _index_series(self):
+        """
+        Index cumulative sums of every series, scaled by store precision to be exact integers.
+        Also index cumulative sums and sums of squares of deviations to series averages,
+        which keep variances accurate.
+        """
+        self.rainfall_scale = 10.0**self.round_precision
+        self.cumulative_sums = np.zeros((SERIES_COUNT, self.series.shape[1] + 1))
+        np.cumsum(
+            np.rint(self.series * self.rainfall_scale),
+            axis=1,
+            out=self.cumulative_sums[:, 1:],
+        )
+
+        self.series_references = self.cumulative_sums[:, -1] / max(
+            self.series.shape[1] * self.rainfall_scale, 1
+        )
+        deviations = self.series - self.series_references[:, np.newaxis]
+
+        self.cumulative_deviations = np.zeros_like(self.cumulative_sums)
+        np.cumsum(deviations, axis=1, out=self.cumulative_deviations[:, 1:])
+
+        self.cumulative_squared_deviations = np.zeros_like(self.cumulative_sums)
+        np.cumsum(
+            np.square(deviations, out=deviations),
+            axis=1,
+            out=self.cumulative_squared_deviations[:, 1:],
+        )
+
+    @staticmethod
+    def _sum_months(monthly_rainfall: np.ndarray, ranks: list[int]) -> np.ndarray:
+        rainfall = monthly_rainfall[:, ranks[0] - 1].copy()
+        for rank in ranks[1:]:
+            rainfall += monthly_rainfall[:, rank - 1]
+
+        return rainfall
@@ -0,0 +1,140 @@
+"""
+Provides a function to compute rolling statistics of many rainfall series at once over a RainfallStore,
+e.g. the 30 years normal starting from every year.
+Every window costs a few lookups in cumulative sums, so that a whole rolling series costs O(years).
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from bcn_rainfall_core.utils.rainfall_store import RainfallStore
+from bcn_rainfall_core.utils.statistics_table import (
+    AVERAGE,
+    LINEAR_REGRESSION_SLOPE,
+    STANDARD_DEVIATION,
+)
+
+VARIANCE = "variance"
+ROLLING_STATISTICS = (AVERAGE, VARIANCE, STANDARD_DEVIATION, LINEAR_REGRESSION_SLOPE)
+
+DEFAULT_WINDOW = 30
+
+
+def get_window_years(
+    store: RainfallStore,
+    window: int,
+    begin_year: int | None = None,
+    end_year: int | None = None,
+) -> np.ndarray:
+    """
+    Retrieve first years of every window of years fully within a year range.
+
+    :param store: A RainfallStore instance.
+    :param window: Count of years of each window.
+    :param begin_year: An integer representing the year
+    to start getting our rainfall values (optional). Defaults to store first year.
+    :param end_year: An integer representing the year
+    to end getting our rainfall values (optional). Defaults to store last year.
+    :return: A NumPy array of years.
+    """
+    years = store.years
+    if not len(years):
+        return years
+
+    begin_year = int(years[0]) if begin_year is None else begin_year
+    end_year = int(years[-1]) if end_year is None else end_year
+
+    return years[store.get_year_slice(begin_year, end_year - window + 1)]
+
+
+def compute_rolling_statistics(
+    store: RainfallStore,
+    series_indexes: Sequence[int] | np.ndarray,
+    *,
+    window=DEFAULT_WINDOW,
+    begin_year: int | None = None,
+    end_year: int | None = None,
+) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """
+    Compute average, variance, standard deviation and linear regression slope of rainfall
+    over every window of years within a year range, for many series at once.
+    Each value is the same as the one computed by the entity of its series over the window:
+    with a window of 30 years, averages are the normals starting from every year.
+
+    :param store: A RainfallStore instance.
+    :param series_indexes: Row indexes of series within store series matrix.
+    :param window: Count of years of each window. Defaults to 30.
+    :param begin_year: An integer representing the year
+    to start getting our rainfall values (optional). Defaults to store first year.
+    :param end_year: An integer representing the year
+    to end getting our rainfall values (optional). Defaults to store last year.
+    :return: A tuple (window_years, statistics) where window_years are first years of windows
+    and statistics maps every statistic name to a (series x windows) NumPy matrix.
+    :raise ValueError: If window is not a positive integer.
+    """
+    if window < 1:
+        raise ValueError(f"Window should be a positive count of years, got {window}.")
+
+    precision = store.round_precision
+    window_years = get_window_years(store, window, begin_year, end_year)
+    indexes = np.asarray(series_indexes, dtype=np.int64)[:, np.newaxis]
+    starts, stops = store.get_year_bounds(window_years, window_years + window - 1)
+
+    variances = store.get_variance(indexes, window_years, window_years + window - 1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        slopes = _compute_slopes(store, indexes[:, 0], starts, stops)
+
+    return window_years, {
+        AVERAGE: store.get_average(
+            indexes,
+            window_years,
+            window_years + window - 1,
+            round_precision=precision,
+        ),
+        VARIANCE: np.round(variances, precision),
+        STANDARD_DEVIATION: np.round(np.sqrt(variances), precision),
+        LINEAR_REGRESSION_SLOPE: np.round(slopes, precision),
+    }
+
+
+def _compute_slopes(
+    store: RainfallStore,
+    series_indexes: np.ndarray,
+    starts: np.ndarray,
+    stops: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute least squares slopes of rainfall according to year over column ranges of series,
+    from cumulative sums of years, squared years, rainfall and their products.
+    Rainfall is scaled to integers by store precision and years are offset from the first one,
+    so that sums are exact integers and slopes do not suffer from cancellation.
+    """
+    years = store.years - (store.years[0] if len(store.years) else 0)
+    scaled_rainfall = np.diff(store.cumulative_sums[series_indexes], axis=1).astype(
+        np.int64
+    )
+
+    def cumulate(values: np.ndarray) -> np.ndarray:
+        cumulative_values = np.zeros(
+            values.shape[:-1] + (values.shape[-1] + 1,), np.int64
+        )
+        np.cumsum(values, axis=-1, out=cumulative_values[..., 1:])
+
+        return cumulative_values
+
+    def sum_ranges(cumulative_values: np.ndarray) -> np.ndarray:
+        return cumulative_values[..., stops] - cumulative_values[..., starts]
+
+    counts = stops - starts
+    year_sums = sum_ranges(cumulate(years))
+    squared_year_sums = sum_ranges(cumulate(years * years))
+    rainfall_sums = sum_ranges(cumulate(scaled_rainfall))
+    product_sums = sum_ranges(cumulate(scaled_rainfall * years))
+
+    slopes = (counts * product_sums - year_sums * rainfall_sums) / (
+        (counts * squared_year_sums - year_sums * year_sums) * store.rainfall_scale
+    )
+
+    # Like least squares solvers, a single year is fitted with a null slope.
+    return np.where(counts == 1, 0.0, slopes)
@@ -1,5 +1,17 @@
 from pydantic import BaseModel, Field
 
+from bcn_rainfall_core.utils.caching import (
+    DEFAULT_FIGURE_CACHE_MAX_BYTES,
+    DEFAULT_RESULT_CACHE_CAPACITY,
+)
+from bcn_rainfall_core.utils.enums import (
+    BootstrapStatistic,
+    Month,
+    Season,
+    Statistic,
+    TimeMode,
+)
+
 
 class DataSettings(BaseModel):
     """Type definition for data settings."""
@@ -8,3 +20,34 @@ class DataSettings(BaseModel):
     local_file_path: str | None = Field(None)
     start_year: int
     rainfall_precision: int = Field(1)
+    snapshot_dir: str | None = Field(None)
+    mirror_dir: str | None = Field(None)
+    mirror_max_age: float = Field(3600.0)
+    download_timeout: float = Field(30.0)
+    result_cache_capacity: int = Field(DEFAULT_RESULT_CACHE_CAPACITY)
+    result_cache_ttl: float | None = Field(None)
+    figure_cache_max_bytes: int = Field(DEFAULT_FIGURE_CACHE_MAX_BYTES)
+
+
+class StatisticQuery(BaseModel):
+    """Type definition for a rainfall statistic query, to be evaluated in batch."""
+
+    statistic: Statistic
+    time_mode: TimeMode
+    begin_year: int
+    end_year: int | None = Field(default=None)
+    normal_year: int | None = Field(default=None)
+    month: Month | None = Field(default=None)
+    season: Season | None = Field(default=None)
+    weigh_by_average: bool = Field(default=False)
+
+
+class ConfidenceInterval(BaseModel):
+    """Type definition for a bootstrap confidence interval of a rainfall statistic."""
+
+    statistic: BootstrapStatistic
+    estimate: float
+    lower_bound: float
+    upper_bound: float
+    confidence_level: float
+    resample_count: int
@@ -0,0 +1,174 @@
+"""
+Provides functions to compute the Standardized Precipitation Index (SPI) of the monthly rainfall timeline
+of a RainfallStore, at many time scales at once.
+Rainfall accumulated over the last months is fitted, for every calendar month, with a gamma distribution
+mixed with a probability of null rainfall over a reference period; SPI is the standard normal quantile
+of each accumulation under the fitted distribution of its calendar month.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from bcn_rainfall_core.utils.enums import Month
+from bcn_rainfall_core.utils.rainfall_store import RainfallStore
+from bcn_rainfall_core.utils.statistics_table import NORMAL_YEAR_COUNT
+
+SPI_SCALES = (1, 3, 6, 12)
+
+# Quantile of a 0.1% probability: SPI beyond it is not meaningful with a few decades of reference.
+SPI_BOUND = 3.09
+
+# Lower bounds of moderate, severe and extreme droughts.
+DROUGHT_THRESHOLDS = (-1.0, -1.5, -2.0)
+
+
+@dataclass(frozen=True)
+class GammaFits:
+    """
+    Parameters of distributions of accumulated rainfall, as (scales x months) NumPy matrices.
+    Parameters are NaN when there are not enough distinct positive accumulations to fit a gamma distribution.
+    """
+
+    shapes: np.ndarray
+    scale_parameters: np.ndarray
+    null_probabilities: np.ndarray
+
+
+def get_spi_column(scale: int) -> str:
+    """
+    Name column holding SPI at a time scale.
+
+    :param scale: Count of months rainfall is accumulated over.
+    :return: A string such as 'spi_3'.
+    """
+
+    return f"spi_{scale}"
+
+
+def get_timeline_years(store: RainfallStore) -> np.ndarray:
+    """
+    Retrieve every year of monthly timeline, from store starting year to its last year.
+
+    :param store: A RainfallStore instance.
+    :return: A NumPy array of consecutive years.
+    """
+    years = store.raw_years[store.start_index :]
+    if not len(years):
+        return years
+
+    return np.arange(years[0], years[-1] + 1)
+
+
+def compute_accumulated_rainfall(store: RainfallStore, scales=SPI_SCALES) -> np.ndarray:
+    """
+    Accumulate rainfall over the last months of every month of timeline, for many time scales at once.
+    Rainfall is scaled to integers by store precision, so that accumulations are exact.
+    Accumulations are NaN if any of their months is missing, including before the first month of timeline.
+
+    :param store: A RainfallStore instance.
+    :param scales: Counts of months rainfall is accumulated over. Defaults to (1, 3, 6, 12).
+    :return: A (scales x years x months) NumPy array of accumulated rainfall (in mm).
+    """
+    years = get_timeline_years(store)
+    raw_years = store.raw_years[store.start_index :]
+    monthly_rainfall = np.full((len(years), len(Month)), np.nan)
+    monthly_rainfall[raw_years - (years[0] if len(years) else 0)] = store.raw_rainfall[
+        store.start_index :
+    ]
+
+    timeline = monthly_rainfall.ravel()
+    is_missing = np.isnan(timeline)
+    cumulative_rainfall = np.zeros(len(timeline) + 1, dtype=np.int64)
+    np.cumsum(
+        np.rint(np.where(is_missing, 0.0, timeline) * store.rainfall_scale).astype(
+            np.int64
+        ),
+        out=cumulative_rainfall[1:],
+    )
+    cumulative_missing_counts = np.concatenate(([0], np.cumsum(is_missing)))
+
+    stops = np.arange(1, len(timeline) + 1)
+    starts = stops - np.asarray(scales, dtype=np.int64)[:, np.newaxis]
+    is_complete = starts >= 0
+    starts = np.maximum(starts, 0)
+    is_complete &= (
+        cumulative_missing_counts[stops] - cumulative_missing_counts[starts] == 0
+    )
+
+    accumulated_rainfall = np.where(
+        is_complete,
+        (cumulative_rainfall[stops] - cumulative_rainfall[starts])
+        / store.rainfall_scale,
+        np.nan,
+    )
+
+    return accumulated_rainfall.reshape(len(scales), len(years), len(Month))
+
+
+def fit_gamma_distributions(
+    accumulated_rainfall: np.ndarray, years: np.ndarray, normal_year: int
+) -> GammaFits:
+    """
+    Fit distributions of accumulated rainfall of every calendar month and time scale over a 30 years reference period.
+    Positive accumulations are fitted with a gamma distribution by Thom's maximum likelihood approximation,
+    and null ones are counted as a probability of null rainfall.
+
+    :param accumulated_rainfall: A (scales x years x months) NumPy array of accumulated rainfall.
+    :param years: Years of accumulated rainfall.
+    :param normal_year: An integer representing the first year of reference period.
+    :return: A GammaFits instance.
+    """
+    in_reference = (normal_year <= years) & (years < normal_year + NORMAL_YEAR_COUNT)
+    reference_rainfall = accumulated_rainfall[:, in_reference]
+
+    is_valid = ~np.isnan(reference_rainfall)
+    is_positive = is_valid & (np.nan_to_num(reference_rainfall) > 0)
+    valid_counts = is_valid.sum(axis=1)
+    positive_counts = is_positive.sum(axis=1)
+    positive_rainfall = np.where(is_positive, reference_rainfall, 1.0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        averages = (
+            np.where(is_positive, positive_rainfall, 0.0).sum(axis=1) / positive_counts
+        )
+        log_averages = (
+            np.where(is_positive, np.log(positive_rainfall), 0.0).sum(axis=1)
+            / positive_counts
+        )
+        log_ratios = np.log(averages) - log_averages
+        shapes = (1 + np.sqrt(1 + 4 * log_ratios / 3)) / (4 * log_ratios)
+        null_probabilities = (valid_counts - positive_counts) / valid_counts
+
+    # Fewer than 2 distinct positive accumulations cannot be fitted.
+    is_fitted = (positive_counts >= 2) & (log_ratios > 0)
+    shapes = np.where(is_fitted, shapes, np.nan)
+
+    return GammaFits(
+        shapes=shapes,
+        scale_parameters=np.where(is_fitted, averages / shapes, np.nan),
+        null_probabilities=np.where(is_fitted, null_probabilities, np.nan),
+    )
+
+
+def compute_spi(accumulated_rainfall: np.ndarray, fits: GammaFits) -> np.ndarray:
+    """
+    Standardize accumulated rainfall under fitted distributions of their calendar month and time scale.
+    SPI is bounded to +/- 3.09, i.e. to probabilities of 0.1%.
+
+    :param accumulated_rainfall: A (scales x years x months) NumPy array of accumulated rainfall.
+    :param fits: A GammaFits instance fitted for the same scales.
+    :return: A (scales x years x months) NumPy array of SPI; NaN where rainfall is missing or could not be fitted.
+    """
+    from scipy.special import gammainc, ndtri
+
+    shapes = fits.shapes[:, np.newaxis]
+    null_probabilities = fits.null_probabilities[:, np.newaxis]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        probabilities = null_probabilities + (1 - null_probabilities) * gammainc(
+            shapes,
+            np.maximum(accumulated_rainfall, 0.0)
+            / fits.scale_parameters[:, np.newaxis],
+        )
+
+        return np.clip(ndtri(probabilities), -SPI_BOUND, SPI_BOUND)
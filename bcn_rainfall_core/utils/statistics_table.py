@@ -0,0 +1,92 @@
+"""
+Provides functions to compute statistics of many rainfall series at once over a RainfallStore,
+e.g. of every month or every season, as a table with one row per series.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+from bcn_rainfall_core.utils.linear_regression import fit_linear_regressions
+from bcn_rainfall_core.utils.rainfall_store import RainfallStore
+
+NORMAL_YEAR_COUNT = 30
+
+AVERAGE = "average"
+NORMAL = "normal"
+RELATIVE_DISTANCE_TO_NORMAL = "relative_distance_to_normal"
+STANDARD_DEVIATION = "standard_deviation"
+WEIGHTED_STANDARD_DEVIATION = "weighted_standard_deviation"
+LINEAR_REGRESSION_SLOPE = "linear_regression_slope"
+R2_SCORE = "r2_score"
+
+
+def compute_statistics_table(
+    store: RainfallStore,
+    series_indexes: Sequence[int],
+    labels: Sequence[str],
+    *,
+    begin_year: int,
+    end_year: int,
+    normal_year: int | None = None,
+) -> pd.DataFrame:
+    """
+    Compute averages, standard deviations, linear regressions and, if a normal year is given,
+    normals and relative distances to normal of many series at once.
+    Each value is the same as the one computed by the entity of its series.
+
+    :param store: A RainfallStore instance.
+    :param series_indexes: Row indexes of series within store series matrix.
+    :param labels: Labels of series, used as table index.
+    :param begin_year: An integer representing the year
+    to start getting our rainfall values.
+    :param end_year: An integer representing the year
+    to end getting our rainfall values.
+    :param normal_year: An integer representing the year
+    to start computing the 30 years normal of the rainfall (optional).
+    :return: A pandas DataFrame with one row per series and one column per statistic.
+    """
+    indexes = np.asarray(series_indexes, dtype=np.int64)
+    precision = store.round_precision
+
+    standard_deviations = np.sqrt(store.get_variance(indexes, begin_year, end_year))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weighted_standard_deviations = standard_deviations / store.get_average(
+            indexes, begin_year, end_year
+        )
+    r2_scores, slopes, _, _ = fit_linear_regressions(
+        store, indexes, begin_year, end_year
+    )
+
+    table = pd.DataFrame(
+        {
+            AVERAGE: store.get_average(
+                indexes, begin_year, end_year, round_precision=precision
+            ),
+            STANDARD_DEVIATION: np.round(standard_deviations, precision),
+            WEIGHTED_STANDARD_DEVIATION: np.round(
+                weighted_standard_deviations, precision
+            ),
+            LINEAR_REGRESSION_SLOPE: np.round(slopes, precision),
+            R2_SCORE: r2_scores,
+        },
+        index=list(labels),
+    )
+
+    if normal_year is not None:
+        table[NORMAL] = store.get_average(
+            indexes,
+            normal_year,
+            normal_year + NORMAL_YEAR_COUNT - 1,
+            round_precision=precision,
+        )
+        # Rounded one by one like single relative distances, which round Python floats.
+        table[RELATIVE_DISTANCE_TO_NORMAL] = [
+            round((average - normal) / normal * 100, precision)
+            if end_year >= begin_year and normal != 0
+            else np.nan
+            for average, normal in zip(table[AVERAGE], table[NORMAL])
+        ]
+
+    return table
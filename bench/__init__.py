@@ -0,0 +1,4 @@
+"""
+Benchmark suite of bcn_rainfall_core, run against the bundled dataset and against larger synthetic datasets.
+Run it with `python -m bench --help`.
+"""
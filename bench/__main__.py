@@ -0,0 +1,86 @@
+"""
+Command line entrypoint of the benchmark suite.
+"""
+
+import argparse
+import sys
+
+from bench.cases import BENCHMARK_CASES
+from bench.runner import (
+    compare_results,
+    format_comparisons,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m bench",
+        description="Benchmark every public method of Rainfall on bundled and synthetic datasets.",
+    )
+    parser.add_argument(
+        "--scales",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100],
+        help="Dataset sizes relative to the bundled dataset, e.g. 1 10 100 10000. Defaults to 1 10 100.",
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        default="",
+        help="Only run cases whose name contains this string.",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case.")
+    parser.add_argument(
+        "--min-run-time",
+        type=float,
+        default=0.05,
+        help="Minimal duration in seconds of a timed run.",
+    )
+    parser.add_argument(
+        "--data-dir",
+        default=".bench_data",
+        help="Folder where synthetic datasets are cached.",
+    )
+    parser.add_argument(
+        "-o", "--output", help="Path to JSON file where results are saved."
+    )
+    parser.add_argument(
+        "--baseline", help="Path to JSON results of a reference run to compare with."
+    )
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=0.25,
+        help="Relative slowdown over baseline above which a case is a regression. Defaults to 0.25.",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.scales,
+        data_dir=args.data_dir,
+        cases=[case for case in BENCHMARK_CASES if args.filter in case.name],
+        repeat=args.repeat,
+        min_run_time=args.min_run_time,
+    )
+
+    if args.output:
+        save_results(results, args.output)
+
+    if args.baseline:
+        comparisons = compare_results(
+            results, load_results(args.baseline), max_slowdown=args.max_slowdown
+        )
+        print(format_comparisons(comparisons))
+
+        if any(comparison["is_regression"] for comparison in comparisons):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
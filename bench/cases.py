@@ -0,0 +1,538 @@
+"""
+Provides benchmark cases covering every public method of Rainfall.
+Each case prepares its callable from a context giving access to the dataset of the running scale.
+"""
+
+import tempfile
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import cached_property
+from itertools import count
+from pathlib import Path
+
+from bcn_rainfall_core import Rainfall
+from bcn_rainfall_core.utils import (
+    BootstrapStatistic,
+    DashboardFigure,
+    FigureFormat,
+    KMeansEngine,
+    Month,
+    Season,
+    Statistic,
+    StatisticQuery,
+    TimeMode,
+)
+from bcn_rainfall_core.utils import plotly_figures as plotly_fig
+
+# Cases whose cost grows faster than data size (figures, clustering, exports) are skipped above this scale.
+HEAVY_CASE_MAX_SCALE = 100
+
+START_YEAR = 1971
+ROUND_PRECISION = 2
+NORMAL_YEAR = 1991
+
+
+@dataclass
+class BenchmarkContext:
+    """
+    Dataset and parameters shared by every case run at a given scale.
+    Queries span every year of dataset from starting year, so that their cost follows data size.
+    Shared rainfall does not memoize results, so that cases measure computations rather than cache hits.
+    """
+
+    dataset_path: Path
+    scale: int
+    work_dir: Path = field(default_factory=lambda: Path(tempfile.mkdtemp()))
+
+    @cached_property
+    def rainfall(self) -> Rainfall:
+        return self.new_rainfall(result_cache_capacity=0, figure_cache_max_bytes=0)
+
+    @property
+    def begin_year(self) -> int:
+        return START_YEAR
+
+    @cached_property
+    def end_year(self) -> int:
+        return self.rainfall.get_last_year()
+
+    def new_rainfall(self, **kwargs) -> Rainfall:
+        return Rainfall(
+            str(self.dataset_path),
+            start_year=START_YEAR,
+            round_precision=ROUND_PRECISION,
+            **kwargs,
+        ).warm_up()
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """
+    A named benchmark whose setup returns the callable to time.
+    """
+
+    name: str
+    setup: Callable[[BenchmarkContext], Callable[[], object]]
+    max_scale: int | None = None
+
+    def is_run_at(self, scale: int) -> bool:
+        return self.max_scale is None or scale <= self.max_scale
+
+
+TIME_MODE_KWARGS: list[tuple[TimeMode, dict]] = [
+    (TimeMode.YEARLY, {}),
+    *((TimeMode.MONTHLY, {"month": month}) for month in Month),
+    *((TimeMode.SEASONAL, {"season": season}) for season in Season),
+]
+
+
+def _for_every_time_mode(method_name: str, **method_kwargs):
+    """
+    Build a case setup calling given Rainfall method for every yearly, monthly and seasonal series.
+    """
+
+    def setup(ctx: BenchmarkContext) -> Callable[[], object]:
+        method = getattr(ctx.rainfall, method_name)
+        kwargs = {
+            name: getattr(ctx, value) if isinstance(value, str) else value
+            for name, value in method_kwargs.items()
+        }
+
+        def run():
+            for time_mode, time_mode_kwargs in TIME_MODE_KWARGS:
+                method(time_mode, **kwargs, **time_mode_kwargs)
+
+        return run
+
+    return setup
+
+
+def _for_monthly_and_seasonal(method_name: str, **method_kwargs):
+    """
+    Build a case setup calling given Rainfall figure method for monthly and seasonal time modes.
+    """
+
+    def setup(ctx: BenchmarkContext) -> Callable[[], object]:
+        method = getattr(ctx.rainfall, method_name)
+
+        def run():
+            for time_mode in (TimeMode.MONTHLY, TimeMode.SEASONAL):
+                method(
+                    time_mode,
+                    begin_year=ctx.begin_year,
+                    end_year=ctx.end_year,
+                    **method_kwargs,
+                )
+
+        return run
+
+    return setup
+
+
+def _setup_get_statistics(ctx: BenchmarkContext) -> Callable[[], object]:
+    queries = [
+        StatisticQuery(
+            statistic=statistic,
+            time_mode=time_mode,
+            begin_year=ctx.begin_year,
+            end_year=ctx.end_year,
+            normal_year=NORMAL_YEAR,
+            weigh_by_average=True,
+            **time_mode_kwargs,
+        )
+        for statistic in Statistic
+        for time_mode, time_mode_kwargs in TIME_MODE_KWARGS
+    ]
+
+    return lambda: ctx.rainfall.get_statistics(queries)
+
+
+def _setup_load(ctx: BenchmarkContext) -> Callable[[], object]:
+    return ctx.new_rainfall
+
+
+def _setup_load_from_snapshot(ctx: BenchmarkContext) -> Callable[[], object]:
+    snapshot_dir = ctx.work_dir / "snapshots"
+    ctx.new_rainfall(snapshot_dir=str(snapshot_dir))
+
+    return lambda: ctx.new_rainfall(snapshot_dir=str(snapshot_dir))
+
+
+def _setup_upsert(ctx: BenchmarkContext) -> Callable[[], object]:
+    rainfall = ctx.new_rainfall()
+    last_year = rainfall.get_last_year()
+
+    return lambda: rainfall.upsert(last_year, Month.DECEMBER, 42.0)
+
+
+def _setup_append(ctx: BenchmarkContext) -> Callable[[], object]:
+    rainfall = ctx.new_rainfall()
+    years = count(rainfall.get_last_year() + 1)
+    monthly_rainfall = [42.0] * len(Month)
+
+    return lambda: rainfall.append(next(years), monthly_rainfall)
+
+
+def _setup_export_all_data_to_csv(ctx: BenchmarkContext) -> Callable[[], object]:
+    folder_path = str(ctx.work_dir / "csv_data")
+
+    return lambda: ctx.rainfall.export_all_data_to_csv(
+        ctx.begin_year, ctx.end_year, folder_path=folder_path
+    )
+
+
+def _setup_export_dashboard_artifacts(incremental=False):
+    def setup(ctx: BenchmarkContext) -> Callable[[], object]:
+        folder_indexes = count()
+
+        def get_folder_path() -> str:
+            if incremental:
+                return str(ctx.work_dir / "dashboard_artifacts")
+
+            return str(ctx.work_dir / f"dashboard_artifacts_{next(folder_indexes)}")
+
+        if incremental:
+            ctx.rainfall.export_dashboard_artifacts(
+                normal_year=NORMAL_YEAR, folder_path=get_folder_path()
+            )
+
+        return lambda: ctx.rainfall.export_dashboard_artifacts(
+            normal_year=NORMAL_YEAR, folder_path=get_folder_path()
+        )
+
+    return setup
+
+
+def _setup_get_linear_regression(cached=False):
+    def setup(ctx: BenchmarkContext) -> Callable[[], object]:
+        rainfall = ctx.new_rainfall() if cached else ctx.rainfall
+        entities = [
+            rainfall.yearly_rainfall,
+            *rainfall.monthly_rainfalls.values(),
+            *rainfall.seasonal_rainfalls.values(),
+        ]
+
+        def run():
+            for entity in entities:
+                entity.get_linear_regression(ctx.begin_year, ctx.end_year)
+
+        return run
+
+    return setup
+
+
+def _setup_get_kmeans(kmeans_engine: KMeansEngine, cached=False):
+    def setup(ctx: BenchmarkContext) -> Callable[[], object]:
+        rainfall = ctx.new_rainfall() if cached else ctx.rainfall
+
+        return lambda: rainfall.yearly_rainfall.get_kmeans(
+            ctx.begin_year,
+            ctx.end_year,
+            kmeans_cluster_count=4,
+            kmeans_engine=kmeans_engine,
+        )
+
+    return setup
+
+
+def _setup_get_bar_figure_of_rainfall_according_to_year(
+    ctx: BenchmarkContext,
+) -> Callable[[], object]:
+    return lambda: ctx.rainfall.get_bar_figure_of_rainfall_according_to_year(
+        TimeMode.YEARLY,
+        begin_year=ctx.begin_year,
+        end_year=ctx.end_year,
+        plot_average=True,
+        plot_linear_regression=True,
+    )
+
+
+def _setup_get_bar_figure_with_kmeans(kmeans_engine: KMeansEngine):
+    def setup(ctx: BenchmarkContext) -> Callable[[], object]:
+        return lambda: ctx.rainfall.get_bar_figure_of_rainfall_according_to_year(
+            TimeMode.YEARLY,
+            begin_year=ctx.begin_year,
+            end_year=ctx.end_year,
+            kmeans_cluster_count=4,
+            kmeans_engine=kmeans_engine,
+        )
+
+    return setup
+
+
+def _setup_get_confidence_interval(ctx: BenchmarkContext) -> Callable[[], object]:
+    return lambda: ctx.rainfall.yearly_rainfall.get_confidence_interval(
+        BootstrapStatistic.LINEAR_REGRESSION_SLOPE, ctx.begin_year, ctx.end_year
+    )
+
+
+def _setup_get_spi(ctx: BenchmarkContext) -> Callable[[], object]:
+    return lambda: ctx.rainfall.get_spi(normal_year=NORMAL_YEAR)
+
+
+def _setup_build_figure(ctx: BenchmarkContext) -> Callable[[], object]:
+    yearly_rainfall = ctx.rainfall.yearly_rainfall
+    years = yearly_rainfall.years
+    traces = [
+        {"type": "bar", "x": years, "y": yearly_rainfall.rainfall, "name": "Rainfall"},
+        {"type": "scatter", "x": years, "y": yearly_rainfall.rainfall, "name": "Line"},
+    ]
+
+    return lambda: plotly_fig.build_figure(
+        traces,
+        title="Rainfall",
+        xaxis_title="Year",
+        yaxis_title="Rainfall (mm)",
+        display_xaxis_range_slider=True,
+    )
+
+
+def _setup_serialize_bar_figure(figure_format: FigureFormat, *, binary_arrays=False):
+    def setup(ctx: BenchmarkContext) -> Callable[[], object]:
+        return lambda: plotly_fig.to_json_bytes(
+            ctx.rainfall.get_bar_figure_of_rainfall_according_to_year(
+                TimeMode.YEARLY,
+                begin_year=ctx.begin_year,
+                end_year=ctx.end_year,
+                plot_average=True,
+                plot_linear_regression=True,
+                figure_format=figure_format,
+                binary_arrays=binary_arrays,
+            )
+        )
+
+    return setup
+
+
+def _setup_serialize_bar_figure_cached(ctx: BenchmarkContext) -> Callable[[], object]:
+    rainfall = ctx.new_rainfall()
+
+    return lambda: rainfall.get_bar_figure_of_rainfall_according_to_year(
+        TimeMode.YEARLY,
+        begin_year=ctx.begin_year,
+        end_year=ctx.end_year,
+        plot_average=True,
+        plot_linear_regression=True,
+        figure_format=FigureFormat.JSON,
+    )
+
+
+def _setup_get_dashboard_figures(max_workers: int | None = None):
+    def setup(ctx: BenchmarkContext) -> Callable[[], object]:
+        return lambda: ctx.rainfall.get_dashboard_figures(
+            normal_year=NORMAL_YEAR,
+            begin_year=ctx.begin_year,
+            end_year=ctx.end_year,
+            figure_format=FigureFormat.JSON,
+            binary_arrays=True,
+            max_workers=max_workers,
+        )
+
+    return setup
+
+
+def _setup_get_pie_figure(ctx: BenchmarkContext) -> Callable[[], object]:
+    return lambda: ctx.rainfall.get_pie_figure_of_years_above_and_below_normal(
+        time_mode=TimeMode.YEARLY,
+        normal_year=NORMAL_YEAR,
+        begin_year=ctx.begin_year,
+        end_year=ctx.end_year,
+    )
+
+
+BENCHMARK_CASES: list[BenchmarkCase] = [
+    BenchmarkCase("load", _setup_load),
+    BenchmarkCase("load_from_snapshot", _setup_load_from_snapshot),
+    BenchmarkCase("raw_data", lambda ctx: lambda: ctx.rainfall.raw_data),
+    BenchmarkCase("get_last_year", lambda ctx: ctx.rainfall.get_last_year),
+    BenchmarkCase(
+        "get_entity_for_time_mode",
+        lambda ctx: (
+            lambda: [
+                ctx.rainfall.get_entity_for_time_mode(time_mode, **kwargs)
+                for time_mode, kwargs in TIME_MODE_KWARGS
+            ]
+        ),
+    ),
+    BenchmarkCase("upsert", _setup_upsert),
+    BenchmarkCase("append", _setup_append),
+    BenchmarkCase(
+        "get_rainfall_average",
+        _for_every_time_mode(
+            "get_rainfall_average", begin_year="begin_year", end_year="end_year"
+        ),
+    ),
+    BenchmarkCase(
+        "get_normal", _for_every_time_mode("get_normal", begin_year=NORMAL_YEAR)
+    ),
+    BenchmarkCase(
+        "get_relative_distance_to_normal",
+        _for_every_time_mode(
+            "get_relative_distance_to_normal",
+            normal_year=NORMAL_YEAR,
+            begin_year="begin_year",
+            end_year="end_year",
+        ),
+    ),
+    BenchmarkCase(
+        "get_rainfall_standard_deviation",
+        _for_every_time_mode(
+            "get_rainfall_standard_deviation",
+            begin_year="begin_year",
+            end_year="end_year",
+            weigh_by_average=True,
+        ),
+    ),
+    BenchmarkCase(
+        "get_years_below_normal",
+        _for_every_time_mode(
+            "get_years_below_normal",
+            normal_year=NORMAL_YEAR,
+            begin_year="begin_year",
+            end_year="end_year",
+        ),
+    ),
+    BenchmarkCase(
+        "get_years_above_normal",
+        _for_every_time_mode(
+            "get_years_above_normal",
+            normal_year=NORMAL_YEAR,
+            begin_year="begin_year",
+            end_year="end_year",
+        ),
+    ),
+    BenchmarkCase("get_statistics", _setup_get_statistics),
+    BenchmarkCase(
+        "get_rolling_statistics",
+        _for_every_time_mode(
+            "get_rolling_statistics", begin_year="begin_year", end_year="end_year"
+        ),
+    ),
+    BenchmarkCase("get_spi", _setup_get_spi),
+    BenchmarkCase(
+        "get_confidence_interval",
+        _setup_get_confidence_interval,
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    BenchmarkCase(
+        "export_as_csv",
+        _for_every_time_mode(
+            "export_as_csv", begin_year="begin_year", end_year="end_year"
+        ),
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    BenchmarkCase(
+        "export_all_data_to_csv",
+        _setup_export_all_data_to_csv,
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    BenchmarkCase(
+        "export_dashboard_artifacts",
+        _setup_export_dashboard_artifacts(),
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    # Rerun over up-to-date artifacts, which only hashes inputs and checks files.
+    BenchmarkCase(
+        "export_dashboard_artifacts_incremental",
+        _setup_export_dashboard_artifacts(incremental=True),
+    ),
+    BenchmarkCase(
+        "get_linear_regression",
+        _setup_get_linear_regression(),
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    BenchmarkCase(
+        "get_linear_regression_cached", _setup_get_linear_regression(cached=True)
+    ),
+    BenchmarkCase(
+        "get_kmeans",
+        _setup_get_kmeans(KMeansEngine.SKLEARN),
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    # Exact 1-D k-means scales like sorting, so that it runs at every scale.
+    BenchmarkCase("get_kmeans_optimal_1d", _setup_get_kmeans(KMeansEngine.OPTIMAL_1D)),
+    BenchmarkCase(
+        "get_kmeans_cached", _setup_get_kmeans(KMeansEngine.SKLEARN, cached=True)
+    ),
+    # Figure assembly alone, from ready traces.
+    BenchmarkCase("build_figure", _setup_build_figure, max_scale=HEAVY_CASE_MAX_SCALE),
+    BenchmarkCase(
+        "get_bar_figure_of_rainfall_according_to_year",
+        _setup_get_bar_figure_of_rainfall_according_to_year,
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    BenchmarkCase(
+        "serialize_bar_figure",
+        _setup_serialize_bar_figure(FigureFormat.FIGURE),
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    BenchmarkCase(
+        "serialize_bar_figure_from_spec",
+        _setup_serialize_bar_figure(FigureFormat.JSON),
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    BenchmarkCase(
+        "serialize_bar_figure_with_binary_arrays",
+        _setup_serialize_bar_figure(FigureFormat.JSON, binary_arrays=True),
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    BenchmarkCase("serialize_bar_figure_cached", _setup_serialize_bar_figure_cached),
+    BenchmarkCase(
+        "get_dashboard_figures",
+        _setup_get_dashboard_figures(),
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    BenchmarkCase(
+        "get_dashboard_figures_with_threads",
+        _setup_get_dashboard_figures(max_workers=len(DashboardFigure)),
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    BenchmarkCase(
+        "get_bar_figure_of_rainfall_according_to_year_with_kmeans",
+        _setup_get_bar_figure_with_kmeans(KMeansEngine.SKLEARN),
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    BenchmarkCase(
+        "get_bar_figure_of_rainfall_according_to_year_with_kmeans_optimal_1d",
+        _setup_get_bar_figure_with_kmeans(KMeansEngine.OPTIMAL_1D),
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    BenchmarkCase(
+        "get_bar_figure_of_rainfall_averages",
+        _for_monthly_and_seasonal("get_bar_figure_of_rainfall_averages"),
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    BenchmarkCase(
+        "get_bar_figure_of_rainfall_linreg_slopes",
+        _for_monthly_and_seasonal("get_bar_figure_of_rainfall_linreg_slopes"),
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    BenchmarkCase(
+        "get_bar_figure_of_relative_distance_to_normal",
+        _for_monthly_and_seasonal(
+            "get_bar_figure_of_relative_distance_to_normal", normal_year=NORMAL_YEAR
+        ),
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    BenchmarkCase(
+        "get_bar_figure_of_standard_deviations",
+        _for_monthly_and_seasonal(
+            "get_bar_figure_of_standard_deviations", weigh_by_average=True
+        ),
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    BenchmarkCase(
+        "get_figure_of_rolling_statistics",
+        _for_every_time_mode(
+            "get_figure_of_rolling_statistics",
+            begin_year="begin_year",
+            end_year="end_year",
+        ),
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+    BenchmarkCase(
+        "get_pie_figure_of_years_above_and_below_normal",
+        _setup_get_pie_figure,
+        max_scale=HEAVY_CASE_MAX_SCALE,
+    ),
+]
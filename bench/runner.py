@@ -0,0 +1,219 @@
+"""
+Provides functions to time benchmark cases, save results as JSON and compare them against a baseline.
+"""
+
+import json
+import platform
+import shutil
+import statistics
+import time
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import bcn_rainfall_core
+from bench.cases import BENCHMARK_CASES, BenchmarkCase, BenchmarkContext
+from bench.synthetic_data import get_dataset_path
+
+RESULTS_FORMAT_VERSION = 1
+
+
+def time_callable(
+    func: Callable[[], object], *, repeat=5, min_run_time=0.05
+) -> dict[str, float | int]:
+    """
+    Time a callable like `timeit`: calls are grouped in runs lasting at least `min_run_time` seconds.
+
+    :param func: Callable without parameters.
+    :param repeat: Count of timed runs. Defaults to 5.
+    :param min_run_time: Minimal duration in seconds of a run. Defaults to 0.05.
+    :return: A dict of statistics in seconds per call: min, median and mean; along with run and call counts.
+    """
+    func()
+
+    number = 1
+    while (run_time := _time_run(func, number)) < min_run_time and number < 1 << 20:
+        number *= 2
+
+    run_times = [run_time / number] + [
+        _time_run(func, number) / number for _ in range(repeat - 1)
+    ]
+
+    return {
+        "min": min(run_times),
+        "median": statistics.median(run_times),
+        "mean": statistics.fmean(run_times),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def run_benchmarks(
+    scales: Iterable[int],
+    *,
+    data_dir: str | Path,
+    cases: Iterable[BenchmarkCase] = BENCHMARK_CASES,
+    repeat=5,
+    min_run_time=0.05,
+    log: Callable[[str], object] = print,
+) -> dict:
+    """
+    Run benchmark cases at every scale, generating synthetic datasets when needed.
+
+    :param scales: Dataset scales relative to the bundled dataset; 1 is the bundled dataset itself.
+    :param data_dir: Path to folder where synthetic datasets are cached.
+    :param cases: Benchmark cases to run. Defaults to every case.
+    :param repeat: Count of timed runs per case. Defaults to 5.
+    :param min_run_time: Minimal duration in seconds of a run. Defaults to 0.05.
+    :param log: Function called with a line of progress for every case.
+    :return: A JSON-serializable dict of metadata and results.
+    """
+    cases = list(cases)
+    results: list[dict] = []
+    for scale in scales:
+        dataset_path = get_dataset_path(scale, data_dir=data_dir)
+        ctx = BenchmarkContext(dataset_path=dataset_path, scale=scale)
+        try:
+            for case in cases:
+                if not case.is_run_at(scale):
+                    continue
+
+                result: dict = {
+                    "name": case.name,
+                    "scale": scale,
+                    **time_callable(
+                        case.setup(ctx), repeat=repeat, min_run_time=min_run_time
+                    ),
+                }
+                results.append(result)
+                log(f"x{scale:<6} {case.name:<60} {_format_time(result['median'])}")
+        finally:
+            shutil.rmtree(ctx.work_dir, ignore_errors=True)
+
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "metadata": get_metadata(),
+        "results": results,
+    }
+
+
+def get_metadata() -> dict[str, str]:
+    """
+    Describe environment of a benchmark run, so that results are compared knowingly.
+
+    :return: A dict of versions and platform details.
+    """
+
+    return {
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "bcn_rainfall_core": bcn_rainfall_core.__version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def save_results(results: dict, path: str | Path):
+    """
+    Save benchmark results as JSON.
+
+    :param results: Results returned by `run_benchmarks`.
+    :param path: Path to JSON file.
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path: str | Path) -> dict:
+    """
+    Load benchmark results saved as JSON.
+
+    :param path: Path to JSON file.
+    :return: Results as returned by `run_benchmarks`.
+    :raise ValueError: If results format is not supported.
+    """
+    with open(path, encoding="utf-8") as f:
+        results = json.load(f)
+
+    if results.get("format_version") != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark results format in {path}.")
+
+    return results
+
+
+def compare_results(
+    results: dict, baseline: dict, *, max_slowdown=0.25
+) -> list[dict[str, str | int | float | bool]]:
+    """
+    Compare median times of results against baseline for every case run in both.
+
+    :param results: Results returned by `run_benchmarks`.
+    :param baseline: Results of a reference run.
+    :param max_slowdown: Relative slowdown over which a case is a regression. Defaults to 0.25 (25 %).
+    :return: A list of comparisons with case name, scale, both medians, their ratio and regression flag.
+    """
+    baseline_medians = {
+        (result["name"], result["scale"]): result["median"]
+        for result in baseline["results"]
+    }
+
+    comparisons: list[dict[str, str | int | float | bool]] = []
+    for result in results["results"]:
+        if (key := (result["name"], result["scale"])) not in baseline_medians:
+            continue
+
+        ratio = result["median"] / baseline_medians[key]
+        comparisons.append(
+            {
+                "name": result["name"],
+                "scale": result["scale"],
+                "baseline_median": baseline_medians[key],
+                "median": result["median"],
+                "ratio": ratio,
+                "is_regression": ratio > 1 + max_slowdown,
+            }
+        )
+
+    return comparisons
+
+
+def format_comparisons(comparisons: list[dict]) -> str:
+    """
+    Format comparisons as a text table.
+
+    :param comparisons: Comparisons returned by `compare_results`.
+    :return: A multiline string.
+    """
+    lines = [f"{'scale':<8} {'case':<60} {'baseline':>10} {'current':>10} {'ratio':>7}"]
+    for comparison in comparisons:
+        lines.append(
+            f"x{comparison['scale']:<7} {comparison['name']:<60} "
+            f"{_format_time(comparison['baseline_median']):>10} "
+            f"{_format_time(comparison['median']):>10} "
+            f"{comparison['ratio']:>6.2f}x"
+            f"{'  REGRESSION' if comparison['is_regression'] else ''}"
+        )
+
+    return "\n".join(lines)
+
+
+def _time_run(func: Callable[[], object], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+
+    return time.perf_counter() - start
+
+
+def _format_time(seconds: float) -> str:
+    for unit, factor in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= factor:
+            return f"{seconds / factor:.3g} {unit}"
+
+    return f"{seconds / 1e-9:.3g} ns"
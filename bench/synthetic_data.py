@@ -0,0 +1,106 @@
+"""
+Provides functions to generate synthetic rainfall datasets shaped like the bundled one, at any size.
+Monthly rainfall is drawn from gamma distributions fitted on the bundled dataset, month by month.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+BUNDLED_DATASET_PATH = Path("resources/bcn_rainfall_1786_2024.csv")
+GENERATION_CHUNK_YEAR_COUNT = 100_000
+
+
+def get_monthly_gamma_parameters(
+    raw_data: pd.DataFrame,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Fit a gamma distribution on rainfall of every month with the method of moments.
+
+    :param raw_data: A pandas DataFrame with 13 columns: 1 for the year; 12 for every monthly rainfall.
+    :return: A tuple (shapes, scales) of NumPy arrays with one value per month.
+    """
+    monthly_rainfall = raw_data.iloc[:, 1:]
+    means = monthly_rainfall.mean().to_numpy()
+    variances = monthly_rainfall.var().to_numpy()
+
+    return np.square(means) / variances, variances / means
+
+
+def generate_rainfall_data(
+    year_count: int,
+    *,
+    first_year: int,
+    reference_data: pd.DataFrame,
+    seed=0,
+) -> pd.DataFrame:
+    """
+    Generate rainfall values for each month of consecutive years, with the columns of reference data.
+
+    :param year_count: Count of years to generate.
+    :param first_year: First generated year.
+    :param reference_data: Raw data on which monthly distributions are fitted.
+    :param seed: Seed of random generator, so that datasets are reproducible. Defaults to 0.
+    :return: A pandas DataFrame shaped as rainfall values for each month according to year.
+    """
+    shapes, scales = get_monthly_gamma_parameters(reference_data)
+    rng = np.random.default_rng(seed)
+
+    synthetic_data = pd.DataFrame(
+        np.round(rng.gamma(shapes, scales, size=(year_count, len(shapes))), 1),
+        columns=reference_data.columns[1:],
+    )
+    synthetic_data.insert(
+        0,
+        reference_data.columns[0],
+        np.arange(first_year, first_year + year_count, dtype=np.int64),
+    )
+
+    return synthetic_data
+
+
+def get_dataset_path(
+    scale: int, *, data_dir: str | Path, source_path=BUNDLED_DATASET_PATH, seed=0
+) -> Path:
+    """
+    Retrieve path to dataset `scale` times as long as source dataset, generating it if it does not exist yet.
+    Scale 1 is the source dataset itself; synthetic years start at the first year of source dataset.
+
+    :param scale: Ratio of dataset year count to source dataset year count.
+    :param data_dir: Path to folder where synthetic datasets are written.
+    :param source_path: Path to source CSV dataset. Defaults to the bundled dataset.
+    :param seed: Seed of random generator. Defaults to 0.
+    :return: Path to CSV dataset.
+    """
+    if scale == 1:
+        return Path(source_path)
+
+    dataset_path = Path(data_dir, f"{Path(source_path).stem}-x{scale}-seed{seed}.csv")
+    if dataset_path.exists():
+        return dataset_path
+
+    reference_data = pd.read_csv(source_path)
+    first_year = int(reference_data.iloc[0, 0])
+    year_count = scale * len(reference_data)
+
+    dataset_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dataset_path.with_name(f".{dataset_path.name}.tmp")
+    for chunk_index, chunk_first_year_index in enumerate(
+        range(0, year_count, GENERATION_CHUNK_YEAR_COUNT)
+    ):
+        generate_rainfall_data(
+            min(GENERATION_CHUNK_YEAR_COUNT, year_count - chunk_first_year_index),
+            first_year=first_year + chunk_first_year_index,
+            reference_data=reference_data,
+            seed=seed + chunk_index,
+        ).to_csv(
+            tmp_path,
+            mode="w" if chunk_index == 0 else "a",
+            header=chunk_index == 0,
+            index=False,
+        )
+
+    tmp_path.replace(dataset_path)
+
+    return dataset_path
@@ -3,7 +3,7 @@ import plotly.graph_objs as go
 from pytest import raises
 
 from bcn_rainfall_core.models import MonthlyRainfall
-from bcn_rainfall_core.utils import DataFormatError, Label, Month
+from bcn_rainfall_core.utils import DataFormatError, KMeansEngine, Label, Month
 from tst.test_config import CONFIG
 from tst.test_rainfall import RAINFALL, begin_year, end_year, normal_year
 
@@ -148,3 +148,21 @@ class TestMonthlyRainfall:
         )
 
         assert isinstance(bar_fig, go.Figure)
+
+        bar_fig = MONTHLY_RAINFALL.get_bar_figure_of_rainfall_according_to_year(
+            begin_year,
+            end_year,
+            kmeans_cluster_count=4,
+            kmeans_engine=KMeansEngine.OPTIMAL_1D,
+        )
+
+        assert isinstance(bar_fig, go.Figure)
+        assert [trace.name for trace in bar_fig.data] == [
+            f"Cluster {cluster_label}" for cluster_label in range(1, 5)
+        ]
+
+    @staticmethod
+    def test_get_figure_of_rolling_statistics():
+        figure = MONTHLY_RAINFALL.get_figure_of_rolling_statistics(begin_year, end_year)
+
+        assert isinstance(figure, go.Figure)
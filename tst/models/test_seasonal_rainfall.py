@@ -148,3 +148,11 @@ class TestMonthlyRainfall:
         )
 
         assert isinstance(bar_fig, go.Figure)
+
+    @staticmethod
+    def test_get_figure_of_rolling_statistics():
+        figure = SEASONAL_RAINFALL.get_figure_of_rolling_statistics(
+            begin_year, end_year
+        )
+
+        assert isinstance(figure, go.Figure)
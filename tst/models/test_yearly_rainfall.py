@@ -1,9 +1,19 @@
+import numpy as np
 import pandas as pd
 import plotly.graph_objs as go
 from pytest import raises
 
 from bcn_rainfall_core.models import YearlyRainfall
-from bcn_rainfall_core.utils import DataFormatError, Label, Month
+from bcn_rainfall_core.utils import (
+    BootstrapStatistic,
+    ConfidenceInterval,
+    DataFormatError,
+    FigureFormat,
+    KMeansEngine,
+    Label,
+    LRUCache,
+    Month,
+)
 from tst.test_config import CONFIG
 from tst.test_rainfall import RAINFALL, begin_year, end_year, normal_year
 
@@ -60,6 +70,57 @@ class TestYearlyRainfall:
 
         assert isinstance(normal, float)
 
+    @staticmethod
+    def test_get_normal_is_cached_until_data_changes():
+        yearly_rainfall = YearlyRainfall(
+            RAINFALL.raw_data,
+            start_year=CONFIG.get_data_settings.start_year,
+            round_precision=CONFIG.get_data_settings.rainfall_precision,
+        )
+        normal = yearly_rainfall.get_normal(normal_year)
+        yearly_rainfall.get_relative_distance_to_normal(
+            normal_year, begin_year, end_year
+        )
+
+        stats = yearly_rainfall.get_normal_cache_stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+        yearly_rainfall.store.upsert_month(normal_year, Month.MAY, 1000.0)
+
+        assert yearly_rainfall.get_normal(normal_year) > normal
+        assert yearly_rainfall.get_normal_cache_stats().misses == 2
+
+    @staticmethod
+    def test_get_results_are_cached_until_data_changes():
+        yearly_rainfall = YearlyRainfall(
+            RAINFALL.raw_data,
+            start_year=CONFIG.get_data_settings.start_year,
+            round_precision=CONFIG.get_data_settings.rainfall_precision,
+            result_cache=LRUCache(8),
+        )
+        (_, slope), predicted_rainfall = yearly_rainfall.get_linear_regression(
+            begin_year, end_year
+        )
+        predicted_rainfall.clear()
+        _, kmeans_labels = yearly_rainfall.get_kmeans(
+            begin_year, end_year, kmeans_engine=KMeansEngine.OPTIMAL_1D
+        )
+
+        assert yearly_rainfall.get_linear_regression(begin_year, end_year)[1]
+        assert (
+            yearly_rainfall.get_kmeans(
+                begin_year, end_year, kmeans_engine=KMeansEngine.OPTIMAL_1D
+            )[1]
+            == kmeans_labels
+        )
+        stats = yearly_rainfall.get_result_cache_stats()
+        assert (stats.hits, stats.misses, stats.size) == (2, 2, 2)
+
+        yearly_rainfall.store.upsert_month(end_year, Month.MAY, 1000.0)
+
+        assert yearly_rainfall.get_linear_regression(begin_year, end_year)[0][1] > slope
+        assert yearly_rainfall.get_result_cache_stats().size == 1
+
     @staticmethod
     def test_get_years_below_percentage_of_normal():
         n_years_below_normal_percentage = (
@@ -100,6 +161,55 @@ class TestYearlyRainfall:
         assert isinstance(n_years_above_avg, int)
         assert n_years_above_avg <= end_year - begin_year + 1
 
+    @staticmethod
+    def test_get_years_between_two_percentages_of_normal():
+        n_years_between = YEARLY_RAINFALL.get_years_between_two_percentages_of_normal(
+            normal_year, begin_year, end_year, percentages=(120, 80)
+        )
+
+        assert n_years_between == YEARLY_RAINFALL.get_years_above_percentage_of_normal(
+            normal_year, begin_year, end_year, percentage=80
+        ) - YEARLY_RAINFALL.get_years_above_percentage_of_normal(
+            normal_year, begin_year, end_year, percentage=120
+        )
+
+    @staticmethod
+    def test_classify_years_by_percentages_of_normal():
+        counts, bins = YEARLY_RAINFALL.classify_years_by_percentages_of_normal(
+            normal_year, begin_year, end_year, percentages=(100, 50, 150, float("inf"))
+        )
+
+        assert len(counts) == 3
+        assert len(bins) == end_year - begin_year + 1
+        assert counts == [bins.count(idx) for idx in range(3)]
+        assert counts[1] + counts[2] == YEARLY_RAINFALL.get_years_above_normal(
+            normal_year, begin_year, end_year
+        )
+
+    @staticmethod
+    def test_get_rolling_statistics():
+        rolling_statistics = YEARLY_RAINFALL.get_rolling_statistics(
+            begin_year, end_year, window=10
+        )
+
+        assert isinstance(rolling_statistics, pd.DataFrame)
+        assert len(rolling_statistics) == end_year - begin_year - 8
+        assert rolling_statistics["average"].iloc[
+            0
+        ] == YEARLY_RAINFALL.get_average_yearly_rainfall(begin_year, begin_year + 9)
+
+    @staticmethod
+    def test_get_figure_of_rolling_statistics():
+        figure = YEARLY_RAINFALL.get_figure_of_rolling_statistics(
+            begin_year,
+            end_year,
+            window=10,
+            statistics=["average", "linear_regression_slope"],
+        )
+
+        assert isinstance(figure, go.Figure)
+        assert len(figure.data) == 2
+
     @staticmethod
     def test_get_last_year():
         assert isinstance(YEARLY_RAINFALL.get_last_year(), int)
@@ -141,6 +251,31 @@ class TestYearlyRainfall:
         assert isinstance(linear_regression_values, list)
         assert len(linear_regression_values) == end_year - begin_year + 1
 
+    @staticmethod
+    def test_get_confidence_interval():
+        for statistic in BootstrapStatistic:
+            confidence_interval = YEARLY_RAINFALL.get_confidence_interval(
+                statistic, begin_year, end_year, resample_count=1000
+            )
+
+            assert isinstance(confidence_interval, ConfidenceInterval)
+            assert (
+                confidence_interval.lower_bound
+                <= confidence_interval.estimate
+                <= confidence_interval.upper_bound
+            )
+            assert confidence_interval.resample_count == 1000
+
+        confidence_interval = YEARLY_RAINFALL.get_confidence_interval(
+            BootstrapStatistic.NORMAL, normal_year, resample_count=1000
+        )
+        assert confidence_interval.estimate == YEARLY_RAINFALL.get_normal(normal_year)
+
+        confidence_interval = YEARLY_RAINFALL.get_confidence_interval(
+            BootstrapStatistic.AVERAGE, end_year + 1, end_year, resample_count=1000
+        )
+        assert confidence_interval.resample_count == 0
+
     @staticmethod
     def test_get_kmeans():
         kmeans_clusters = 5
@@ -156,6 +291,26 @@ class TestYearlyRainfall:
             assert isinstance(cluster_label, int)
             assert 0 <= cluster_label < kmeans_clusters
 
+    @staticmethod
+    def test_get_kmeans_with_optimal_1d_engine():
+        n_clusters, predict_data = YEARLY_RAINFALL.get_kmeans(
+            begin_year,
+            end_year,
+            kmeans_cluster_count=4,
+            kmeans_engine=KMeansEngine.OPTIMAL_1D,
+        )
+        rainfall = YEARLY_RAINFALL.get_yearly_rainfall(begin_year, end_year)[
+            Label.RAINFALL.value
+        ].to_numpy()
+        cluster_averages = [
+            rainfall[np.array(predict_data) == cluster_label].mean()
+            for cluster_label in range(n_clusters)
+        ]
+
+        assert n_clusters == 4
+        assert len(predict_data) == end_year - begin_year + 1
+        assert cluster_averages == sorted(cluster_averages)
+
     @staticmethod
     def test_get_bar_figure_of_rainfall_according_to_year():
         bar_fig = YEARLY_RAINFALL.get_bar_figure_of_rainfall_according_to_year(
@@ -167,3 +322,25 @@ class TestYearlyRainfall:
         )
 
         assert isinstance(bar_fig, go.Figure)
+
+        bar_fig_json = YEARLY_RAINFALL.get_bar_figure_of_rainfall_according_to_year(
+            begin_year,
+            end_year,
+            plot_average=True,
+            plot_linear_regression=True,
+            kmeans_cluster_count=4,
+            figure_format=FigureFormat.JSON,
+        )
+
+        assert bar_fig_json == bar_fig.to_json().encode()
+
+        bar_fig_spec = YEARLY_RAINFALL.get_bar_figure_of_rainfall_according_to_year(
+            begin_year,
+            end_year,
+            plot_average=True,
+            figure_format=FigureFormat.SPEC,
+            binary_arrays=True,
+        )
+
+        assert isinstance(bar_fig_spec, dict)
+        assert [trace["y"]["dtype"] for trace in bar_fig_spec["data"]] == ["f4", "f4"]
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+from bench.cases import BENCHMARK_CASES, HEAVY_CASE_MAX_SCALE
+from bench.runner import (
+    compare_results,
+    format_comparisons,
+    load_results,
+    run_benchmarks,
+    save_results,
+    time_callable,
+)
+from bench.synthetic_data import generate_rainfall_data, get_dataset_path
+from tst.test_rainfall import RAINFALL
+
+
+class TestBench:
+    @staticmethod
+    def test_generate_rainfall_data():
+        synthetic_data = generate_rainfall_data(
+            1000, first_year=1786, reference_data=RAINFALL.raw_data, seed=3
+        )
+
+        assert list(synthetic_data.columns) == list(RAINFALL.raw_data.columns)
+        assert synthetic_data.iloc[-1, 0] == 2785
+        assert (synthetic_data.iloc[:, 1:] >= 0).all().all()
+        assert synthetic_data.equals(
+            generate_rainfall_data(
+                1000, first_year=1786, reference_data=RAINFALL.raw_data, seed=3
+            )
+        )
+        assert np.allclose(
+            synthetic_data.iloc[:, 1:].mean(),
+            RAINFALL.raw_data.iloc[:, 1:].mean(),
+            rtol=0.2,
+        )
+
+    @staticmethod
+    def test_get_dataset_path(tmp_path):
+        assert get_dataset_path(1, data_dir=tmp_path).exists()
+
+        dataset_path = get_dataset_path(2, data_dir=tmp_path)
+
+        assert len(pd.read_csv(dataset_path)) == 2 * len(RAINFALL.raw_data)
+        assert get_dataset_path(2, data_dir=tmp_path) == dataset_path
+
+    @staticmethod
+    def test_time_callable():
+        timing = time_callable(lambda: None, repeat=3, min_run_time=0.001)
+
+        assert timing["repeat"] == 3
+        assert timing["number"] > 1
+        assert 0 < timing["min"] <= timing["median"]
+
+    @staticmethod
+    def test_run_and_compare_benchmarks(tmp_path):
+        cases = [case for case in BENCHMARK_CASES if case.name == "get_normal"]
+        results = run_benchmarks(
+            [1],
+            data_dir=tmp_path,
+            cases=cases,
+            repeat=2,
+            min_run_time=0.001,
+            log=lambda _: None,
+        )
+        save_results(results, tmp_path / "results.json")
+        baseline = load_results(tmp_path / "results.json")
+
+        assert [result["name"] for result in baseline["results"]] == ["get_normal"]
+
+        baseline["results"][0]["median"] = results["results"][0]["median"] / 2
+        comparisons = compare_results(results, baseline, max_slowdown=0.5)
+
+        assert len(comparisons) == 1
+        assert comparisons[0]["is_regression"]
+        assert "REGRESSION" in format_comparisons(comparisons)
+
+    @staticmethod
+    def test_heavy_cases_are_skipped_at_large_scale():
+        assert all(case.is_run_at(HEAVY_CASE_MAX_SCALE) for case in BENCHMARK_CASES)
+        assert not all(
+            case.is_run_at(HEAVY_CASE_MAX_SCALE + 1) for case in BENCHMARK_CASES
+        )
@@ -0,0 +1,55 @@
+import re
+import subprocess
+import sys
+
+IMPORT_TIME_BUDGET_IN_SECONDS = 2.0
+DEFERRED_PACKAGES = ("sklearn", "scipy", "plotly")
+
+
+def _run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+class TestImportTime:
+    @staticmethod
+    def test_heavy_packages_are_not_imported():
+        result = _run_python(
+            "import sys; import bcn_rainfall_core; "
+            "print(' '.join(sorted({name.split('.')[0] for name in sys.modules})))"
+        )
+        imported_packages = set(result.stdout.split())
+
+        for package in DEFERRED_PACKAGES:
+            assert package not in imported_packages
+
+    @staticmethod
+    def test_import_time_budget():
+        result = _run_python("import bcn_rainfall_core", "-X", "importtime")
+
+        cumulative_times = [
+            int(match.group(1))
+            for match in re.finditer(
+                r"^import time:\s+\d+ \|\s+(\d+) \| bcn_rainfall_core$",
+                result.stderr,
+                re.MULTILINE,
+            )
+        ]
+
+        assert len(cumulative_times) == 1
+        assert cumulative_times[0] / 1e6 < IMPORT_TIME_BUDGET_IN_SECONDS
+
+    @staticmethod
+    def test_deferred_packages_are_imported_on_use():
+        result = _run_python(
+            "import sys; from bcn_rainfall_core import Rainfall; "
+            "rainfall = Rainfall.from_config(from_file=True); "
+            "rainfall.yearly_rainfall.get_kmeans(1991, 2020); "
+            "print('sklearn' in sys.modules)"
+        )
+
+        assert result.stdout.strip() == "True"
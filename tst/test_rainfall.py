@@ -1,9 +1,25 @@
+import json
+import pickle
 from pathlib import Path
 from shutil import rmtree
 
+import pandas as pd
+from pytest import raises
+
 from bcn_rainfall_core import Rainfall
 from bcn_rainfall_core.models import MonthlyRainfall, SeasonalRainfall, YearlyRainfall
-from bcn_rainfall_core.utils import Label, Month, Season, TimeMode
+from bcn_rainfall_core.utils import (
+    BootstrapStatistic,
+    ConfidenceInterval,
+    DashboardFigure,
+    FigureFormat,
+    Label,
+    Month,
+    Season,
+    Statistic,
+    StatisticQuery,
+    TimeMode,
+)
 
 RAINFALL = Rainfall.from_config(from_file=True)
 
@@ -104,6 +120,107 @@ class TestRainfall:
             assert isinstance(n_years_above_avg, int)
             assert n_years_above_avg <= end_year - begin_year + 1
 
+    @staticmethod
+    def test_get_statistics_table():
+        table = RAINFALL.get_statistics_table(
+            TimeMode.SEASONAL,
+            begin_year=begin_year,
+            end_year=end_year,
+            normal_year=normal_year,
+        )
+        assert isinstance(table, pd.DataFrame)
+        assert table.index.tolist() == Season.values()
+        assert table.loc[season.value, "average"] == RAINFALL.get_rainfall_average(
+            TimeMode.SEASONAL, begin_year=begin_year, end_year=end_year, season=season
+        )
+
+        assert (
+            RAINFALL.get_statistics_table(
+                TimeMode.YEARLY, begin_year=begin_year, end_year=end_year
+            )
+            is None
+        )
+
+    @staticmethod
+    def test_get_rolling_statistics():
+        rolling_statistics = RAINFALL.get_rolling_statistics(
+            TimeMode.MONTHLY, begin_year=begin_year, end_year=end_year, month=month
+        )
+
+        assert isinstance(rolling_statistics, pd.DataFrame)
+        assert rolling_statistics["average"].iloc[-1] == RAINFALL.get_normal(
+            TimeMode.MONTHLY, begin_year=end_year - 29, month=month
+        )
+        assert (
+            RAINFALL.get_rolling_statistics(
+                TimeMode.MONTHLY, begin_year=begin_year, end_year=end_year
+            )
+            is None
+        )
+
+    @staticmethod
+    def test_get_confidence_interval():
+        confidence_interval = RAINFALL.get_confidence_interval(
+            TimeMode.SEASONAL,
+            BootstrapStatistic.AVERAGE,
+            begin_year=begin_year,
+            end_year=end_year,
+            season=season,
+            resample_count=1000,
+        )
+
+        assert isinstance(confidence_interval, ConfidenceInterval)
+        assert confidence_interval.estimate == RAINFALL.get_rainfall_average(
+            TimeMode.SEASONAL, begin_year=begin_year, end_year=end_year, season=season
+        )
+        assert (
+            RAINFALL.get_confidence_interval(
+                TimeMode.SEASONAL, BootstrapStatistic.AVERAGE, begin_year=begin_year
+            )
+            is None
+        )
+
+    @staticmethod
+    def test_get_spi():
+        spi_data = RAINFALL.get_spi(
+            normal_year=normal_year, begin_year=begin_year, end_year=end_year
+        )
+
+        assert isinstance(spi_data, pd.DataFrame)
+        assert len(spi_data) == (end_year - begin_year + 1) * len(Month)
+        assert spi_data.columns.tolist() == [
+            "Year",
+            "Month",
+            "spi_1",
+            "spi_3",
+            "spi_6",
+            "spi_12",
+        ]
+        assert spi_data["Month"].iloc[-1] == Month.DECEMBER.value
+
+        spi_data = RAINFALL.get_spi(normal_year=normal_year, scales=[24])
+        assert spi_data["spi_24"].isna().sum() == 23
+
+        with raises(ValueError):
+            RAINFALL.get_spi(normal_year=normal_year, scales=[0])
+
+    @staticmethod
+    def test_get_spi_fits_are_cached_until_data_changes():
+        rainfall = Rainfall.from_config(from_file=True)
+        spi_data = rainfall.get_spi(normal_year=normal_year, scales=[1])
+        rainfall.get_spi(normal_year=normal_year, begin_year=end_year, scales=[1])
+
+        stats = rainfall._spi_fit_cache.get_stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+        rainfall.upsert(normal_year, Month.MAY, 1000.0)
+
+        assert (
+            rainfall.get_spi(normal_year=normal_year, scales=[1])["spi_1"]
+            != spi_data["spi_1"]
+        ).any()
+        assert rainfall._spi_fit_cache.get_stats().misses == 2
+
     @staticmethod
     def test_get_last_year():
         assert isinstance(RAINFALL.get_last_year(), int)
@@ -150,3 +267,264 @@ class TestRainfall:
             MonthlyRainfall,
         )
         assert RAINFALL.get_entity_for_time_mode("unknown_time_mode") is None
+
+    @staticmethod
+    def test_warm_up():
+        rainfall = Rainfall.from_config(from_file=True)
+
+        assert not any(
+            rainfall.monthly_rainfalls.is_built(month.value) for month in Month
+        )
+
+        assert rainfall.warm_up() is rainfall
+        assert all(rainfall.monthly_rainfalls.is_built(month.value) for month in Month)
+        assert all(
+            rainfall.seasonal_rainfalls.is_built(season.value) for season in Season
+        )
+
+    @staticmethod
+    def test_upsert():
+        rainfall = Rainfall.from_config(from_file=True)
+        last_year = int(rainfall.store.raw_years[-1])
+
+        assert rainfall.upsert(last_year + 1, Month.JANUARY, 42.0)
+        assert not rainfall.upsert(last_year + 1, Month.FEBRUARY, 8.0)
+
+        assert rainfall.yearly_rainfall.years[-1] == last_year + 1
+        assert rainfall.yearly_rainfall.rainfall[-1] == 50.0
+        assert rainfall.monthly_rainfalls[Month.JANUARY.value].rainfall[-1] == 42.0
+        assert rainfall.seasonal_rainfalls[Season.WINTER.value].rainfall[-1] == 50.0
+        assert rainfall.raw_data.iloc[-1, 0] == last_year + 1
+
+    @staticmethod
+    def test_upsert_year():
+        rainfall = Rainfall.from_config(from_file=True)
+
+        assert not rainfall.upsert_year(end_year, [10.0] * len(Month))
+        assert (
+            rainfall.yearly_rainfall.get_yearly_rainfall(end_year, end_year)[
+                Label.RAINFALL
+            ].iloc[0]
+            == 120.0
+        )
+
+    @staticmethod
+    def test_append():
+        rainfall = Rainfall.from_config(from_file=True)
+        last_year = int(rainfall.store.raw_years[-1])
+
+        rainfall.append(last_year + 1, [1.0] * len(Month))
+
+        assert rainfall.yearly_rainfall.rainfall[-1] == 12.0
+
+        with raises(ValueError):
+            rainfall.append(last_year, [1.0] * len(Month))
+
+    @staticmethod
+    def test_get_result_cache_stats():
+        rainfall = Rainfall.from_config(from_file=True)
+        rainfall.result_cache.capacity = 1
+        rainfall.yearly_rainfall.get_linear_regression(begin_year, end_year)
+        rainfall.monthly_rainfalls[Month.MAY.value].get_linear_regression(
+            begin_year, end_year
+        )
+
+        stats = rainfall.get_result_cache_stats()
+        assert (stats.misses, stats.evictions, stats.size) == (2, 1, 1)
+
+        rainfall.append(rainfall.get_last_year() + 1, [1.0] * len(Month))
+        rainfall.yearly_rainfall.get_linear_regression(begin_year, end_year)
+
+        assert rainfall.get_result_cache_stats().misses == 3
+
+    @staticmethod
+    def test_get_figure_cache_stats():
+        rainfall = Rainfall.from_config(from_file=True)
+        figure_json = rainfall.get_bar_figure_of_rainfall_averages(
+            TimeMode.MONTHLY,
+            begin_year=begin_year,
+            end_year=end_year,
+            figure_format=FigureFormat.JSON,
+        )
+        figure = rainfall.get_bar_figure_of_rainfall_averages(
+            TimeMode.MONTHLY, begin_year=begin_year, end_year=end_year
+        )
+
+        assert isinstance(figure_json, bytes)
+        assert figure_json == figure.to_json().encode()
+        assert (
+            rainfall.get_bar_figure_of_rainfall_averages(
+                TimeMode.MONTHLY,
+                begin_year=begin_year,
+                end_year=end_year,
+                figure_format=FigureFormat.JSON,
+            )
+            is figure_json
+        )
+        for percentages_of_normal in [
+            (0, 100, float("inf")),
+            (float("inf"), 100, 0),
+            (0, 100.0, float("inf")),
+        ]:
+            pie_figures = {
+                figure_format: rainfall.get_pie_figure_of_years_above_and_below_normal(
+                    time_mode=TimeMode.SEASONAL,
+                    normal_year=normal_year,
+                    begin_year=begin_year,
+                    end_year=end_year,
+                    season=season,
+                    percentages_of_normal=percentages_of_normal,
+                    figure_format=figure_format,
+                )
+                for figure_format in FigureFormat
+            }
+            pie_figure_json = pie_figures[FigureFormat.JSON]
+
+            assert isinstance(pie_figure_json, bytes)
+            assert (
+                pie_figure_json == pie_figures[FigureFormat.FIGURE].to_json().encode()
+            )
+            assert json.loads(pie_figure_json) == pie_figures[FigureFormat.SPEC]
+
+        stats = rainfall.get_figure_cache_stats()
+        assert (stats.hits, stats.misses, stats.size) == (2, 3, 3)
+        assert stats.nbytes > len(figure_json)
+
+        rainfall.append(rainfall.get_last_year() + 1, [1.0] * len(Month))
+        rainfall.get_bar_figure_of_rainfall_averages(
+            TimeMode.MONTHLY,
+            begin_year=begin_year,
+            end_year=end_year,
+            figure_format=FigureFormat.JSON,
+        )
+
+        stats = rainfall.get_figure_cache_stats()
+        assert (stats.misses, stats.size, stats.nbytes) == (4, 1, len(figure_json))
+
+    @staticmethod
+    def test_get_dashboard_figures():
+        rainfall = Rainfall.from_config(from_file=True)
+        figures = rainfall.get_dashboard_figures(
+            normal_year=normal_year,
+            begin_year=begin_year,
+            end_year=end_year,
+            time_mode=TimeMode.SEASONAL,
+            figure_format=FigureFormat.JSON,
+            max_workers=len(DashboardFigure),
+        )
+
+        assert list(figures) == list(DashboardFigure)
+        assert all(isinstance(figure, bytes) for figure in figures.values())
+        assert (
+            figures[DashboardFigure.RELATIVE_DISTANCES_TO_NORMAL]
+            == rainfall.get_bar_figure_of_relative_distance_to_normal(
+                TimeMode.SEASONAL,
+                normal_year=normal_year,
+                begin_year=begin_year,
+                end_year=end_year,
+            )
+            .to_json()
+            .encode()
+        )
+        assert (
+            rainfall.get_bar_figure_of_rainfall_averages(
+                TimeMode.SEASONAL,
+                begin_year=begin_year,
+                end_year=end_year,
+                figure_format=FigureFormat.JSON,
+            )
+            is figures[DashboardFigure.RAINFALL_AVERAGES]
+        )
+        assert rainfall.get_figure_cache_stats().hits == 1
+
+        figures = rainfall.get_dashboard_figures(
+            normal_year=normal_year,
+            begin_year=begin_year,
+            end_year=end_year,
+            time_mode=TimeMode.YEARLY,
+        )
+        assert figures[DashboardFigure.YEARLY_RAINFALL] is not None
+        assert figures[DashboardFigure.STANDARD_DEVIATIONS] is None
+
+    @staticmethod
+    def test_reload():
+        rainfall = Rainfall.from_config(from_file=True)
+        last_year = rainfall.get_last_year()
+        rainfall.append(last_year + 1, [1.0] * len(Month))
+        version = rainfall.store.version
+        rainfall.get_bar_figure_of_rainfall_according_to_year(
+            TimeMode.YEARLY,
+            begin_year=begin_year,
+            end_year=end_year,
+            figure_format=FigureFormat.JSON,
+        )
+
+        assert rainfall.reload() is rainfall
+        assert rainfall.get_last_year() == last_year
+        assert rainfall.monthly_rainfalls[month.value].store is rainfall.store
+        assert rainfall.store.version > version
+
+        rainfall.get_bar_figure_of_rainfall_according_to_year(
+            TimeMode.YEARLY,
+            begin_year=begin_year,
+            end_year=end_year,
+            figure_format=FigureFormat.JSON,
+        )
+        assert rainfall.get_figure_cache_stats().misses == 2
+
+    @staticmethod
+    def test_pickle():
+        rainfall = pickle.loads(pickle.dumps(RAINFALL))
+
+        assert rainfall.get_last_year() == RAINFALL.get_last_year()
+        assert rainfall.monthly_rainfalls[month.value].store is rainfall.store
+        assert rainfall.get_normal(
+            TimeMode.SEASONAL, begin_year=begin_year, season=season
+        ) == RAINFALL.get_normal(
+            TimeMode.SEASONAL, begin_year=begin_year, season=season
+        )
+
+    @staticmethod
+    def test_get_statistics():
+        queries = [
+            StatisticQuery(
+                statistic=statistic,
+                time_mode=TimeMode.MONTHLY,
+                month=month,
+                begin_year=begin_year,
+                end_year=end_year,
+                normal_year=normal_year,
+            )
+            for statistic in Statistic
+        ]
+
+        assert RAINFALL.get_statistics(queries) == [
+            RAINFALL.get_rainfall_average(
+                TimeMode.MONTHLY, begin_year=begin_year, end_year=end_year, month=month
+            ),
+            RAINFALL.get_normal(TimeMode.MONTHLY, begin_year=begin_year, month=month),
+            RAINFALL.get_relative_distance_to_normal(
+                TimeMode.MONTHLY,
+                normal_year=normal_year,
+                begin_year=begin_year,
+                end_year=end_year,
+                month=month,
+            ),
+            RAINFALL.get_rainfall_standard_deviation(
+                TimeMode.MONTHLY, begin_year=begin_year, end_year=end_year, month=month
+            ),
+            RAINFALL.get_years_below_normal(
+                TimeMode.MONTHLY,
+                normal_year=normal_year,
+                begin_year=begin_year,
+                end_year=end_year,
+                month=month,
+            ),
+            RAINFALL.get_years_above_normal(
+                TimeMode.MONTHLY,
+                normal_year=normal_year,
+                begin_year=begin_year,
+                end_year=end_year,
+                month=month,
+            ),
+        ]
@@ -0,0 +1,222 @@
+import numpy as np
+import pandas as pd
+from pytest import raises
+
+from bcn_rainfall_core import RainfallCollection
+from bcn_rainfall_core.utils import (
+    DataFormatError,
+    Month,
+    RainfallStore,
+    Season,
+    TimeMode,
+)
+from bcn_rainfall_core.utils.linear_regression import fit_linear_regressions
+from tst.test_rainfall import RAINFALL, begin_year, end_year, month, normal_year
+
+RAW_DATA = RAINFALL.raw_data
+SHORT_RAW_DATA = RAW_DATA[RAW_DATA.iloc[:, 0] >= begin_year].copy()
+SHORT_RAW_DATA.iloc[:, 1:] *= 2
+
+COLLECTION = RainfallCollection(
+    {"full": RAW_DATA, "short": SHORT_RAW_DATA, "store": RAINFALL.store},
+    start_year=RAINFALL.starting_year,
+    round_precision=RAINFALL.round_precision,
+)
+
+
+class TestRainfallCollection:
+    @staticmethod
+    def test_init_fails_because_data_format_error():
+        with raises(DataFormatError):
+            RainfallCollection(
+                {"empty": pd.DataFrame()}, start_year=begin_year, round_precision=1
+            )
+
+    @staticmethod
+    def test_from_paths(tmp_path):
+        collection = RainfallCollection.from_paths(
+            {"bcn": "resources/bcn_rainfall_1786_2024.csv"},
+            start_year=RAINFALL.starting_year,
+            round_precision=RAINFALL.round_precision,
+            snapshot_dir=tmp_path,
+        )
+
+        assert collection.stations == ["bcn"]
+        assert np.array_equal(collection.years, RAINFALL.yearly_rainfall.years)
+
+    @staticmethod
+    def test_get_series():
+        series = COLLECTION.get_series(TimeMode.MONTHLY, month=month)
+
+        assert isinstance(series, np.ndarray)
+        assert series.shape == (len(COLLECTION.stations), len(COLLECTION.years))
+        assert np.array_equal(
+            series[0], RAINFALL.monthly_rainfalls[month.value].rainfall
+        )
+        assert np.isnan(series[1, 0])
+        assert COLLECTION.get_series(TimeMode.SEASONAL) is None
+
+    @staticmethod
+    def test_get_rainfall_average():
+        averages = COLLECTION.get_rainfall_average(
+            TimeMode.SEASONAL,
+            begin_year=begin_year,
+            end_year=end_year,
+            season=Season.FALL,
+        )
+
+        assert isinstance(averages, pd.Series)
+        assert list(averages.index) == COLLECTION.stations
+        assert (
+            averages["full"]
+            == averages["store"]
+            == RAINFALL.get_rainfall_average(
+                TimeMode.SEASONAL,
+                begin_year=begin_year,
+                end_year=end_year,
+                season=Season.FALL,
+            )
+        )
+        assert np.isclose(averages["short"], 2 * averages["full"], atol=0.1)
+
+    @staticmethod
+    def test_get_normal():
+        normals = COLLECTION.get_normal(TimeMode.YEARLY, begin_year=normal_year)
+
+        assert isinstance(normals, pd.Series)
+        assert normals["full"] == RAINFALL.get_normal(
+            TimeMode.YEARLY, begin_year=normal_year
+        )
+
+        normals = COLLECTION.get_normal(TimeMode.YEARLY, begin_year=begin_year - 30)
+
+        assert normals is not None
+        assert np.isnan(normals["short"])
+
+    @staticmethod
+    def test_get_relative_distance_to_normal():
+        relative_distances = COLLECTION.get_relative_distance_to_normal(
+            TimeMode.YEARLY,
+            normal_year=normal_year,
+            begin_year=begin_year,
+            end_year=end_year,
+        )
+
+        assert isinstance(relative_distances, pd.Series)
+        assert relative_distances["full"] == RAINFALL.get_relative_distance_to_normal(
+            TimeMode.YEARLY,
+            normal_year=normal_year,
+            begin_year=begin_year,
+            end_year=end_year,
+        )
+
+    @staticmethod
+    def test_get_rainfall_standard_deviation():
+        for weigh_by_average in [False, True]:
+            standard_deviations = COLLECTION.get_rainfall_standard_deviation(
+                TimeMode.MONTHLY,
+                begin_year=begin_year,
+                end_year=end_year,
+                month=month,
+                weigh_by_average=weigh_by_average,
+            )
+
+            assert isinstance(standard_deviations, pd.Series)
+            assert standard_deviations[
+                "full"
+            ] == RAINFALL.get_rainfall_standard_deviation(
+                TimeMode.MONTHLY,
+                begin_year=begin_year,
+                end_year=end_year,
+                month=month,
+                weigh_by_average=weigh_by_average,
+            )
+
+    @staticmethod
+    def test_get_years_below_and_above_normal():
+        for method_name in ["get_years_below_normal", "get_years_above_normal"]:
+            years = getattr(COLLECTION, method_name)(
+                TimeMode.MONTHLY,
+                normal_year=normal_year,
+                begin_year=begin_year,
+                end_year=end_year,
+                month=Month.OCTOBER,
+            )
+
+            assert isinstance(years, pd.Series)
+            assert years["full"] == getattr(RAINFALL, method_name)(
+                TimeMode.MONTHLY,
+                normal_year=normal_year,
+                begin_year=begin_year,
+                end_year=end_year,
+                month=Month.OCTOBER,
+            )
+            assert years["short"] <= end_year - begin_year + 1
+
+    @staticmethod
+    def test_get_linear_regression():
+        linear_regression = COLLECTION.get_linear_regression(
+            TimeMode.YEARLY, begin_year=begin_year, end_year=end_year
+        )
+
+        assert isinstance(linear_regression, pd.DataFrame)
+
+        (r2_score, slope), _ = RAINFALL.yearly_rainfall.get_linear_regression(
+            begin_year, end_year
+        )
+
+        assert np.isclose(linear_regression.loc["full", "r2_score"], r2_score)
+        assert np.isclose(linear_regression.loc["full", "slope"], slope)
+        assert (
+            COLLECTION.get_linear_regression(
+                TimeMode.MONTHLY, begin_year=begin_year, end_year=end_year
+            )
+            is None
+        )
+
+    @staticmethod
+    def test_get_linear_regression_matches_store_engine():
+        short_store = RainfallStore.from_dataframe(
+            SHORT_RAW_DATA,
+            start_year=RAINFALL.starting_year,
+            round_precision=RAINFALL.round_precision,
+        )
+        store_by_station = {
+            "full": RAINFALL.store,
+            "short": short_store,
+            "store": RAINFALL.store,
+        }
+
+        for time_mode, season in [
+            (TimeMode.YEARLY, None),
+            (TimeMode.SEASONAL, Season.FALL),
+        ]:
+            for range_begin_year, range_end_year in [
+                (begin_year, end_year),
+                (begin_year - 30, end_year),
+                (end_year, end_year),
+            ]:
+                linear_regression = COLLECTION.get_linear_regression(
+                    time_mode,
+                    begin_year=range_begin_year,
+                    end_year=range_end_year,
+                    season=season,
+                )
+                assert linear_regression is not None
+
+                for station, store in store_by_station.items():
+                    r2_scores, slopes, _, _ = fit_linear_regressions(
+                        store,
+                        store.get_series_index(season=season),
+                        range_begin_year,
+                        range_end_year,
+                    )
+
+                    assert np.array_equal(
+                        linear_regression.loc[station, "r2_score"],
+                        r2_scores[0],
+                        equal_nan=True,
+                    )
+                    assert linear_regression.loc[station, "slope"] == np.round(
+                        slopes[0], RAINFALL.round_precision
+                    )
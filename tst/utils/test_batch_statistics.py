@@ -0,0 +1,89 @@
+from bcn_rainfall_core.utils import Season, Statistic, StatisticQuery, TimeMode
+from bcn_rainfall_core.utils import batch_statistics as batch
+from tst.test_rainfall import RAINFALL, begin_year, end_year, normal_year
+
+STORE = RAINFALL.store
+
+
+class TestBatchStatistics:
+    @staticmethod
+    def test_get_series_index():
+        assert batch.get_series_index(
+            STORE,
+            StatisticQuery(
+                statistic=Statistic.AVERAGE,
+                time_mode=TimeMode.SEASONAL,
+                season=Season.FALL,
+                begin_year=begin_year,
+            ),
+        ) == STORE.get_series_index(season=Season.FALL)
+        assert (
+            batch.get_series_index(
+                STORE,
+                StatisticQuery(
+                    statistic=Statistic.AVERAGE,
+                    time_mode=TimeMode.MONTHLY,
+                    begin_year=begin_year,
+                ),
+            )
+            is None
+        )
+
+    @staticmethod
+    def test_compute_statistics_empty():
+        assert batch.compute_statistics(STORE, []) == []
+
+    @staticmethod
+    def test_compute_statistics_incomplete_queries():
+        results = batch.compute_statistics(
+            STORE,
+            [
+                StatisticQuery(
+                    statistic=Statistic.AVERAGE,
+                    time_mode=TimeMode.YEARLY,
+                    begin_year=begin_year,
+                ),
+                StatisticQuery(
+                    statistic=Statistic.YEARS_BELOW_NORMAL,
+                    time_mode=TimeMode.YEARLY,
+                    begin_year=begin_year,
+                    end_year=end_year,
+                ),
+                StatisticQuery(
+                    statistic=Statistic.RELATIVE_DISTANCE_TO_NORMAL,
+                    time_mode=TimeMode.YEARLY,
+                    begin_year=end_year,
+                    end_year=begin_year,
+                    normal_year=normal_year,
+                ),
+                StatisticQuery(
+                    statistic=Statistic.NORMAL,
+                    time_mode=TimeMode.YEARLY,
+                    begin_year=normal_year,
+                ),
+            ],
+        )
+
+        assert results[:3] == [None, None, None]
+        assert results[3] == RAINFALL.yearly_rainfall.get_normal(normal_year)
+
+    @staticmethod
+    def test_compute_statistics_shares_sub_computations():
+        query = StatisticQuery(
+            statistic=Statistic.YEARS_ABOVE_NORMAL,
+            time_mode=TimeMode.YEARLY,
+            begin_year=begin_year,
+            end_year=end_year,
+            normal_year=normal_year,
+        )
+        results = batch.compute_statistics(STORE, [query] * 3)
+
+        assert (
+            results
+            == [
+                RAINFALL.yearly_rainfall.get_years_above_normal(
+                    normal_year, begin_year, end_year
+                )
+            ]
+            * 3
+        )
@@ -0,0 +1,103 @@
+import numpy as np
+from pytest import raises
+
+from bcn_rainfall_core.utils import BootstrapStatistic, bootstrap
+from tst.test_rainfall import RAINFALL, begin_year, end_year
+
+YEARLY_RAINFALL = RAINFALL.yearly_rainfall
+YEAR_SLICE = RAINFALL.store.get_year_slice(begin_year, end_year)
+YEARS = YEARLY_RAINFALL.years[YEAR_SLICE]
+RAINFALL_VALUES = YEARLY_RAINFALL.rainfall[YEAR_SLICE]
+
+
+class TestBootstrap:
+    @staticmethod
+    def test_estimate_averages():
+        resample_indexes = np.array([np.arange(len(YEARS)), np.zeros(len(YEARS), int)])
+
+        averages = bootstrap.estimate_averages(YEARS, RAINFALL_VALUES, resample_indexes)
+
+        assert np.allclose(averages, [RAINFALL_VALUES.mean(), RAINFALL_VALUES[0]])
+
+    @staticmethod
+    def test_estimate_slopes():
+        resample_indexes = np.array([np.arange(len(YEARS)), np.zeros(len(YEARS), int)])
+
+        slopes = bootstrap.estimate_slopes(YEARS, RAINFALL_VALUES, resample_indexes)
+
+        assert np.isclose(slopes[0], np.polyfit(YEARS, RAINFALL_VALUES, 1)[0])
+        assert np.isnan(slopes[1])
+
+    @staticmethod
+    def test_compute_bootstrap_estimates_is_reproducible():
+        resample_count = 2 * bootstrap.CHUNK_SIZE // len(YEARS) + 1
+        estimates = bootstrap.compute_bootstrap_estimates(
+            YEARS,
+            RAINFALL_VALUES,
+            BootstrapStatistic.LINEAR_REGRESSION_SLOPE,
+            resample_count=resample_count,
+            seed=42,
+        )
+
+        assert len(estimates) == resample_count
+        assert np.array_equal(
+            estimates,
+            bootstrap.compute_bootstrap_estimates(
+                YEARS,
+                RAINFALL_VALUES,
+                BootstrapStatistic.LINEAR_REGRESSION_SLOPE,
+                resample_count=resample_count,
+                seed=42,
+                max_workers=2,
+            ),
+            equal_nan=True,
+        )
+
+    @staticmethod
+    def test_compute_bootstrap_estimates_with_time_budget():
+        estimates = bootstrap.compute_bootstrap_estimates(
+            YEARS,
+            RAINFALL_VALUES,
+            BootstrapStatistic.AVERAGE,
+            resample_count=10 * bootstrap.CHUNK_SIZE,
+            time_budget=0.0,
+        )
+
+        assert len(estimates) == bootstrap.CHUNK_SIZE // len(YEARS)
+
+    @staticmethod
+    def test_compute_confidence_interval():
+        confidence_interval = bootstrap.compute_confidence_interval(
+            YEARS,
+            RAINFALL_VALUES,
+            BootstrapStatistic.AVERAGE,
+            estimate=float(RAINFALL_VALUES.mean()),
+            round_precision=2,
+            confidence_level=0.5,
+        )
+        wider_confidence_interval = bootstrap.compute_confidence_interval(
+            YEARS,
+            RAINFALL_VALUES,
+            BootstrapStatistic.AVERAGE,
+            estimate=float(RAINFALL_VALUES.mean()),
+            round_precision=2,
+            confidence_level=0.99,
+        )
+
+        assert (
+            wider_confidence_interval.lower_bound
+            < confidence_interval.lower_bound
+            < confidence_interval.upper_bound
+            < wider_confidence_interval.upper_bound
+        )
+
+        for kwargs in ({"resample_count": 0}, {"confidence_level": 1.0}):
+            with raises(ValueError):
+                bootstrap.compute_confidence_interval(
+                    YEARS,
+                    RAINFALL_VALUES,
+                    BootstrapStatistic.AVERAGE,
+                    estimate=0.0,
+                    round_precision=2,
+                    **kwargs,
+                )
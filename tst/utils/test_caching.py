@@ -0,0 +1,117 @@
+from bcn_rainfall_core.utils import (
+    BytesLRUCache,
+    CacheStats,
+    LRUCache,
+    VersionedCache,
+)
+
+
+class TestVersionedCache:
+    @staticmethod
+    def test_get():
+        cache: VersionedCache[str, int] = VersionedCache()
+
+        assert cache.get("key", lambda: 1, version=0) == 1
+        assert cache.get("key", lambda: 2, version=0) == 1
+        assert cache.get_stats() == CacheStats(hits=1, misses=1, size=1)
+
+    @staticmethod
+    def test_get_with_new_version():
+        cache: VersionedCache[str, int] = VersionedCache()
+        cache.get("key", lambda: 1, version=0)
+        cache.get("other_key", lambda: 1, version=0)
+
+        assert cache.get("key", lambda: 2, version=1) == 2
+        assert len(cache) == 1
+        assert cache.get_stats().misses == 3
+
+    @staticmethod
+    def test_clear():
+        cache: VersionedCache[str, int] = VersionedCache()
+        cache.get("key", lambda: 1, version=0)
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get("key", lambda: 2, version=0) == 2
+        assert cache.get_stats().hit_rate == 0.0
+
+
+class TestLRUCache:
+    @staticmethod
+    def test_get_evicts_least_recently_used():
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache.get("first", lambda: 1, version=0)
+        cache.get("second", lambda: 2, version=0)
+        cache.get("first", lambda: 0, version=0)
+        cache.get("third", lambda: 3, version=0)
+
+        assert cache.get("first", lambda: 0, version=0) == 1
+        assert cache.get("second", lambda: 0, version=0) == 0
+        assert cache.get_stats() == CacheStats(hits=2, misses=4, size=2, evictions=2)
+
+    @staticmethod
+    def test_get_with_ttl():
+        now = [0.0]
+        cache: LRUCache[str, int] = LRUCache(2, ttl=10.0, clock=lambda: now[0])
+        cache.get("key", lambda: 1, version=0)
+
+        now[0] = 9.0
+        assert cache.get("key", lambda: 2, version=0) == 1
+
+        now[0] = 10.0
+        assert cache.get("key", lambda: 2, version=0) == 2
+        assert cache.get_stats().expirations == 1
+
+    @staticmethod
+    def test_get_with_new_version():
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache.get("key", lambda: 1, version=0)
+
+        assert cache.get("key", lambda: 2, version=1) == 2
+        assert len(cache) == 1
+
+    @staticmethod
+    def test_get_without_capacity():
+        cache: LRUCache[str, int] = LRUCache(0)
+
+        assert cache.get("key", lambda: 1, version=0) == 1
+        assert cache.get("key", lambda: 2, version=0) == 2
+        assert len(cache) == 0
+
+
+class TestBytesLRUCache:
+    @staticmethod
+    def test_get_evicts_until_bytes_fit():
+        cache: BytesLRUCache[str] = BytesLRUCache(10)
+        cache.get("first", lambda: b"1234", version=0)
+        cache.get("second", lambda: b"5678", version=0)
+        cache.get("none", lambda: None, version=0)
+        cache.get("third", lambda: b"90", version=0)
+
+        assert cache.get_stats() == CacheStats(
+            hits=0, misses=4, size=4, evictions=0, nbytes=10
+        )
+
+        cache.get("fourth", lambda: b"abcdef", version=0)
+
+        assert cache.get("none", lambda: b"", version=0) is None
+        assert cache.get_stats() == CacheStats(
+            hits=1, misses=5, size=3, evictions=2, nbytes=8
+        )
+
+    @staticmethod
+    def test_get_value_larger_than_capacity():
+        cache: BytesLRUCache[str] = BytesLRUCache(4)
+        cache.get("key", lambda: b"1234", version=0)
+
+        assert cache.get("large_key", lambda: b"12345", version=0) == b"12345"
+        assert cache.get_stats().nbytes == 4
+        assert len(cache) == 1
+
+    @staticmethod
+    def test_get_with_new_version():
+        cache: BytesLRUCache[str] = BytesLRUCache(10)
+        cache.get("key", lambda: b"1234", version=0)
+
+        assert cache.get("other_key", lambda: b"12", version=1) == b"12"
+        assert cache.get_stats().nbytes == 2
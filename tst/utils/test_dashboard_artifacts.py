@@ -0,0 +1,101 @@
+import hashlib
+import json
+
+from bcn_rainfall_core import Rainfall
+from bcn_rainfall_core.utils import Month, Season, TimeMode
+from bcn_rainfall_core.utils import dashboard_artifacts as artifacts
+from tst.test_rainfall import RAINFALL, normal_year
+
+PRESET_RANGES = (
+    artifacts.PresetRange("last_10_years", year_count=10),
+    artifacts.PresetRange("1991-2020", begin_year=1991, end_year=2020),
+)
+
+
+class TestDashboardArtifacts:
+    @staticmethod
+    def test_resolve_preset_range():
+        assert artifacts.PresetRange("last_30_years", year_count=30).resolve(
+            1971, 2024
+        ) == (1995, 2024)
+        assert artifacts.PresetRange("full_record").resolve(1971, 2024) == (
+            1971,
+            2024,
+        )
+
+    @staticmethod
+    def test_list_artifact_groups():
+        groups = artifacts.list_artifact_groups(
+            RAINFALL, normal_year=normal_year, preset_ranges=PRESET_RANGES
+        )
+
+        assert len(groups) == len(PRESET_RANGES) * (3 + len(Month) + len(Season))
+        assert groups[0].time_mode == TimeMode.YEARLY
+        assert groups[0].end_year == RAINFALL.get_last_year()
+        assert len({group.folder for group in groups}) == len(groups)
+
+    @staticmethod
+    def test_generate_artifacts(tmp_path):
+        rainfall = Rainfall.from_config(from_file=True)
+        rendered_files = rainfall.export_dashboard_artifacts(
+            normal_year=normal_year,
+            folder_path=str(tmp_path),
+            preset_ranges=PRESET_RANGES,
+        )
+
+        manifest = artifacts.load_manifest(tmp_path)
+        assert manifest is not None
+        assert sorted(rendered_files) == list(manifest["artifacts"])
+        for file, entry in manifest["artifacts"].items():
+            content = (tmp_path / file).read_bytes()
+            assert hashlib.sha256(content).hexdigest() == entry["content_hash"]
+            json.loads(content)
+
+        assert (
+            rainfall.export_dashboard_artifacts(
+                normal_year=normal_year,
+                folder_path=str(tmp_path),
+                preset_ranges=PRESET_RANGES,
+            )
+            == []
+        )
+
+        rainfall.upsert(2005, Month.MAY, 1000.0)
+        rendered_folders = {
+            file.rsplit("/", 1)[0]
+            for file in rainfall.export_dashboard_artifacts(
+                normal_year=normal_year,
+                folder_path=str(tmp_path),
+                preset_ranges=PRESET_RANGES,
+            )
+        }
+        assert "1991-2020/monthly/May" in rendered_folders
+        assert "1991-2020/monthly/June" not in rendered_folders
+        assert "last_10_years/monthly/May" not in rendered_folders
+
+        rainfall.export_dashboard_artifacts(
+            normal_year=normal_year,
+            folder_path=str(tmp_path),
+            preset_ranges=PRESET_RANGES[:1],
+        )
+        assert not (tmp_path / "1991-2020/yearly/rainfall.json").exists()
+
+    @staticmethod
+    def test_generate_artifacts_in_processes(tmp_path):
+        artifacts.generate_artifacts(
+            RAINFALL,
+            tmp_path / "sequential",
+            normal_year=normal_year,
+            preset_ranges=PRESET_RANGES[:1],
+        )
+        artifacts.generate_artifacts(
+            RAINFALL,
+            tmp_path / "processes",
+            normal_year=normal_year,
+            preset_ranges=PRESET_RANGES[:1],
+            max_workers=2,
+        )
+
+        assert artifacts.load_manifest(
+            tmp_path / "processes"
+        ) == artifacts.load_manifest(tmp_path / "sequential")
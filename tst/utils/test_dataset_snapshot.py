@@ -0,0 +1,151 @@
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from bcn_rainfall_core import Rainfall
+from bcn_rainfall_core.utils import dataset_snapshot
+from tst.test_config import CONFIG
+from tst.test_rainfall import RAINFALL, begin_year, end_year
+
+DATA_SETTINGS = CONFIG.get_data_settings
+
+
+def _copy_dataset(tmp_path: Path) -> Path:
+    assert DATA_SETTINGS.local_file_path is not None
+
+    return Path(shutil.copy(DATA_SETTINGS.local_file_path, tmp_path / "rainfall.csv"))
+
+
+def _load_store(source_path: Path, snapshot_dir: Path):
+    return dataset_snapshot.load_or_build_store(
+        source_path,
+        start_year=DATA_SETTINGS.start_year,
+        round_precision=DATA_SETTINGS.rainfall_precision,
+        snapshot_dir=snapshot_dir,
+    )
+
+
+class TestDatasetSnapshot:
+    @staticmethod
+    def test_get_snapshot_key(tmp_path):
+        source_path = _copy_dataset(tmp_path)
+        key = dataset_snapshot.get_snapshot_key(
+            source_path, start_year=1971, round_precision=1
+        )
+
+        assert key == dataset_snapshot.get_snapshot_key(
+            source_path, start_year=1971, round_precision=1
+        )
+        assert key != dataset_snapshot.get_snapshot_key(
+            source_path, start_year=1971, round_precision=2
+        )
+        assert key != dataset_snapshot.get_snapshot_key(
+            source_path, start_year=1972, round_precision=1
+        )
+
+    @staticmethod
+    def test_load_or_build_store(tmp_path):
+        source_path = _copy_dataset(tmp_path)
+        snapshot_dir = tmp_path / "snapshots"
+
+        built_store = _load_store(source_path, snapshot_dir)
+        assert not isinstance(built_store.series, np.memmap)
+        assert len(list(snapshot_dir.iterdir())) == 1
+
+        loaded_store = _load_store(source_path, snapshot_dir)
+        assert isinstance(loaded_store.series, np.memmap)
+
+        for name, array in built_store.get_arrays().items():
+            assert np.array_equal(array, loaded_store.get_arrays()[name])
+
+        assert loaded_store.columns == built_store.columns
+        assert loaded_store.start_index == built_store.start_index
+
+    @staticmethod
+    def test_stale_snapshot_is_rebuilt(tmp_path):
+        source_path = _copy_dataset(tmp_path)
+        snapshot_dir = tmp_path / "snapshots"
+        _load_store(source_path, snapshot_dir)
+        (stale_snapshot_path,) = snapshot_dir.iterdir()
+
+        with open(source_path, "a", encoding="utf-8") as f:
+            f.write("2100,1,1,1,1,1,1,1,1,1,1,1,1\n")
+
+        store = _load_store(source_path, snapshot_dir)
+        (snapshot_path,) = snapshot_dir.iterdir()
+
+        assert snapshot_path != stale_snapshot_path
+        assert store.years[-1] == 2100
+
+    @staticmethod
+    def test_snapshots_of_other_parameters_are_kept(tmp_path):
+        source_path = _copy_dataset(tmp_path)
+        snapshot_dir = tmp_path / "snapshots"
+        _load_store(source_path, snapshot_dir)
+        dataset_snapshot.load_or_build_store(
+            source_path,
+            start_year=DATA_SETTINGS.start_year + 10,
+            round_precision=DATA_SETTINGS.rainfall_precision,
+            snapshot_dir=snapshot_dir,
+        )
+        assert len(list(snapshot_dir.iterdir())) == 2
+
+        with open(source_path, "a", encoding="utf-8") as f:
+            f.write("2100,1,1,1,1,1,1,1,1,1,1,1,1\n")
+
+        _load_store(source_path, snapshot_dir)
+        metadata_list = [
+            dataset_snapshot.load_snapshot_metadata(snapshot_path)
+            for snapshot_path in snapshot_dir.iterdir()
+        ]
+        assert sorted(
+            metadata["start_year"] for metadata in metadata_list if metadata
+        ) == [DATA_SETTINGS.start_year, DATA_SETTINGS.start_year + 10]
+
+    @staticmethod
+    def test_snapshots_of_same_named_sources_are_kept(tmp_path):
+        snapshot_dir = tmp_path / "snapshots"
+        source_path = _copy_dataset(tmp_path)
+        (tmp_path / "other").mkdir()
+        other_source_path = _copy_dataset(tmp_path / "other")
+        with open(other_source_path, "a", encoding="utf-8") as f:
+            f.write("2100,1,1,1,1,1,1,1,1,1,1,1,1\n")
+
+        _load_store(source_path, snapshot_dir)
+        other_store = _load_store(other_source_path, snapshot_dir)
+        assert len(list(snapshot_dir.iterdir())) == 2
+
+        assert _load_store(source_path, snapshot_dir).years[-1] != 2100
+        assert isinstance(_load_store(source_path, snapshot_dir).series, np.memmap)
+        assert other_store.years[-1] == 2100
+        assert len(list(snapshot_dir.iterdir())) == 2
+
+    @staticmethod
+    def test_invalid_snapshot_is_rebuilt(tmp_path):
+        source_path = _copy_dataset(tmp_path)
+        snapshot_dir = tmp_path / "snapshots"
+        _load_store(source_path, snapshot_dir)
+        (snapshot_path,) = snapshot_dir.iterdir()
+        (snapshot_path / "series.npy").write_bytes(b"corrupted")
+
+        assert dataset_snapshot.load_snapshot(snapshot_path) is None
+        assert isinstance(_load_store(source_path, snapshot_dir).series, np.ndarray)
+        assert dataset_snapshot.load_snapshot(snapshot_path) is not None
+
+    @staticmethod
+    def test_rainfall_with_snapshot_dir(tmp_path):
+        source_path = _copy_dataset(tmp_path)
+        for _ in range(2):
+            rainfall = Rainfall(
+                str(source_path),
+                start_year=DATA_SETTINGS.start_year,
+                round_precision=DATA_SETTINGS.rainfall_precision,
+                snapshot_dir=str(tmp_path / "snapshots"),
+            )
+
+            assert rainfall.yearly_rainfall.get_average_yearly_rainfall(
+                begin_year, end_year
+            ) == RAINFALL.yearly_rainfall.get_average_yearly_rainfall(
+                begin_year, end_year
+            )
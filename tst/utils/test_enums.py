@@ -1,4 +1,14 @@
-from bcn_rainfall_core.utils import BaseEnum, Label, Month, Season, TimeMode
+from bcn_rainfall_core.utils import (
+    BaseEnum,
+    BootstrapStatistic,
+    DashboardFigure,
+    FigureFormat,
+    KMeansEngine,
+    Label,
+    Month,
+    Season,
+    TimeMode,
+)
 
 
 def test_base_enum():
@@ -23,6 +33,29 @@ def test_time_modes():
         assert isinstance(t_mode, str)
 
 
+def test_kmeans_engines():
+    assert set(KMeansEngine.values()) == {"sklearn", "optimal_1d"}
+
+
+def test_bootstrap_statistics():
+    assert set(BootstrapStatistic.values()) == {
+        "average",
+        "normal",
+        "linear_regression_slope",
+    }
+
+
+def test_figure_formats():
+    assert set(FigureFormat.values()) == {"figure", "spec", "json"}
+
+
+def test_dashboard_figures():
+    assert len(DashboardFigure) == 6
+
+    for dashboard_figure in DashboardFigure.values():
+        assert isinstance(dashboard_figure, str)
+
+
 class TestMonths:
     @staticmethod
     def test_months_count():
@@ -0,0 +1,33 @@
+import stat
+
+from pytest import raises
+
+from bcn_rainfall_core.utils.file_operations import write_atomically
+
+
+class TestFileOperations:
+    @staticmethod
+    def test_write_atomically(tmp_path):
+        path = tmp_path / "folder" / "file.json"
+
+        write_atomically(path, lambda f: f.write(b"{}"))
+        assert path.read_bytes() == b"{}"
+
+        write_atomically(path, lambda f: f.write(b"[]"), mode=0o644)
+        assert path.read_bytes() == b"[]"
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+    @staticmethod
+    def test_write_atomically_fails(tmp_path):
+        path = tmp_path / "file.json"
+        write_atomically(path, lambda f: f.write(b"{}"))
+
+        def write(f):
+            f.write(b"[")
+            raise ValueError
+
+        with raises(ValueError):
+            write_atomically(path, write)
+
+        assert path.read_bytes() == b"{}"
+        assert list(tmp_path.iterdir()) == [path]
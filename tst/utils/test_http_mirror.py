@@ -0,0 +1,181 @@
+import hashlib
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Thread
+
+from pytest import fixture, raises
+
+from bcn_rainfall_core import Rainfall
+from bcn_rainfall_core.utils import DatasetDownloadError
+from bcn_rainfall_core.utils.http_mirror import DatasetMirror
+from tst.test_config import CONFIG
+from tst.test_rainfall import RAINFALL, begin_year, end_year
+
+DATA_SETTINGS = CONFIG.get_data_settings
+
+
+class DatasetServer(ThreadingHTTPServer):
+    content: bytes
+    statuses: list[int]
+    client_ports: set[int]
+    stall_seconds: float
+
+
+class DatasetHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: DatasetServer
+
+    def do_GET(self):
+        self.server.client_ports.add(self.client_address[1])
+
+        if self.server.stall_seconds:
+            stall_seconds, self.server.stall_seconds = self.server.stall_seconds, 0.0
+            time.sleep(stall_seconds)
+
+        if self.path == "/redirect.csv":
+            self._send(301, headers={"Location": "/dataset.csv"})
+            return
+
+        etag = f'"{hashlib.sha256(self.server.content).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, headers={"ETag": etag})
+        else:
+            self._send(200, self.server.content, headers={"ETag": etag})
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body=b"", *, headers: dict[str, str]):
+        self.server.statuses.append(status)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@fixture
+def server():
+    assert DATA_SETTINGS.local_file_path is not None
+
+    dataset_server = DatasetServer(("127.0.0.1", 0), DatasetHandler)
+    dataset_server.content = Path(DATA_SETTINGS.local_file_path).read_bytes()
+    dataset_server.statuses = []
+    dataset_server.client_ports = set()
+    dataset_server.stall_seconds = 0.0
+    Thread(
+        target=dataset_server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    ).start()
+
+    yield dataset_server
+
+    dataset_server.shutdown()
+    dataset_server.server_close()
+
+
+def _get_url(server: DatasetServer, path="/dataset.csv") -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+class TestDatasetMirror:
+    @staticmethod
+    def test_fetch(server, tmp_path):
+        mirror = DatasetMirror(tmp_path, max_age=3600)
+        url = _get_url(server)
+
+        path = mirror.fetch(url)
+        assert path.read_bytes() == server.content
+        assert mirror.fetch(url) == path
+        assert server.statuses == [200]
+
+    @staticmethod
+    def test_revalidate(server, tmp_path):
+        mirror = DatasetMirror(tmp_path, max_age=0)
+        url = _get_url(server)
+        mirror.fetch(url)
+
+        mirror.fetch(url, stale_while_revalidate=False)
+        assert server.statuses == [200, 304]
+
+        server.content += b"2100,1,1,1,1,1,1,1,1,1,1,1,1\n"
+        path = mirror.fetch(url, stale_while_revalidate=False)
+        assert server.statuses == [200, 304, 200]
+        assert path.read_bytes() == server.content
+
+        assert len(server.client_ports) == 1
+
+    @staticmethod
+    def test_stale_while_revalidate(server, tmp_path):
+        mirror = DatasetMirror(tmp_path, max_age=0)
+        url = _get_url(server)
+        stale_content = server.content
+        mirror.fetch(url)
+
+        server.content += b"2100,1,1,1,1,1,1,1,1,1,1,1,1\n"
+        path = mirror.fetch(url)
+        mirror.wait_for_revalidations()
+
+        assert path.read_bytes() in {stale_content, server.content}
+        assert mirror.fetch(url).read_bytes() == server.content
+
+    @staticmethod
+    def test_stale_copy_is_served_when_server_is_down(server, tmp_path):
+        mirror = DatasetMirror(tmp_path, max_age=0, timeout=1)
+        url = _get_url(server)
+        path = mirror.fetch(url)
+        mirror.close()
+        server.shutdown()
+        server.server_close()
+
+        assert mirror.fetch(url, stale_while_revalidate=False) == path
+        with raises(DatasetDownloadError):
+            mirror.revalidate(url)
+
+        with raises(DatasetDownloadError):
+            DatasetMirror(tmp_path / "empty", timeout=1).fetch(url)
+
+    @staticmethod
+    def test_connection_is_dropped_after_timeout(server, tmp_path):
+        mirror = DatasetMirror(tmp_path, max_age=0, timeout=0.2)
+        url = _get_url(server)
+        server.stall_seconds = 0.5
+
+        with raises(DatasetDownloadError):
+            mirror.fetch(url)
+
+        path = mirror.fetch(url)
+        assert path.read_bytes() == server.content
+        assert len(server.client_ports) == 2
+
+    @staticmethod
+    def test_redirect(server, tmp_path):
+        mirror = DatasetMirror(tmp_path)
+
+        path = mirror.fetch(_get_url(server, "/redirect.csv"))
+        assert path.read_bytes() == server.content
+        assert server.statuses == [301, 200]
+
+    @staticmethod
+    def test_rainfall_with_mirror(server, tmp_path):
+        mirror = DatasetMirror(tmp_path / "mirror")
+        for _ in range(2):
+            rainfall = Rainfall(
+                _get_url(server),
+                start_year=DATA_SETTINGS.start_year,
+                round_precision=DATA_SETTINGS.rainfall_precision,
+                snapshot_dir=str(tmp_path / "snapshots"),
+                mirror=mirror,
+            )
+
+            assert rainfall.yearly_rainfall.get_average_yearly_rainfall(
+                begin_year, end_year
+            ) == RAINFALL.yearly_rainfall.get_average_yearly_rainfall(
+                begin_year, end_year
+            )
+
+        assert server.statuses == [200]
+
+        metadata = mirror.get_metadata(_get_url(server))
+        assert metadata is not None and time.time() - metadata["fetched_at"] < 60
@@ -0,0 +1,44 @@
+from itertools import combinations
+
+import numpy as np
+from pytest import raises
+
+from bcn_rainfall_core.utils.kmeans import compute_optimal_kmeans_1d
+
+
+def _get_cost(values: np.ndarray, labels: np.ndarray) -> float:
+    return sum(
+        float(np.square(values[labels == label] - values[labels == label].mean()).sum())
+        for label in np.unique(labels)
+    )
+
+
+class TestKMeans:
+    @staticmethod
+    def test_compute_optimal_kmeans_1d():
+        values = np.random.default_rng(0).gamma(2, 50, 12).round(1)
+        labels = compute_optimal_kmeans_1d(values, 3)
+
+        sorted_values = np.sort(values)
+        best_cost = min(
+            _get_cost(
+                sorted_values, np.searchsorted([0, *splits], np.arange(12), "right") - 1
+            )
+            for splits in combinations(range(1, 12), 2)
+        )
+
+        assert np.isclose(_get_cost(values, labels), best_cost)
+        assert [values[labels == label].mean() for label in range(3)] == sorted(
+            values[labels == label].mean() for label in range(3)
+        )
+        assert np.array_equal(labels, compute_optimal_kmeans_1d(values, 3))
+
+    @staticmethod
+    def test_compute_optimal_kmeans_1d_with_less_values_than_clusters():
+        assert compute_optimal_kmeans_1d(np.array([3.0, 1.0]), 4).tolist() == [1, 0]
+        assert compute_optimal_kmeans_1d(np.array([]), 4).tolist() == []
+
+    @staticmethod
+    def test_compute_optimal_kmeans_1d_fails_because_cluster_count_is_not_positive():
+        with raises(ValueError):
+            compute_optimal_kmeans_1d(np.array([1.0]), 0)
@@ -0,0 +1,56 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest import raises
+
+from bcn_rainfall_core.utils import LazyMapping
+
+
+class TestLazyMapping:
+    @staticmethod
+    def test_values_are_built_on_demand():
+        built_keys: list[str] = []
+
+        def factory(key: str) -> str:
+            built_keys.append(key)
+
+            return key.upper()
+
+        mapping = LazyMapping(["a", "b", "c"], factory)
+
+        assert len(mapping) == 3
+        assert list(mapping) == ["a", "b", "c"]
+        assert "a" in mapping and "d" not in mapping
+        assert built_keys == []
+
+        assert mapping["b"] == "B"
+        assert mapping["b"] == "B"
+        assert built_keys == ["b"]
+        assert mapping.is_built("b") and not mapping.is_built("a")
+
+        with raises(KeyError):
+            mapping["d"]
+
+    @staticmethod
+    def test_values_are_built_once_across_threads():
+        build_count = 0
+
+        def factory(key: int) -> object:
+            nonlocal build_count
+            build_count += 1
+
+            return object()
+
+        mapping: LazyMapping[int, object] = LazyMapping([0], factory)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            values = list(executor.map(lambda _: mapping[0], range(64)))
+
+        assert build_count == 1
+        assert all(value is values[0] for value in values)
+
+    @staticmethod
+    def test_warm_up():
+        mapping = LazyMapping(list(range(5)), lambda key: key * 2)
+
+        assert mapping.warm_up() is mapping
+        assert all(mapping.is_built(key) for key in mapping)
+        assert dict(mapping) == {0: 0, 1: 2, 2: 4, 3: 6, 4: 8}
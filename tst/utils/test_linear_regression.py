@@ -0,0 +1,47 @@
+import numpy as np
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import r2_score
+
+from bcn_rainfall_core.utils.linear_regression import fit_linear_regressions
+from tst.test_rainfall import RAINFALL, begin_year, end_year
+
+STORE = RAINFALL.store
+SERIES_INDEXES = np.arange(STORE.series.shape[0])
+
+
+class TestLinearRegression:
+    @staticmethod
+    def test_fit_linear_regressions():
+        r2_scores, slopes, intercepts, predicted_rainfall = fit_linear_regressions(
+            STORE, SERIES_INDEXES, begin_year, end_year
+        )
+
+        year_slice = STORE.get_year_slice(begin_year, end_year)
+        years = STORE.years[year_slice].reshape(-1, 1)
+        assert predicted_rainfall.shape == (len(SERIES_INDEXES), len(years))
+        for series_index in SERIES_INDEXES:
+            rainfall = STORE.series[series_index, year_slice]
+            lin_reg = LinearRegression().fit(years, rainfall)
+
+            assert np.isclose(slopes[series_index], lin_reg.coef_[0])
+            assert np.isclose(intercepts[series_index], lin_reg.intercept_)
+            assert np.isclose(
+                r2_scores[series_index],
+                r2_score(rainfall, predicted_rainfall[series_index]),
+            )
+
+    @staticmethod
+    def test_fit_linear_regressions_over_many_ranges():
+        end_years = np.array([begin_year - 1, begin_year, begin_year + 1, end_year])
+        r2_scores, slopes, _, predicted_rainfall = fit_linear_regressions(
+            STORE, 0, begin_year, end_years
+        )
+
+        assert predicted_rainfall.shape == (4, end_year - begin_year + 1)
+        assert np.isnan(slopes[0]) and slopes[1] == 0.0
+        assert np.isnan(r2_scores[:2]).all() and not np.isnan(r2_scores[2:]).any()
+        assert np.isnan(predicted_rainfall[2, 2:]).all()
+        assert np.array_equal(
+            predicted_rainfall[3],
+            fit_linear_regressions(STORE, 0, begin_year, end_year)[3][0],
+        )
@@ -1,7 +1,12 @@
+import base64
+
+import numpy as np
 import pandas as pd
 import plotly.graph_objs as go
+import plotly.io as pio
 
 from bcn_rainfall_core.utils import (
+    FigureFormat,
     Label,
     Month,
     Season,
@@ -15,6 +20,29 @@ from tst.test_rainfall import RAINFALL, begin_year, end_year, normal_year
 
 
 class TestPlotting:
+    @staticmethod
+    def test_get_plotly_template():
+        template = plotly_fig.get_plotly_template()
+
+        assert plotly_fig.get_plotly_template() is template
+        assert plotly_fig.TEMPLATE_NAME in pio.templates
+        assert template.layout.paper_bgcolor == "#25201a"
+        assert template.layout.colorway
+
+    @staticmethod
+    def test_build_figure():
+        figure = plotly_fig.build_figure(
+            [{"type": "bar", "x": [1991, 1992], "y": [500.0, 600.0], "name": "bar"}],
+            title="Rainfall",
+            yaxis_title=Label.RAINFALL.value,
+        )
+
+        assert isinstance(figure, go.Figure)
+        assert isinstance(figure.data[0], go.Bar)
+        assert figure.layout.title.text == "Rainfall"
+        assert figure.layout.yaxis.title.text == Label.RAINFALL.value
+        assert figure.layout.template.layout.font.family == "Khula, sans-serif"
+
     @staticmethod
     def test_get_figure_of_column_according_to_year():
         bar_fig = plotly_fig.get_figure_of_column_according_to_year(
@@ -35,6 +63,126 @@ class TestPlotting:
 
         assert isinstance(scatter_fig, go.Figure)
 
+    @staticmethod
+    def test_get_figure_of_rolling_statistics():
+        rolling_statistics = YEARLY_RAINFALL.get_rolling_statistics(
+            begin_year, end_year
+        )
+
+        figure = plotly_fig.get_figure_of_rolling_statistics(
+            rolling_statistics, window=30, statistics=["standard_deviation"]
+        )
+
+        assert isinstance(figure, go.Figure)
+
+        for statistics in ([], ["unknown_statistic"]):
+            assert (
+                plotly_fig.get_figure_of_rolling_statistics(
+                    rolling_statistics, window=30, statistics=statistics
+                )
+                is None
+            )
+
+        figure = RAINFALL.get_figure_of_rolling_statistics(
+            TimeMode.SEASONAL,
+            begin_year=begin_year,
+            end_year=end_year,
+            season=Season.FALL,
+            statistics=["average", "variance"],
+        )
+
+        assert isinstance(figure, go.Figure)
+
+    @staticmethod
+    def test_get_figure_of_spi():
+        spi_data = RAINFALL.get_spi(
+            normal_year=normal_year, begin_year=begin_year, end_year=end_year
+        )
+
+        figure = plotly_fig.get_figure_of_spi(spi_data, scales=[3, 12])
+
+        assert isinstance(figure, go.Figure)
+        assert len(figure.data) == 2
+
+        for scales in ([], [24]):
+            assert plotly_fig.get_figure_of_spi(spi_data, scales=scales) is None
+
+    @staticmethod
+    def test_figure_formats():
+        spi_data = RAINFALL.get_spi(
+            normal_year=normal_year, begin_year=begin_year, end_year=end_year
+        )
+        figure = plotly_fig.get_figure_of_spi(spi_data, scales=[3, 12])
+        figure_spec = plotly_fig.get_figure_of_spi(
+            spi_data, scales=[3, 12], figure_format=FigureFormat.SPEC
+        )
+        figure_json = plotly_fig.get_figure_of_spi(
+            spi_data, scales=[3, 12], figure_format=FigureFormat.JSON
+        )
+
+        assert isinstance(figure, go.Figure)
+        assert isinstance(figure_spec, dict)
+        assert isinstance(figure_json, bytes)
+        assert figure_json == figure.to_json().encode()
+        assert plotly_fig.to_json_bytes(figure_spec) == figure_json
+        assert plotly_fig.to_json_bytes(figure_json) is figure_json
+
+    @staticmethod
+    def test_encode_typed_array():
+        years = np.arange(1971, 2021)
+        encoded_years = plotly_fig.encode_typed_array(years, 1)
+
+        assert isinstance(encoded_years, dict)
+        assert encoded_years["dtype"] == "i2"
+        assert np.array_equal(
+            np.frombuffer(base64.b64decode(encoded_years["bdata"]), dtype="<i2"),
+            years,
+        )
+
+        rainfall = np.array([612.34, 401.5, np.nan, 1008.06])
+        encoded_rainfall = plotly_fig.encode_typed_array(rainfall, 2)
+
+        assert isinstance(encoded_rainfall, dict)
+        assert encoded_rainfall["dtype"] == "f4"
+        assert np.array_equal(
+            np.frombuffer(base64.b64decode(encoded_rainfall["bdata"]), dtype="<f4")
+            .astype(np.float64)
+            .round(2),
+            rainfall,
+            equal_nan=True,
+        )
+        assert (
+            plotly_fig.encode_typed_array(np.array([0.123456789]), 9)["dtype"] == "f8"
+        )
+
+        dates = np.array(["1971-01-01", "1971-02-01"])
+        assert plotly_fig.encode_typed_array(dates, 1) is dates
+
+    @staticmethod
+    def test_build_figure_with_binary_arrays():
+        years = np.arange(1971, 2021)
+        figure_spec = plotly_fig.build_figure(
+            [
+                {"type": "bar", "x": years, "y": years * 10.5, "name": "bar"},
+                {"type": "bar", "x": years[:2], "y": [1.0, 2.0], "name": "short"},
+            ],
+            title="Rainfall",
+            figure_format=FigureFormat.SPEC,
+            binary_precision=1,
+        )
+
+        assert isinstance(figure_spec, dict)
+        assert figure_spec["data"][0]["x"]["dtype"] == "i2"
+        assert figure_spec["data"][0]["y"]["dtype"] == "f4"
+        assert isinstance(figure_spec["data"][1]["x"], np.ndarray)
+        assert figure_spec["data"][1]["y"] == [1.0, 2.0]
+
+        figure = RAINFALL.get_figure_of_spi(
+            normal_year=normal_year, begin_year=begin_year, end_year=end_year
+        )
+
+        assert isinstance(figure, go.Figure)
+
     @staticmethod
     def test_get_bar_figure_of_rainfall_averages():
         figure = plotly_fig.get_bar_figure_of_rainfall_averages(
@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+from pytest import raises
+
+from bcn_rainfall_core.utils import DataFormatError, Month, RainfallStore, Season
+from tst.test_rainfall import RAINFALL, begin_year, end_year
+
+STORE = RAINFALL.store
+
+
+class TestRainfallStore:
+    @staticmethod
+    def test_from_dataframe_fails_because_data_format_error():
+        with raises(DataFormatError):
+            RainfallStore.from_dataframe(
+                pd.DataFrame(), start_year=begin_year, round_precision=1
+            )
+
+    @staticmethod
+    def test_raw_data():
+        raw_data = STORE.raw_data
+
+        assert isinstance(raw_data, pd.DataFrame)
+        assert len(raw_data.columns) == 1 + len(Month)
+        assert len(raw_data) == len(STORE.raw_years)
+
+    @staticmethod
+    def test_series():
+        assert STORE.series.shape == (1 + len(Month) + len(Season), len(STORE.years))
+        assert STORE.years[0] >= STORE.starting_year
+
+        for entity in [
+            RAINFALL.yearly_rainfall,
+            *RAINFALL.monthly_rainfalls.values(),
+            *RAINFALL.seasonal_rainfalls.values(),
+        ]:
+            assert entity.store is STORE
+            assert np.shares_memory(entity.rainfall, STORE.series)
+
+    @staticmethod
+    def test_get_series_index():
+        indexes = {STORE.get_series_index()}
+        indexes |= {STORE.get_series_index(month=month) for month in Month}
+        indexes |= {STORE.get_series_index(season=season) for season in Season}
+
+        assert indexes == set(range(len(STORE.series)))
+
+    @staticmethod
+    def test_compute_rainfall():
+        rainfall = STORE.compute_rainfall(Month.DECEMBER, Month.FEBRUARY)
+
+        assert np.array_equal(
+            rainfall, STORE.series[STORE.get_series_index(season=Season.WINTER)]
+        )
+
+    @staticmethod
+    def test_get_rainfall():
+        rainfall = STORE.get_rainfall(STORE.get_series_index(), begin_year, end_year)
+
+        assert len(rainfall) == end_year - begin_year + 1
+        assert len(STORE.get_rainfall(0, end_year, begin_year)) == 0
+
+    @staticmethod
+    def test_get_average():
+        series_index = STORE.get_series_index(month=Month.MAY)
+        rainfall = STORE.get_rainfall(series_index, begin_year, end_year)
+
+        assert np.isclose(
+            STORE.get_average(series_index, begin_year, end_year), rainfall.mean()
+        )
+        assert STORE.get_average(
+            series_index, begin_year, end_year, round_precision=1
+        ) == round(rainfall.mean(), 1)
+        assert np.isnan(STORE.get_average(series_index, end_year, begin_year))
+
+        averages = STORE.get_average(np.arange(len(STORE.series)), begin_year, end_year)
+
+        assert averages.shape == (len(STORE.series),)
+
+    @staticmethod
+    def test_get_variance():
+        begin_years = np.arange(begin_year, end_year)
+        variances = STORE.get_variance(STORE.get_series_index(), begin_years, end_year)
+
+        for year, variance in zip(begin_years, variances):
+            assert np.isclose(
+                variance,
+                STORE.get_rainfall(STORE.get_series_index(), year, end_year).var(
+                    ddof=1
+                ),
+            )
+
+        assert np.isnan(STORE.get_variance(0, end_year, end_year))
+
+    @staticmethod
+    def test_raw_data_is_a_copy():
+        raw_data = STORE.raw_data
+        raw_data.iloc[:, 1:] = -1.0
+
+        assert not (STORE.raw_rainfall == -1.0).any()
+
+    @staticmethod
+    def test_upsert_year():
+        store = RainfallStore.from_dataframe(
+            RAINFALL.raw_data, start_year=STORE.starting_year, round_precision=1
+        )
+        last_year = int(store.raw_years[-1])
+        monthly_rainfall: list[float | None] = [10.0] * len(Month)
+        monthly_rainfall[0] = None
+
+        assert store.upsert_year(last_year + 1, monthly_rainfall)
+        assert not store.upsert_year(begin_year, [5.0] * len(Month))
+        assert store.version == 2
+
+        raw_data = RAINFALL.raw_data
+        raw_data.loc[raw_data.iloc[:, 0] == begin_year, raw_data.columns[1:]] = 5.0
+        raw_data.loc[len(raw_data)] = [last_year + 1, *[np.nan] + [10.0] * 11]
+        expected_store = RainfallStore.from_dataframe(
+            raw_data, start_year=STORE.starting_year, round_precision=1
+        )
+
+        assert np.array_equal(store.raw_years, expected_store.raw_years)
+        assert np.array_equal(store.series, expected_store.series)
+        assert np.array_equal(store.cumulative_sums, expected_store.cumulative_sums)
+        assert np.allclose(
+            store.get_variance(np.arange(len(store.series)), begin_year),
+            expected_store.get_variance(np.arange(len(store.series)), begin_year),
+        )
+
+        with raises(DataFormatError):
+            store.upsert_year(last_year, [1.0])
+
+    @staticmethod
+    def test_upsert_month():
+        store = RainfallStore.from_dataframe(
+            RAINFALL.raw_data, start_year=STORE.starting_year, round_precision=1
+        )
+        first_year = int(store.raw_years[0])
+        yearly_series_index = store.get_series_index()
+        average = store.get_average(yearly_series_index, begin_year, end_year)
+
+        assert store.upsert_month(first_year - 1, Month.MAY, 20.0)
+        assert store.raw_years[0] == first_year - 1
+        assert np.isnan(store.raw_rainfall[0, 0])
+        assert store.get_average(yearly_series_index, begin_year, end_year) == average
+
+        assert not store.upsert_month(end_year, Month.MAY, 0.0)
+        assert store.get_rainfall(
+            store.get_series_index(month=Month.MAY), end_year, end_year
+        ) == [0.0]
+        assert np.isclose(
+            store.get_average(yearly_series_index, begin_year, end_year),
+            store.get_rainfall(yearly_series_index, begin_year, end_year).mean(),
+        )
@@ -0,0 +1,71 @@
+import numpy as np
+from pytest import raises
+
+from bcn_rainfall_core.utils import rolling_statistics as rolling_stats
+from tst.test_rainfall import RAINFALL, begin_year, end_year
+
+STORE = RAINFALL.store
+RAINFALL_INSTANCES = [
+    RAINFALL.yearly_rainfall,
+    *RAINFALL.monthly_rainfalls.values(),
+    *RAINFALL.seasonal_rainfalls.values(),
+]
+
+
+class TestRollingStatistics:
+    @staticmethod
+    def test_get_window_years():
+        window_years = rolling_stats.get_window_years(STORE, 30, begin_year, end_year)
+
+        assert window_years[0] == begin_year
+        assert window_years[-1] == end_year - 29
+        assert len(rolling_stats.get_window_years(STORE, 30)) == len(STORE.years) - 29
+
+    @staticmethod
+    def test_compute_rolling_statistics():
+        window_years, statistics = rolling_stats.compute_rolling_statistics(
+            STORE,
+            [instance.series_index for instance in RAINFALL_INSTANCES],
+            begin_year=begin_year,
+            end_year=end_year,
+        )
+
+        assert set(statistics) == set(rolling_stats.ROLLING_STATISTICS)
+        for idx, instance in enumerate(RAINFALL_INSTANCES):
+            for window_idx in (0, len(window_years) - 1):
+                window_year = int(window_years[window_idx])
+
+                assert statistics[rolling_stats.AVERAGE][
+                    idx, window_idx
+                ] == instance.get_normal(window_year)
+                assert statistics[rolling_stats.STANDARD_DEVIATION][
+                    idx, window_idx
+                ] == instance.get_rainfall_standard_deviation(
+                    window_year, window_year + 29
+                )
+                (_, slope), _ = instance.get_linear_regression(
+                    window_year, window_year + 29
+                )
+                assert np.isclose(
+                    statistics[rolling_stats.LINEAR_REGRESSION_SLOPE][idx, window_idx],
+                    slope,
+                    atol=10**-STORE.round_precision,
+                )
+
+    @staticmethod
+    def test_compute_rolling_statistics_of_single_years():
+        _, statistics = rolling_stats.compute_rolling_statistics(
+            STORE, [0], window=1, begin_year=begin_year, end_year=end_year
+        )
+
+        assert np.array_equal(
+            statistics[rolling_stats.AVERAGE][0],
+            STORE.get_rainfall(0, begin_year, end_year),
+        )
+        assert np.isnan(statistics[rolling_stats.VARIANCE]).all()
+        assert (statistics[rolling_stats.LINEAR_REGRESSION_SLOPE] == 0).all()
+
+    @staticmethod
+    def test_compute_rolling_statistics_fails_because_window_is_not_positive():
+        with raises(ValueError):
+            rolling_stats.compute_rolling_statistics(STORE, [0], window=0)
@@ -0,0 +1,80 @@
+import numpy as np
+from scipy import stats
+
+from bcn_rainfall_core.utils import spi
+from tst.test_rainfall import RAINFALL, normal_year
+
+STORE = RAINFALL.store
+
+
+class TestSPI:
+    @staticmethod
+    def test_compute_accumulated_rainfall():
+        years = spi.get_timeline_years(STORE)
+        accumulated_rainfall = spi.compute_accumulated_rainfall(STORE, (1, 12))
+
+        assert accumulated_rainfall.shape == (2, len(years), 12)
+        assert np.allclose(
+            accumulated_rainfall[0],
+            STORE.raw_rainfall[STORE.start_index :],
+            equal_nan=True,
+        )
+        assert np.isnan(accumulated_rainfall[1, 0, :11]).all()
+
+        # Yearly rainfall counts missing months as null, whereas accumulations are missing.
+        is_complete = ~np.isnan(accumulated_rainfall[1, :, 11])
+        assert np.allclose(
+            accumulated_rainfall[1, is_complete, 11], STORE.series[0, is_complete]
+        )
+
+    @staticmethod
+    def test_fit_gamma_distributions():
+        years = spi.get_timeline_years(STORE)
+        accumulated_rainfall = spi.compute_accumulated_rainfall(STORE, (3,))
+        fits = spi.fit_gamma_distributions(accumulated_rainfall, years, normal_year)
+
+        reference_rainfall = accumulated_rainfall[
+            0, (normal_year <= years) & (years < normal_year + 30), -1
+        ]
+        shape, _, scale = stats.gamma.fit(reference_rainfall, floc=0)
+
+        assert fits.shapes.shape == (1, 12)
+        assert np.isclose(fits.shapes[0, -1], shape, rtol=0.05)
+        assert np.isclose(fits.scale_parameters[0, -1], scale, rtol=0.05)
+        assert fits.null_probabilities[0, -1] == 0.0
+
+    @staticmethod
+    def test_compute_spi():
+        years = spi.get_timeline_years(STORE)
+        accumulated_rainfall = spi.compute_accumulated_rainfall(STORE)
+        fits = spi.fit_gamma_distributions(accumulated_rainfall, years, normal_year)
+        spi_values = spi.compute_spi(accumulated_rainfall, fits)
+
+        reference_spi = spi_values[
+            :, (normal_year <= years) & (years < normal_year + 30)
+        ]
+        assert np.allclose(np.nanmean(reference_spi, axis=1), 0.0, atol=0.25)
+        assert np.nanmax(np.abs(spi_values)) <= spi.SPI_BOUND
+
+    @staticmethod
+    def test_compute_spi_with_null_rainfall():
+        accumulated_rainfall = np.zeros((1, 30, 12))
+        accumulated_rainfall[0, ::2] = np.arange(15)[:, np.newaxis] + 1.0
+        fits = spi.fit_gamma_distributions(
+            accumulated_rainfall, np.arange(2000, 2030), 2000
+        )
+        spi_values = spi.compute_spi(accumulated_rainfall, fits)
+
+        assert np.all(fits.null_probabilities == 0.5)
+        assert np.all(spi_values[0, 1::2] == 0.0)
+        assert np.all(spi_values[0, ::2] > 0.0)
+
+    @staticmethod
+    def test_compute_spi_without_fit():
+        accumulated_rainfall = np.ones((1, 30, 12))
+        fits = spi.fit_gamma_distributions(
+            accumulated_rainfall, np.arange(2000, 2030), 2000
+        )
+
+        assert np.isnan(fits.shapes).all()
+        assert np.isnan(spi.compute_spi(accumulated_rainfall, fits)).all()
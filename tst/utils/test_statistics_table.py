@@ -0,0 +1,61 @@
+from bcn_rainfall_core.utils import statistics_table as stats_table
+from tst.test_rainfall import RAINFALL, begin_year, end_year, normal_year
+
+STORE = RAINFALL.store
+RAINFALL_INSTANCES = [
+    RAINFALL.yearly_rainfall,
+    *RAINFALL.monthly_rainfalls.values(),
+    *RAINFALL.seasonal_rainfalls.values(),
+]
+SERIES_INDEXES = [instance.series_index for instance in RAINFALL_INSTANCES]
+
+
+class TestStatisticsTable:
+    @staticmethod
+    def test_compute_statistics_table():
+        labels = [str(series_index) for series_index in SERIES_INDEXES]
+        table = stats_table.compute_statistics_table(
+            STORE,
+            SERIES_INDEXES,
+            labels,
+            begin_year=begin_year,
+            end_year=end_year,
+            normal_year=normal_year,
+        )
+
+        assert table.index.tolist() == labels
+        for instance, (_, row) in zip(RAINFALL_INSTANCES, table.iterrows()):
+            assert row[stats_table.AVERAGE] == instance.get_average_yearly_rainfall(
+                begin_year, end_year
+            )
+            assert row[stats_table.NORMAL] == instance.get_normal(normal_year)
+            assert row[
+                stats_table.RELATIVE_DISTANCE_TO_NORMAL
+            ] == instance.get_relative_distance_to_normal(
+                normal_year, begin_year, end_year
+            )
+            assert row[
+                stats_table.STANDARD_DEVIATION
+            ] == instance.get_rainfall_standard_deviation(begin_year, end_year)
+            assert row[
+                stats_table.WEIGHTED_STANDARD_DEVIATION
+            ] == instance.get_rainfall_standard_deviation(
+                begin_year, end_year, weigh_by_average=True
+            )
+            assert (
+                row[stats_table.R2_SCORE],
+                row[stats_table.LINEAR_REGRESSION_SLOPE],
+            ) == instance.get_linear_regression(begin_year, end_year)[0]
+
+    @staticmethod
+    def test_compute_statistics_table_without_normal():
+        table = stats_table.compute_statistics_table(
+            STORE,
+            SERIES_INDEXES,
+            [str(series_index) for series_index in SERIES_INDEXES],
+            begin_year=end_year,
+            end_year=begin_year,
+        )
+
+        assert stats_table.NORMAL not in table.columns
+        assert table[stats_table.AVERAGE].isna().all()